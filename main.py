@@ -1,17 +1,43 @@
+import argparse
 import arcade
 import logging
+from omg.assets.content_pack import get_content_pack
+from omg.core.scenario import SCENARIOS
 from omg.core.game_window import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, GameWindow
+from omg.utils.tracing import get_trace_recorder
 
 
 def main():
     """Start the application."""
+    parser = argparse.ArgumentParser(description=SCREEN_TITLE)
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Record the whole session and write a trace file on exit.",
+    )
+    parser.add_argument(
+        "--scenario",
+        choices=sorted(SCENARIOS),
+        help="Generate the entities, the hand-placed layout by default.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s'
     )
-    window = GameWindow(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+    # Compile the assets once, later starts load them pre-decoded
+    get_content_pack(build=True)
+    scenario = None
+    if args.scenario:
+        scenario = SCENARIOS[args.scenario]._replace(seed=args.seed)
+    window = GameWindow(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, scenario)
     window.setup()
+    if args.trace:
+        get_trace_recorder().start()
     arcade.run()
+    if args.trace:
+        logging.info(f"Trace written to {get_trace_recorder().dump(args.trace)}")
 
 
 if __name__ == "__main__":
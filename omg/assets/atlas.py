@@ -0,0 +1,198 @@
+import argparse
+import json
+import logging
+import math
+import os
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import arcade
+import PIL.Image
+
+from omg.assets.content_pack import load_image
+from omg.assets.frames import index_frame_files
+
+ATLAS_IMAGE_FILE = "atlas.png"
+ATLAS_MANIFEST_FILE = "atlas.json"
+
+Rect = Tuple[int, int, int, int]  # x, y, width, height in pixels
+# Textures or rects of the frames keyed by action and direction, sorted by index
+FrameTable = Dict[str, Dict[str, list]]
+
+
+def _pack(sizes: List[Tuple[int, int]]) -> Tuple[List[Rect], Tuple[int, int]]:
+    """Pack the rects with the given sizes into rows of a roughly square image.
+
+    Returns
+    -------
+    Tuple[List[Rect], Tuple[int, int]]
+        Rects of the given sizes in the same order, and the size of the image.
+    """
+    total_area = sum(width * height for width, height in sizes)
+    max_width = max(
+        max(width for width, _ in sizes), math.ceil(math.sqrt(total_area))
+    )
+    rects = [None] * len(sizes)
+    x = y = row_height = 0
+    # Tallest first, so that the rows waste little space
+    for i in sorted(range(len(sizes)), key=lambda i: -sizes[i][1]):
+        width, height = sizes[i]
+        if x + width > max_width:
+            x = 0
+            y += row_height
+            row_height = 0
+        rects[i] = (x, y, width, height)
+        x += width
+        row_height = max(row_height, height)
+    image_width = max(x + width for x, _, width, _ in rects)
+    return rects, (image_width, y + row_height)
+
+
+def _stamp(path: str) -> List[int]:
+    """Return what invalidates a frame file, i.e. its mtime, size and CRC-32."""
+    stat = os.stat(path)
+    with open(path, "rb") as frame_file:
+        crc = zlib.crc32(frame_file.read())
+    return [stat.st_mtime_ns, stat.st_size, crc]
+
+
+def _frame_paths(sprite_dir: str) -> Dict[str, str]:
+    """Return the paths of the frame files keyed by their file names."""
+    return {
+        os.path.basename(path): path
+        for directions in index_frame_files(sprite_dir).values()
+        for paths in directions.values()
+        for path in paths
+    }
+
+
+def is_stale(sprite_dir: str, sources: Dict[str, List[int]]) -> bool:
+    """Return whether a frame file was added, removed or modified since the build.
+
+    Parameters
+    ----------
+    sprite_dir : str
+        Directory of the animation frames.
+    sources : Dict[str, List[int]]
+        Stamps of the frame files in the manifest, keyed by file name.
+    """
+    frame_paths = _frame_paths(sprite_dir)
+    if set(frame_paths) != set(sources):
+        return True
+    for file_name, (mtime_ns, size, crc) in sources.items():
+        stat = os.stat(frame_paths[file_name])
+        if stat.st_size != size:
+            return True
+        # A checkout changes the mtimes, then the contents are compared
+        if stat.st_mtime_ns != mtime_ns and _stamp(frame_paths[file_name])[2] != crc:
+            return True
+    return False
+
+
+def build_atlas(sprite_dir: str) -> str:
+    """Pack the animation frames of a sprite directory into a single image.
+
+    The atlas image and a manifest, which holds the rects of the frames keyed by
+    action, direction and index, are written to the sprite directory. The
+    manifest also stamps the frame files, see `is_stale`.
+
+    Parameters
+    ----------
+    sprite_dir : str
+        Directory of the animation frames of a character.
+
+    Returns
+    -------
+    str
+        Path of the manifest.
+    """
+    frame_files = [
+        (action, direction, path)
+        for action, directions in sorted(index_frame_files(sprite_dir).items())
+        for direction, paths in sorted(directions.items())
+        for path in paths
+    ]
+    if not frame_files:
+        raise ValueError(f"No animation frames found in {sprite_dir}")
+
+    images = [PIL.Image.open(path).convert("RGBA") for _, _, path in frame_files]
+    rects, atlas_size = _pack([image.size for image in images])
+    atlas_image = PIL.Image.new("RGBA", atlas_size, (0, 0, 0, 0))
+    frames: FrameTable = {}
+    for (action, direction, _), image, rect in zip(frame_files, images, rects):
+        atlas_image.paste(image, rect[:2])
+        frames.setdefault(action, {}).setdefault(direction, []).append(list(rect))
+    atlas_image.save(os.path.join(sprite_dir, ATLAS_IMAGE_FILE))
+
+    manifest_path = os.path.join(sprite_dir, ATLAS_MANIFEST_FILE)
+    with open(manifest_path, "w") as manifest_file:
+        json.dump(
+            {
+                "image": ATLAS_IMAGE_FILE,
+                "frames": frames,
+                "sources": {
+                    os.path.basename(path): _stamp(path)
+                    for _, _, path in frame_files
+                },
+            },
+            manifest_file,
+        )
+    return manifest_path
+
+
+@lru_cache(maxsize=None)
+def load_atlas(sprite_dir: str) -> Optional[FrameTable]:
+    """Load the frame textures of a sprite directory from its atlas.
+
+    The atlas image is read and decoded once per directory; the frames are cut
+    out of it in memory.
+
+    Returns
+    -------
+    Optional[FrameTable]
+        Frame textures keyed by action and direction, or None if the directory
+        has no atlas (see `build_atlas`) or if the atlas is older than the frame
+        files, then the frames should be loaded from their files.
+    """
+    manifest_path = os.path.join(sprite_dir, ATLAS_MANIFEST_FILE)
+    if not os.path.isfile(manifest_path):
+        return None
+    with open(manifest_path) as manifest_file:
+        manifest = json.load(manifest_file)
+    if "sources" not in manifest or is_stale(sprite_dir, manifest["sources"]):
+        logging.warning(
+            "Atlas of %s is stale, rebuild it with python -m omg.assets.atlas",
+            sprite_dir,
+        )
+        return None
+
+    image_path = os.path.join(sprite_dir, manifest["image"])
+    atlas_image = load_image(image_path)
+    frames: FrameTable = {}
+    for action, directions in manifest["frames"].items():
+        for direction, rects in directions.items():
+            textures = frames.setdefault(action, {})[direction] = []
+            for x, y, width, height in rects:
+                textures.append(
+                    arcade.Texture(
+                        f"{image_path}-{x}-{y}-{width}-{height}",
+                        atlas_image.crop((x, y, x + width, y + height)),
+                    )
+                )
+    return frames
+
+
+def main():
+    """Build the atlases of the given sprite directories."""
+    parser = argparse.ArgumentParser(
+        description="Pack the animation frames of characters into atlases."
+    )
+    parser.add_argument("sprite_dirs", nargs="+", help="Directories of the frames.")
+    args = parser.parse_args()
+    for sprite_dir in args.sprite_dirs:
+        print(f"Wrote {build_atlas(sprite_dir)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+import argparse
+import copy
+import json
+import mmap
+import os
+import struct
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import arcade
+import PIL.Image
+
+# Root of the paths in a content pack, i.e. the `omg` package
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONTENT_PACK_PATH = os.path.join(PACKAGE_DIR, "assets", "content.pack")
+# Sources of a content pack, relative to the root
+IMAGE_DIRS = ("assets/images",)
+DATA_FILES = ("entities/Elements.JSON", "entities/CraftedSkills.JSON")
+
+# Layout: magic, version, header length, JSON header, aligned RGBA pixel blocks
+MAGIC = b"OMGPACK\0"
+VERSION = 1
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 16
+
+
+def _find_sources(root: str) -> List[str]:
+    """Return the paths of the source files relative to the root, sorted."""
+    sources = list(DATA_FILES)
+    for image_dir in IMAGE_DIRS:
+        for dir_path, _, file_names in os.walk(os.path.join(root, image_dir)):
+            for file_name in file_names:
+                if file_name.lower().endswith(".png"):
+                    path = os.path.join(dir_path, file_name)
+                    sources.append(os.path.relpath(path, root).replace(os.sep, "/"))
+    return sorted(source for source in sources if os.path.isfile(_join(root, source)))
+
+
+def _join(root: str, source: str) -> str:
+    return os.path.join(root, *source.split("/"))
+
+
+def _align(n_bytes: int) -> int:
+    return -(-n_bytes // _ALIGNMENT) * _ALIGNMENT
+
+
+def _stamp(path: str) -> List[int]:
+    """Return what invalidates a source file, i.e. its mtime and size."""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def build_content_pack(
+    pack_path: str = CONTENT_PACK_PATH, root: str = PACKAGE_DIR
+) -> str:
+    """Compile the images and the game data into a single content pack.
+
+    Images are stored as decoded RGBA pixels and the JSON data files as parsed
+    data, so loading them later costs neither a PNG decode nor a JSON parse.
+
+    Parameters
+    ----------
+    pack_path : str
+        Path to write the content pack to.
+    root : str
+        Directory which the source paths are relative to.
+
+    Returns
+    -------
+    str
+        Path of the content pack.
+    """
+    sources = _find_sources(root)
+    header = {"sources": {}, "images": {}, "data": {}}
+    blocks = []
+    for source in sources:
+        path = _join(root, source)
+        header["sources"][source] = _stamp(path)
+        if source.lower().endswith(".png"):
+            with PIL.Image.open(path) as image:
+                image = image.convert("RGBA")
+            header["images"][source] = [None, image.width, image.height]
+            blocks.append((source, image.tobytes()))
+        else:
+            with open(path) as data_file:
+                header["data"][source] = json.load(data_file)
+
+    # Offsets are relative to the aligned end of the header
+    offset = 0
+    for source, block in blocks:
+        header["images"][source][0] = offset
+        offset += _align(len(block))
+    header_bytes = json.dumps(header).encode()
+
+    temp_path = f"{pack_path}.tmp"
+    with open(temp_path, "wb") as pack_file:
+        pack_file.write(_PREAMBLE.pack(MAGIC, VERSION, len(header_bytes)))
+        pack_file.write(header_bytes)
+        blocks_start = _align(_PREAMBLE.size + len(header_bytes))
+        for source, block in blocks:
+            pack_file.seek(blocks_start + header["images"][source][0])
+            pack_file.write(block)
+    # Readers never see a partially written pack
+    os.replace(temp_path, pack_path)
+    return pack_path
+
+
+class ContentPack:
+    """Read-only view of a content pack.
+
+    The file is memory mapped, so only the pixels of the requested images are
+    read from the disk and the images share the memory of the mapping.
+
+    Parameters
+    ----------
+    pack_path : str
+        Path of the content pack, see `build_content_pack`.
+    root : str
+        Directory which the source paths are relative to.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a content pack of the current version.
+    """
+
+    def __init__(self, pack_path: str = CONTENT_PACK_PATH, root: str = PACKAGE_DIR):
+        self.pack_path = pack_path
+        self.root = root
+        with open(pack_path, "rb") as pack_file:
+            self._mmap = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _PREAMBLE.size:
+            self.close()
+            raise ValueError(f"{pack_path} is not a content pack")
+        magic, version, header_length = _PREAMBLE.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{pack_path} is not a content pack of version {VERSION}")
+        header = json.loads(
+            self._mmap[_PREAMBLE.size:_PREAMBLE.size + header_length]
+        )
+        self._sources: Dict[str, List[int]] = header["sources"]
+        self._images: Dict[str, List[int]] = header["images"]
+        self._data: Dict[str, object] = header["data"]
+        self._blocks_start = _align(_PREAMBLE.size + header_length)
+
+    def close(self):
+        """Unmap the file, the images loaded from the pack must be released first."""
+        self._mmap.close()
+
+    def is_stale(self) -> bool:
+        """Return whether a source file was added, removed or modified."""
+        if sorted(self._sources) != _find_sources(self.root):
+            return True
+        return any(
+            _stamp(_join(self.root, source)) != stamp
+            for source, stamp in self._sources.items()
+        )
+
+    def _source(self, path: str) -> str:
+        relative_path = os.path.relpath(os.path.abspath(path), self.root)
+        return relative_path.replace(os.sep, "/")
+
+    def image(self, path: str) -> Optional[PIL.Image.Image]:
+        """Return an image of the pack as RGBA, None if it is not in the pack."""
+        entry = self._images.get(self._source(path))
+        if entry is None:
+            return None
+        offset, width, height = entry
+        start = self._blocks_start + offset
+        pixels = memoryview(self._mmap)[start:start + width * height * 4]
+        return PIL.Image.frombuffer(
+            "RGBA", (width, height), pixels, "raw", "RGBA", 0, 1
+        )
+
+    def data(self, path: str) -> Optional[object]:
+        """Return the parsed data of a JSON file, None if it is not in the pack."""
+        data = self._data.get(self._source(path))
+        # Callers own the returned data, the pack keeps its own copy
+        return copy.deepcopy(data)
+
+
+_content_pack: Optional[ContentPack] = None
+_content_pack_checked = False
+
+
+def get_content_pack(build: bool = False) -> Optional[ContentPack]:
+    """Return the content pack of the game if it is up to date.
+
+    Parameters
+    ----------
+    build : bool
+        Rebuild the pack if it is missing or stale, otherwise None is returned and
+        the assets are loaded from their source files.
+    """
+    global _content_pack, _content_pack_checked
+    if _content_pack is not None or (_content_pack_checked and not build):
+        return _content_pack
+    _content_pack_checked = True
+    try:
+        content_pack = ContentPack()
+        if content_pack.is_stale():
+            content_pack.close()
+            content_pack = None
+    except (OSError, ValueError):
+        content_pack = None
+    if content_pack is None and build:
+        build_content_pack()
+        content_pack = ContentPack()
+    _content_pack = content_pack
+    return content_pack
+
+
+def load_image(path: str) -> PIL.Image.Image:
+    """Load an RGBA image from the content pack or from its file."""
+    content_pack = get_content_pack()
+    image = content_pack.image(path) if content_pack is not None else None
+    if image is None:
+        with PIL.Image.open(path) as image_file:
+            image = image_file.convert("RGBA")
+    return image
+
+
+@lru_cache(maxsize=None)
+def load_texture(path: str) -> arcade.Texture:
+    """Load a texture from the content pack or from its file."""
+    content_pack = get_content_pack()
+    image = content_pack.image(path) if content_pack is not None else None
+    if image is None:
+        # Also resolves arcade's `:resources:` paths
+        return arcade.load_texture(path)
+    return arcade.Texture(path, image)
+
+
+def load_data(path: str) -> object:
+    """Load the data of a JSON file from the content pack or from its file."""
+    content_pack = get_content_pack()
+    data = content_pack.data(path) if content_pack is not None else None
+    if data is None:
+        with open(path) as data_file:
+            data = json.load(data_file)
+    return data
+
+
+def main():
+    """Build the content pack of the game."""
+    parser = argparse.ArgumentParser(
+        description="Compile the images and game data into a content pack."
+    )
+    parser.add_argument("--output", default=CONTENT_PACK_PATH)
+    args = parser.parse_args()
+    print(f"Wrote {build_content_pack(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Tuple
+
+# Frames are named as `{action}_{direction}{index}.png`, e.g. `walk_up3.png`
+FRAME_FILE_PATTERN = re.compile(
+    r"^(?P<action>[a-z]+)_(?P<direction>up|down|left|right)(?P<index>\d+)\.png$"
+)
+
+# Paths of the frames keyed by action and direction, sorted by index
+FrameFiles = Dict[str, Dict[str, Tuple[str, ...]]]
+
+
+@lru_cache(maxsize=None)
+def index_frame_files(sprite_dir: str) -> FrameFiles:
+    """Index the animation frames of a sprite directory.
+
+    The directory is scanned once; every later call with the same directory
+    returns the cached index. Frames are sorted by their number, so `walk_up2.png`
+    comes before `walk_up10.png` regardless of the order of the file system.
+
+    Parameters
+    ----------
+    sprite_dir : str
+        Directory of the animation frames of a character.
+
+    Returns
+    -------
+    FrameFiles
+        Paths of the frames keyed by action and direction.
+    """
+    numbered_files: Dict[str, Dict[str, list]] = {}
+    for file_name in os.listdir(sprite_dir):
+        match = FRAME_FILE_PATTERN.match(file_name)
+        if match is None:
+            continue
+        numbered_files.setdefault(match["action"], {}).setdefault(
+            match["direction"], []
+        ).append((int(match["index"]), os.path.join(sprite_dir, file_name)))
+
+    return {
+        action: {
+            direction: tuple(path for _, path in sorted(files))
+            for direction, files in directions.items()
+        }
+        for action, directions in numbered_files.items()
+    }
@@ -0,0 +1,107 @@
+import queue
+import threading
+import time
+from typing import Callable, Iterable, List, Sequence
+
+import arcade
+
+# A job decodes and returns textures, it runs on the worker thread
+LoadingJob = Callable[[], Iterable[arcade.Texture]]
+
+
+class BackgroundLoader:
+    """Runs loading jobs on a worker thread and uploads their textures in slices.
+
+    The worker thread reads, decodes and parses the assets, which does not need
+    the OpenGL context. Uploading the finished textures to the GPU has to happen
+    on the main thread, so `upload` is called once per frame and stops when its
+    time budget is spent, keeping the window responsive.
+
+    Parameters
+    ----------
+    jobs : Sequence[LoadingJob]
+        Jobs to run, in order.
+    """
+
+    def __init__(self, jobs: Sequence[LoadingJob]):
+        self.jobs = list(jobs)
+        self.n_jobs_done = 0
+        self.n_uploaded = 0
+        self._textures: "queue.Queue[arcade.Texture]" = queue.Queue()
+        self._errors: List[BaseException] = []
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Start running the jobs on the worker thread."""
+        self._thread.start()
+
+    @property
+    def started(self) -> bool:
+        """Define self.started, whether the worker thread was started."""
+        return self._thread.ident is not None
+
+    def _run(self):
+        try:
+            for job in self.jobs:
+                for texture in job():
+                    self._textures.put(texture)
+                self.n_jobs_done += 1
+        except BaseException as error:
+            # Raised again on the main thread by `upload`
+            self._errors.append(error)
+
+    @property
+    def progress(self) -> float:
+        """Define self.progress, the ratio of the finished jobs."""
+        return self.n_jobs_done / len(self.jobs) if self.jobs else 1.0
+
+    @property
+    def done(self) -> bool:
+        """Define self.done, whether every job ran and every texture is uploaded.
+
+        Raises
+        ------
+        BaseException
+            The error which stopped the worker thread, so that a failed loading
+            is never reported as done.
+        """
+        if not self.started or self._thread.is_alive():
+            return False
+        if self._errors:
+            raise self._errors[0]
+        return self._textures.empty()
+
+    def upload(self, time_budget: float, atlas: arcade.TextureAtlas = None) -> int:
+        """Upload the finished textures until the time budget is spent.
+
+        Parameters
+        ----------
+        time_budget : float
+            Time to spend in seconds.
+        atlas : arcade.TextureAtlas, optional
+            Atlas to upload the textures to, nothing is uploaded if None.
+
+        Returns
+        -------
+        int
+            Number of uploaded textures.
+
+        Raises
+        ------
+        BaseException
+            The error which stopped the worker thread.
+        """
+        if self._errors:
+            raise self._errors[0]
+        deadline = time.perf_counter() + time_budget
+        n_uploaded = 0
+        while time.perf_counter() < deadline:
+            try:
+                texture = self._textures.get_nowait()
+            except queue.Empty:
+                break
+            if atlas is not None:
+                atlas.add(texture)
+            n_uploaded += 1
+        self.n_uploaded += n_uploaded
+        return n_uploaded
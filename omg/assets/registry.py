@@ -0,0 +1,122 @@
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import arcade
+
+from omg.assets import content_pack
+
+ASSETS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Paths in the game data are relative to the directory of the `omg` package
+_BASE_DIR = os.path.dirname(os.path.dirname(ASSETS_DIR))
+# Files of the package itself are not assets
+_IGNORED_DIRS = {"__pycache__", "tests"}
+_IGNORED_EXTENSIONS = (".py", ".pyc", ".pack", ".tmp")
+
+
+class AssetRegistry:
+    """Index of the asset files with stable integer ids.
+
+    The asset directory is scanned once. Paths are resolved case-insensitively,
+    so `FireFire.PNG` finds `FireFire.png`. Ids are the positions of the files in
+    the sorted index, so they are stable as long as the files do not change, and
+    textures are cached per id.
+
+    Parameters
+    ----------
+    root : str
+        Directory of the assets.
+    """
+
+    def __init__(self, root: str = ASSETS_DIR):
+        self.root = root
+        paths = []
+        for dir_path, dir_names, file_names in os.walk(root):
+            dir_names[:] = [name for name in dir_names if name not in _IGNORED_DIRS]
+            for file_name in file_names:
+                if file_name.lower().endswith(_IGNORED_EXTENSIONS):
+                    continue
+                path = os.path.relpath(os.path.join(dir_path, file_name), root)
+                paths.append(path.replace(os.sep, "/"))
+        self._paths: List[str] = sorted(paths, key=lambda path: (path.lower(), path))
+        self._ids: Dict[str, int] = {
+            path.lower(): asset_id for asset_id, path in enumerate(self._paths)
+        }
+        self._textures: List[Optional[arcade.Texture]] = [None] * len(self._paths)
+
+    def __len__(self) -> int:
+        """Return the number of indexed assets."""
+        return len(self._paths)
+
+    def _key(self, path: str) -> str:
+        relative_path = os.path.relpath(os.path.abspath(path), self.root)
+        return relative_path.replace(os.sep, "/").lower()
+
+    def find(self, path: str) -> Optional[int]:
+        """Return the id of an asset, None if it is not indexed.
+
+        Parameters
+        ----------
+        path : str
+            Absolute path, or a path relative to the asset directory, to the
+            directory of the `omg` package or to the working directory.
+        """
+        candidates = [path]
+        if not os.path.isabs(path):
+            candidates += [os.path.join(self.root, path), os.path.join(_BASE_DIR, path)]
+        for candidate in candidates:
+            asset_id = self._ids.get(self._key(candidate))
+            if asset_id is not None:
+                return asset_id
+        return None
+
+    def asset_id(self, path: str) -> int:
+        """Return the id of an asset.
+
+        Raises
+        ------
+        KeyError
+            If there is no such asset.
+        """
+        asset_id = self.find(path)
+        if asset_id is None:
+            raise KeyError(f"No asset found at {path}")
+        return asset_id
+
+    def image_ids(self) -> List[int]:
+        """Return the ids of the image assets."""
+        return [
+            asset_id
+            for asset_id, path in enumerate(self._paths)
+            if path.lower().endswith(".png")
+        ]
+
+    def path(self, asset_id: int) -> str:
+        """Return the path of an asset as it is on the disk."""
+        return os.path.join(self.root, *self._paths[asset_id].split("/"))
+
+    def texture(self, asset_id: int) -> arcade.Texture:
+        """Return the texture of an image asset, it is loaded on the first call."""
+        texture = self._textures[asset_id]
+        if texture is None:
+            texture = self._textures[asset_id] = content_pack.load_texture(
+                self.path(asset_id)
+            )
+        return texture
+
+    def load_texture(self, path: str) -> arcade.Texture:
+        """Return the texture of an image given by its path.
+
+        Paths which are not assets, e.g. arcade's `:resources:`, are loaded
+        directly.
+        """
+        asset_id = self.find(path)
+        if asset_id is None:
+            return content_pack.load_texture(path)
+        return self.texture(asset_id)
+
+
+@lru_cache(maxsize=None)
+def get_asset_registry() -> AssetRegistry:
+    """Return the registry of the game assets."""
+    return AssetRegistry()
@@ -0,0 +1,109 @@
+import json
+import os
+import tempfile
+import unittest
+
+import PIL.Image
+
+from omg.assets.atlas import (
+    ATLAS_IMAGE_FILE,
+    ATLAS_MANIFEST_FILE,
+    build_atlas,
+    load_atlas,
+)
+from omg.assets.frames import index_frame_files
+
+# Frames of a single direction are filled with a shade of their index
+FRAME_FILES = {
+    "walk_up0.png": (10, 0, 0, 255),
+    "walk_up1.png": (11, 0, 0, 255),
+    "walk_up10.png": (20, 0, 0, 255),
+    "walk_up2.png": (12, 0, 0, 255),
+    "idle_down0.png": (0, 10, 0, 255),
+}
+
+
+class TestAtlas(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sprite_dir = self.temp_dir.name
+        for file_name, color in FRAME_FILES.items():
+            image = PIL.Image.new("RGBA", (16, 8), color)
+            image.save(os.path.join(self.sprite_dir, file_name))
+        # Files which are not frames are ignored
+        PIL.Image.new("RGBA", (4, 4)).save(os.path.join(self.sprite_dir, "icon.png"))
+        load_atlas.cache_clear()
+        index_frame_files.cache_clear()
+
+    def tearDown(self):
+        load_atlas.cache_clear()
+        index_frame_files.cache_clear()
+        self.temp_dir.cleanup()
+
+    def test_build_atlas(self):
+        manifest_path = build_atlas(self.sprite_dir)
+
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        self.assertEqual(manifest["image"], ATLAS_IMAGE_FILE)
+        self.assertEqual(set(manifest["frames"]), {"walk", "idle"})
+        self.assertEqual(len(manifest["frames"]["walk"]["up"]), 4)
+
+        atlas_image = PIL.Image.open(os.path.join(self.sprite_dir, ATLAS_IMAGE_FILE))
+        x, y, width, height = manifest["frames"]["walk"]["up"][3]
+        self.assertEqual((width, height), (16, 8))
+        # Frames are sorted by their number, not by their file name
+        self.assertEqual(atlas_image.getpixel((x, y)), (20, 0, 0, 255))
+
+    def test_load_atlas(self):
+        build_atlas(self.sprite_dir)
+        frames = load_atlas(self.sprite_dir)
+
+        shades = [texture.image.getpixel((0, 0))[0] for texture in frames["walk"]["up"]]
+        self.assertEqual(shades, [10, 11, 12, 20])
+        self.assertEqual(frames["idle"]["down"][0].image.size, (16, 8))
+        # Atlas is loaded once per directory
+        self.assertIs(load_atlas(self.sprite_dir), frames)
+
+    def test_stale_atlas_is_not_loaded(self):
+        build_atlas(self.sprite_dir)
+        # Same size, only the contents change
+        frame_path = os.path.join(self.sprite_dir, "walk_up1.png")
+        PIL.Image.new("RGBA", (16, 8), (99, 0, 0, 255)).save(frame_path)
+
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(load_atlas(self.sprite_dir))
+
+    def test_atlas_is_stale_when_frames_are_added(self):
+        build_atlas(self.sprite_dir)
+        frame_path = os.path.join(self.sprite_dir, "walk_up3.png")
+        PIL.Image.new("RGBA", (16, 8)).save(frame_path)
+        index_frame_files.cache_clear()
+
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(load_atlas(self.sprite_dir))
+
+    def test_touched_frames_do_not_make_the_atlas_stale(self):
+        build_atlas(self.sprite_dir)
+        # E.g. a checkout writes the same contents with a new mtime
+        frame_path = os.path.join(self.sprite_dir, "walk_up1.png")
+        stat = os.stat(frame_path)
+        os.utime(frame_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.assertIsNotNone(load_atlas(self.sprite_dir))
+
+    def test_load_atlas_without_manifest(self):
+        self.assertFalse(
+            os.path.exists(os.path.join(self.sprite_dir, ATLAS_MANIFEST_FILE))
+        )
+        self.assertIsNone(load_atlas(self.sprite_dir))
+
+    def test_build_atlas_without_frames(self):
+        with tempfile.TemporaryDirectory() as empty_dir:
+            with self.assertRaises(ValueError):
+                build_atlas(empty_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
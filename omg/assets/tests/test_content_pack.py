@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import unittest
+
+import PIL.Image
+
+from omg.assets.content_pack import (
+    MAGIC,
+    ContentPack,
+    build_content_pack,
+)
+
+
+class TestContentPack(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        image_dir = os.path.join(self.root, "assets", "images", "skills")
+        os.makedirs(image_dir)
+        self.image_path = os.path.join(image_dir, "Fire.PNG")
+        PIL.Image.new("RGB", (3, 2), (255, 0, 0)).save(self.image_path)
+        self.other_image_path = os.path.join(image_dir, "ice.png")
+        PIL.Image.new("RGBA", (5, 7), (0, 0, 255, 128)).save(self.other_image_path)
+
+        entities_dir = os.path.join(self.root, "entities")
+        os.makedirs(entities_dir)
+        self.data_path = os.path.join(entities_dir, "Elements.JSON")
+        with open(self.data_path, "w") as data_file:
+            json.dump({"FIRE": {"name": "Fire"}}, data_file)
+
+        self.pack_path = os.path.join(self.root, "content.pack")
+        build_content_pack(self.pack_path, self.root)
+        self.content_pack = ContentPack(self.pack_path, self.root)
+
+    def tearDown(self):
+        self.content_pack.close()
+        self.temp_dir.cleanup()
+
+    def test_images_are_decoded(self):
+        image = self.content_pack.image(self.image_path)
+        self.assertEqual(image.mode, "RGBA")
+        self.assertEqual(image.size, (3, 2))
+        self.assertEqual(image.getpixel((2, 1)), (255, 0, 0, 255))
+
+        other_image = self.content_pack.image(self.other_image_path)
+        self.assertEqual(other_image.size, (5, 7))
+        self.assertEqual(other_image.getpixel((4, 6)), (0, 0, 255, 128))
+        del image, other_image  # Release the mapped memory before closing
+
+    def test_missing_entries(self):
+        self.assertIsNone(self.content_pack.image(":resources:images/items/star.png"))
+        self.assertIsNone(self.content_pack.data(self.image_path + ".JSON"))
+
+    def test_data(self):
+        data = self.content_pack.data(self.data_path)
+        self.assertEqual(data, {"FIRE": {"name": "Fire"}})
+        # Changes of the caller do not leak into the pack
+        data["FIRE"]["name"] = "Ice"
+        self.assertEqual(self.content_pack.data(self.data_path)["FIRE"]["name"], "Fire")
+
+    def test_is_stale(self):
+        self.assertFalse(self.content_pack.is_stale())
+
+        stat = os.stat(self.image_path)
+        os.utime(self.image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertTrue(self.content_pack.is_stale())
+
+    def test_added_source_makes_pack_stale(self):
+        new_image_path = os.path.join(os.path.dirname(self.image_path), "new.png")
+        PIL.Image.new("RGBA", (1, 1)).save(new_image_path)
+        self.assertTrue(self.content_pack.is_stale())
+
+    def test_not_a_content_pack(self):
+        with open(self.pack_path, "r+b") as pack_file:
+            pack_file.write(b"X" * len(MAGIC))
+        with self.assertRaises(ValueError):
+            ContentPack(self.pack_path, self.root)
+
+
+if __name__ == "__main__":
+    unittest.main()
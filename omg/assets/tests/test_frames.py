@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from omg.assets.frames import index_frame_files
+
+FILE_NAMES = [
+    "shoot_up11.png",
+    "shoot_up1.png",
+    "shoot_up2.png",
+    "shoot_up0.png",
+    "shoot_down0.png",
+    "backslash_up0.png",
+    "idle_left0.png",
+    "atlas.png",
+    "shoot_up.png",
+    "notes.txt",
+]
+
+
+class TestIndexFrameFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sprite_dir = self.temp_dir.name
+        for file_name in FILE_NAMES:
+            open(os.path.join(self.sprite_dir, file_name), "w").close()
+        index_frame_files.cache_clear()
+
+    def tearDown(self):
+        index_frame_files.cache_clear()
+        self.temp_dir.cleanup()
+
+    def test_frames_are_sorted_by_number(self):
+        frame_files = index_frame_files(self.sprite_dir)
+
+        file_names = [os.path.basename(path) for path in frame_files["shoot"]["up"]]
+        self.assertEqual(
+            file_names,
+            ["shoot_up0.png", "shoot_up1.png", "shoot_up2.png", "shoot_up11.png"],
+        )
+
+    def test_only_frames_are_indexed(self):
+        frame_files = index_frame_files(self.sprite_dir)
+
+        self.assertEqual(set(frame_files), {"shoot", "backslash", "idle"})
+        self.assertEqual(set(frame_files["shoot"]), {"up", "down"})
+        self.assertEqual(len(frame_files["idle"]["left"]), 1)
+
+    def test_directory_is_scanned_once(self):
+        with patch("os.listdir", wraps=os.listdir) as listdir:
+            first = index_frame_files(self.sprite_dir)
+            second = index_frame_files(self.sprite_dir)
+        listdir.assert_called_once_with(self.sprite_dir)
+        self.assertIs(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
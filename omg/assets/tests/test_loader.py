@@ -0,0 +1,99 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from omg.assets.loader import BackgroundLoader
+
+
+def wait_for_worker(loader):
+    loader._thread.join(timeout=5)
+
+
+class TestBackgroundLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.textures = [MagicMock(name=f"texture_{i}") for i in range(4)]
+        self.jobs = [lambda: iter(self.textures[:3]), lambda: iter(self.textures[3:])]
+        self.atlas = MagicMock()
+
+    def test_jobs_run_on_worker_thread(self):
+        threads = []
+
+        def job():
+            threads.append(threading.current_thread())
+            return []
+
+        loader = BackgroundLoader([job])
+        loader.start()
+        wait_for_worker(loader)
+
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    def test_upload(self):
+        loader = BackgroundLoader(self.jobs)
+        self.assertFalse(loader.started)
+        self.assertFalse(loader.done)
+        self.assertEqual(loader.progress, 0)
+
+        loader.start()
+        wait_for_worker(loader)
+        self.assertEqual(loader.progress, 1)
+        self.assertFalse(loader.done)
+
+        self.assertEqual(loader.upload(1.0, self.atlas), 4)
+        self.assertTrue(loader.done)
+        self.assertEqual(loader.n_uploaded, 4)
+        uploaded = [call.args[0] for call in self.atlas.add.call_args_list]
+        self.assertEqual(uploaded, self.textures)
+
+    def test_upload_stops_when_budget_is_spent(self):
+        loader = BackgroundLoader(self.jobs)
+        loader.start()
+        wait_for_worker(loader)
+
+        self.assertEqual(loader.upload(0, self.atlas), 0)
+        self.atlas.add.assert_not_called()
+        self.assertFalse(loader.done)
+
+    def test_worker_error_is_raised_on_upload(self):
+        def job():
+            raise FileNotFoundError("missing.png")
+
+        loader = BackgroundLoader([job])
+        loader.start()
+        wait_for_worker(loader)
+
+        with self.assertRaises(FileNotFoundError):
+            loader.upload(1.0, self.atlas)
+
+    def test_worker_error_after_the_last_upload_is_raised_by_done(self):
+        last_item = threading.Event()
+
+        def job():
+            yield from self.textures
+            # Fails on the last item, after the queue was drained
+            last_item.wait(timeout=5)
+            raise OSError("corrupt.png")
+
+        loader = BackgroundLoader([job])
+        loader.start()
+        while loader.n_uploaded < len(self.textures):
+            loader.upload(1.0, self.atlas)
+        self.assertFalse(loader.done)
+        last_item.set()
+        wait_for_worker(loader)
+
+        with self.assertRaises(OSError):
+            loader.done
+
+    def test_no_jobs(self):
+        loader = BackgroundLoader([])
+        self.assertEqual(loader.progress, 1)
+        loader.start()
+        wait_for_worker(loader)
+        self.assertTrue(loader.done)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+
+import PIL.Image
+
+from omg.assets.registry import AssetRegistry, get_asset_registry
+from omg.entities.projectile import get_crafted_skills
+from omg.entities.tests import TEST_IMAGE_FILE
+
+
+class TestAssetRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        os.makedirs(os.path.join(self.root, "images", "skills"))
+        os.makedirs(os.path.join(self.root, "tests"))
+        self.image_path = os.path.join(self.root, "images", "skills", "FireFire.png")
+        PIL.Image.new("RGBA", (4, 4), (255, 0, 0, 255)).save(self.image_path)
+        PIL.Image.new("RGBA", (2, 2)).save(os.path.join(self.root, "images", "D.PNG"))
+        open(os.path.join(self.root, "tests", "test_data.png"), "w").close()
+        open(os.path.join(self.root, "__init__.py"), "w").close()
+        self.registry = AssetRegistry(self.root)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_index(self):
+        self.assertEqual(len(self.registry), 2)
+        first_path = os.path.join(self.root, "images", "D.PNG")
+        self.assertEqual(self.registry.path(0), first_path)
+
+    def test_resolve_case_insensitively(self):
+        asset_id = self.registry.asset_id(self.image_path)
+        upper_case_path = os.path.join(self.root, "IMAGES", "skills", "FIREFIRE.PNG")
+        self.assertEqual(self.registry.find(upper_case_path), asset_id)
+        self.assertEqual(self.registry.find("images/skills/FireFire.PNG"), asset_id)
+        self.assertEqual(self.registry.path(asset_id), self.image_path)
+
+    def test_unknown_asset(self):
+        self.assertIsNone(self.registry.find("images/missing.png"))
+        with self.assertRaises(KeyError):
+            self.registry.asset_id("images/missing.png")
+
+    def test_ids_are_stable(self):
+        other_registry = AssetRegistry(self.root)
+        asset_id = self.registry.asset_id(self.image_path)
+        self.assertEqual(other_registry.asset_id(self.image_path), asset_id)
+
+    def test_textures_are_cached(self):
+        asset_id = self.registry.asset_id(self.image_path)
+        texture = self.registry.texture(asset_id)
+        self.assertEqual(texture.image.size, (4, 4))
+        self.assertIs(self.registry.load_texture("images/skills/FIREFIRE.png"), texture)
+
+    def test_load_texture_outside_assets(self):
+        self.assertIsNotNone(self.registry.load_texture(TEST_IMAGE_FILE))
+
+
+class TestGameAssets(unittest.TestCase):
+
+    def test_skill_images_are_found(self):
+        # Skill images in the game data differ in case from the files
+        registry = get_asset_registry()
+        for skill in get_crafted_skills().values():
+            image_file = skill["image_file"]
+            self.assertIsNotNone(registry.find(image_file), image_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+TICK_RATE = 60  # Simulation ticks per second
+FIXED_DELTA_TIME = 1 / TICK_RATE  # Duration of a single tick in seconds
+MAX_STEPS_PER_FRAME = 5  # Catch-up limit of a single frame
+MAX_FRAME_TIME = 0.25  # Longer frames are clamped, e.g. after a window drag
+
+
+class FixedTimestep:
+    """Accumulator which converts variable frame times to fixed simulation ticks.
+
+    The simulation is always stepped with the same delta time, so that its results
+    do not depend on the frame rate. Rendering can use `alpha` to interpolate
+    between the last two simulated states.
+
+    Two guards keep the cost of a frame bounded when frames spike (the spiral of
+    death): the frame time is clamped to `max_frame_time`, and at most
+    `max_steps` ticks are run per frame. Time which cannot be caught up with is
+    dropped, i.e. the game slows down instead of freezing.
+
+    Attributes
+    ----------
+    step : float
+        Duration of a single tick in seconds.
+    accumulator : float
+        Frame time which is not simulated yet, always less than `step` after
+        `advance` returns.
+    dropped_time : float
+        Total time dropped by the guards.
+    """
+
+    def __init__(
+        self,
+        step: float = FIXED_DELTA_TIME,
+        max_steps: int = MAX_STEPS_PER_FRAME,
+        max_frame_time: float = MAX_FRAME_TIME,
+    ):
+        self.step = step
+        self.max_steps = max_steps
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
+
+    def advance(self, delta_time: float) -> int:
+        """Add the frame time and return the number of ticks to simulate.
+
+        Parameters
+        ----------
+        delta_time : float
+            Time passed since the previous frame in seconds.
+        """
+        if delta_time > self.max_frame_time:
+            self.dropped_time += delta_time - self.max_frame_time
+            delta_time = self.max_frame_time
+        self.accumulator += delta_time
+
+        n_steps = min(int(self.accumulator / self.step), self.max_steps)
+        self.accumulator -= n_steps * self.step
+        if self.accumulator >= self.step:
+            # Catch-up limit is reached, keep only the partial tick
+            excess = self.accumulator - self.accumulator % self.step
+            self.dropped_time += excess
+            self.accumulator -= excess
+        return n_steps
+
+    @property
+    def alpha(self) -> float:
+        """Define self.alpha, the progress in [0, 1) towards the next tick."""
+        return self.accumulator / self.step
+
+    def reset(self):
+        """Drop the accumulated time, e.g. when the game is resumed."""
+        self.accumulator = 0.0
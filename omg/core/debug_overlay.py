@@ -0,0 +1,118 @@
+import time
+from typing import Dict, List, Tuple
+
+import arcade
+
+from omg.utils.profiler import FrameProfiler
+
+REFRESH_INTERVAL = 0.25  # Time between the updates of the texts in seconds
+LINE_HEIGHT = 18
+# Monospace, so the columns of the phase timings line up
+FONT_NAME = ("Courier New", "Courier", "monospace")
+
+
+class DebugOverlay:
+    """Debug information drawn over the game, toggled with F1.
+
+    Shows the positions of the mouse and the player, the entity counts and the
+    rolling p50/p95/p99 durations of the phases timed by a `FrameProfiler`.
+
+    Every line is a cached `arcade.Text`. Laying out a text is expensive, so the
+    contents are only changed every `refresh_interval` seconds.
+
+    Parameters
+    ----------
+    profiler : FrameProfiler
+        Profiler of the game loop.
+    window_width, window_height : int
+        Size of the window, the overlay is drawn at its top right.
+    refresh_interval : float
+        Time between the updates of the texts in seconds.
+    """
+
+    def __init__(
+        self,
+        profiler: FrameProfiler,
+        window_width: int,
+        window_height: int,
+        refresh_interval: float = REFRESH_INTERVAL,
+    ):
+        self.profiler = profiler
+        self.refresh_interval = refresh_interval
+        self._x = window_width - 400
+        self._top = window_height - 80
+        self._title = arcade.Text(
+            "Debug mode",
+            window_width - 250,
+            window_height - 50,
+            arcade.color.RED,
+            font_size=20,
+        )
+        self._texts: List[arcade.Text] = []
+        self._n_lines = 0
+        self._refreshed_at: float = None
+
+    def update(
+        self,
+        mouse: Tuple[float, float],
+        player: Tuple[float, float],
+        entity_counts: Dict[str, int],
+    ):
+        """Update the texts if the refresh interval has passed.
+
+        Parameters
+        ----------
+        mouse : Tuple[float, float]
+            Mouse position in the window.
+        player : Tuple[float, float]
+            Player position in the world.
+        entity_counts : Dict[str, int]
+            Number of entities per kind, e.g. {"projectiles": 12}.
+        """
+        now = time.perf_counter()
+        refreshed = self._refreshed_at is not None
+        if refreshed and now - self._refreshed_at < self.refresh_interval:
+            return
+        self._refreshed_at = now
+        self._set_lines(self._format_lines(mouse, player, entity_counts))
+
+    def _format_lines(
+        self,
+        mouse: Tuple[float, float],
+        player: Tuple[float, float],
+        entity_counts: Dict[str, int],
+    ) -> List[str]:
+        lines = [
+            f"Mouse: ({mouse[0]:.0f}, {mouse[1]:.0f})",
+            f"Player: ({player[0]:.1f}, {player[1]:.1f})",
+            ", ".join(f"{kind}: {count}" for kind, count in entity_counts.items()),
+            f"{'phase [ms]':<24}{'p50':>7}{'p95':>7}{'p99':>7}",
+        ]
+        for phase, percentiles in self.profiler.percentiles().items():
+            lines.append(
+                f"{phase:<24}" + "".join(f"{1000 * p:7.2f}" for p in percentiles)
+            )
+        return lines
+
+    def _set_lines(self, lines: List[str]):
+        for i in range(len(self._texts), len(lines)):
+            self._texts.append(
+                arcade.Text(
+                    "",
+                    self._x,
+                    self._top - i * LINE_HEIGHT,
+                    arcade.color.WHITE,
+                    font_size=12,
+                    font_name=FONT_NAME,
+                )
+            )
+        for text, line in zip(self._texts, lines):
+            if text.text != line:
+                text.text = line
+        self._n_lines = len(lines)
+
+    def draw(self):
+        """Draw the overlay."""
+        self._title.draw()
+        for text in self._texts[: self._n_lines]:
+            text.draw()
@@ -4,30 +4,56 @@ from typing import Dict
 import arcade
 import arcade.key
 
+from omg.core.scenario import Scenario
 from omg.core.views import (
     GameView,
+    LoadingView,
     PauseView,
     SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE
 )
 
 
 class GameWindow(arcade.Window):
-    """Main game window."""
+    """Main game window.
+
+    Parameters
+    ----------
+    width, height : int
+        Size of the window.
+    title : str
+        Title of the window.
+    scenario : Scenario, optional
+        Scenario the world is generated from, the hand-placed layout by default.
+    """
 
     GAME_VIEW_KEY = "game"
     PAUSE_VIEW_KEY = "pause"
+    LOADING_VIEW_KEY = "loading"
 
-    def __init__(self, width: int, height: int, title: str):
+    def __init__(
+        self, width: int, height: int, title: str, scenario: Scenario = None
+    ):
         super().__init__(width, height, title)
+        self.scenario = scenario
         self._views: Dict[str, arcade.View] = None
 
     def setup(self):
         """Setup the game."""
         self._views: Dict[str, arcade.View] = {}
-        self._views[self.GAME_VIEW_KEY] = GameView(window=self)
+        self._views[self.GAME_VIEW_KEY] = GameView(
+            window=self, scenario=self.scenario
+        )
         self._views[self.PAUSE_VIEW_KEY] = PauseView(window=self)
+        self._views[self.LOADING_VIEW_KEY] = LoadingView(
+            window=self, on_loaded=self._on_loaded
+        )
         self._view_state = True  # Binary state to track the active state
 
+        # The game view is set up after its assets are loaded
+        self.show_view(self._loading_view)
+
+    def _on_loaded(self):
+        """Set up and show the game view once the assets are loaded."""
         self._game_view.setup()
         self.show_view(self._game_view)
 
@@ -41,9 +67,17 @@ class GameWindow(arcade.Window):
         """Define self._pause_view which always refers to a View in self._views."""
         return self._views.get(self.PAUSE_VIEW_KEY, None)
 
+    @property
+    def _loading_view(self) -> LoadingView:
+        """Define self._loading_view which always refers to a View in self._views."""
+        return self._views.get(self.LOADING_VIEW_KEY, None)
+
     def on_key_press(self, key, modifiers):
         """Key press logic."""
-        if key == arcade.key.ESCAPE:
+        if key == arcade.key.ESCAPE and self.current_view in (
+            self._game_view,
+            self._pause_view,
+        ):
             # NOTE: This logic needs a refactor when the number of views exceeds
             # 2.
             self._view_state = not self._view_state
@@ -0,0 +1,163 @@
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import arcade
+import PIL.Image
+import PIL.ImageDraw
+
+from omg.assets.registry import get_asset_registry
+
+SELECTION_OUTLINE_COLOR = arcade.color.RED
+SELECTION_OUTLINE_WIDTH = 3
+SKILL_SLOT_SCALE = 0.4
+CRAFTED_SKILL_SCALE = 0.3
+
+
+def make_outline_texture(size: int, color, border_width: int) -> arcade.Texture:
+    """Create a square texture with a transparent inside and a colored border."""
+    image = PIL.Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    PIL.ImageDraw.Draw(image).rectangle(
+        (0, 0, size - 1, size - 1), outline=tuple(color), width=border_width
+    )
+    return arcade.Texture(
+        f"hud_outline_{size}_{tuple(color)}_{border_width}",
+        image,
+        hit_box_algorithm=None,
+    )
+
+
+class Hud:
+    """Retained-mode heads-up display.
+
+    All HUD sprites live in a single sprite list which is drawn with one call.
+    Sprites and textures are only changed by the event handlers, i.e. when the
+    state they show changes, so a steady frame does not load any textures or
+    build any lists.
+
+    Parameters
+    ----------
+    window_height : int
+        Height of the window, the element icons are aligned to its top.
+    icon_size : int
+        Edge length of an element icon in pixels.
+    icon_margin_x, icon_margin_y : int
+        Distance of the element icons to each other and to the top of the window.
+    skill_slot_image_files : Sequence[str]
+        Backgrounds of the crafted skill slots, drawn to the bottom left corner.
+    skill_image_files : Dict[str, str]
+        Icons of the crafted skills keyed by the skill name.
+    """
+
+    def __init__(
+        self,
+        window_height: int,
+        icon_size: int = 64,
+        icon_margin_x: int = 10,
+        icon_margin_y: int = 75,
+        skill_slot_image_files: Sequence[str] = (),
+        skill_image_files: Dict[str, str] = None,
+    ):
+        self.window_height = window_height
+        self.icon_size = icon_size
+        self.icon_margin_x = icon_margin_x
+        self.icon_margin_y = icon_margin_y
+
+        self.sprite_list = arcade.SpriteList()
+        self._registry = get_asset_registry()
+        self._textures: Dict[str, arcade.Texture] = {}
+        # Icons are resolved once, crafting a skill only looks up its id
+        self._skill_texture_ids: Dict[str, Optional[int]] = {
+            skill_name: self._registry.find(image_file)
+            for skill_name, image_file in (skill_image_files or {}).items()
+        }
+        self._element_icons: List[arcade.Sprite] = []
+        self._selected_index = 0
+
+        # Outline is drawn below the icons
+        self._selection_outline = arcade.Sprite(
+            texture=make_outline_texture(
+                icon_size, SELECTION_OUTLINE_COLOR, SELECTION_OUTLINE_WIDTH
+            )
+        )
+        self._selection_outline.visible = False
+        self.sprite_list.append(self._selection_outline)
+
+        # Crafted skill icons are drawn below the skill slot backgrounds
+        self._skill_slots: List[arcade.Sprite] = [
+            arcade.Sprite(texture=self._get_texture(image_file), scale=SKILL_SLOT_SCALE)
+            for image_file in skill_slot_image_files
+        ]
+        self._crafted_skill_icons: List[arcade.Sprite] = []
+        for i, skill_slot in enumerate(self._skill_slots):
+            skill_slot.center_x = skill_slot.width // 2 + i * skill_slot.width
+            skill_slot.center_y = skill_slot.height // 2
+            # Placeholder texture until a skill is crafted
+            crafted_skill_icon = arcade.Sprite(texture=skill_slot.texture)
+            crafted_skill_icon.visible = False
+            self._crafted_skill_icons.append(crafted_skill_icon)
+        self.sprite_list.extend(self._crafted_skill_icons)
+        self.sprite_list.extend(self._skill_slots)
+
+    def _get_texture(self, image_file: str) -> arcade.Texture:
+        texture = self._textures.get(image_file)
+        if texture is None:
+            texture = self._registry.load_texture(image_file)
+            self._textures[image_file] = texture
+        return texture
+
+    def _element_icon_center(self, index: int):
+        x = self.icon_margin_x + index * (self.icon_size + self.icon_margin_x)
+        y = self.window_height - self.icon_margin_y
+        return x + self.icon_size // 2, y + self.icon_size // 2
+
+    def update_element_icons(self, elements: Iterable[dict], current_index: int):
+        """Show the icons of the given elements and select the current one."""
+        for i, element in enumerate(elements):
+            texture = self._get_texture(element["image_file"])
+            if i == len(self._element_icons):
+                icon = arcade.Sprite(texture=texture)
+                self._element_icons.append(icon)
+                self.sprite_list.append(icon)
+            icon = self._element_icons[i]
+            icon.texture = texture
+            icon.width = self.icon_size
+            icon.height = self.icon_size
+            icon.position = self._element_icon_center(i)
+        self.select_element(current_index)
+
+    def select_element(self, index: int):
+        """Move the selection outline to the icon at the given index."""
+        self._selected_index = index
+        if index >= len(self._element_icons):
+            self._selection_outline.visible = False
+            return
+        self._selection_outline.visible = True
+        self._selection_outline.position = self._element_icon_center(index)
+
+    def resize(self, window_height: int):
+        """Align the element icons to the top of a resized window.
+
+        Skill slots are aligned to the bottom left corner, so they stay in place.
+        """
+        self.window_height = window_height
+        for i, icon in enumerate(self._element_icons):
+            icon.position = self._element_icon_center(i)
+        self.select_element(self._selected_index)
+
+    def update_crafted_skills(self, crafted_skill_slots: Sequence[str]):
+        """Show the icons of the crafted skills in the skill slots."""
+        for icon, skill_name in zip(self._crafted_skill_icons, crafted_skill_slots):
+            texture_id = self._skill_texture_ids.get(skill_name)
+            if texture_id is None:
+                icon.visible = False
+                continue
+            icon.texture = self._registry.texture(texture_id)
+            icon.scale = CRAFTED_SKILL_SCALE
+            icon.visible = True
+        # Icons are aligned next to each other, just like the slots
+        for i, icon in enumerate(self._crafted_skill_icons):
+            icon.center_x = icon.width // 2 + i * icon.width
+            icon.center_y = icon.height // 2
+
+    def draw(self):
+        """Draw the HUD."""
+        self.sprite_list.draw()
@@ -0,0 +1,135 @@
+import math
+import random
+from typing import List, NamedTuple, Tuple
+
+from omg.entities.elements import get_elements
+from omg.entities.emitter import ProjectileEmitter
+from omg.entities.projectile import get_crafted_skills
+
+# Densities are given per square of this side, i.e. a little more than a screen
+DENSITY_AREA_SIDE = 1000
+PLAYER_SPAWN = (100, 100)
+
+
+class Layout(NamedTuple):
+    """Entities a world is populated with."""
+
+    obstacles: List[Tuple[float, float, float]]  # x, y, health
+    pickupables: List[Tuple[float, float, str]]  # x, y, name of the element
+    emitters: List[ProjectileEmitter]
+
+
+def default_layout() -> Layout:
+    """Return the hand-placed layout of the game."""
+    return Layout(
+        obstacles=[(400, 300, 50)],
+        pickupables=[(150, 10, "FIRE"), (250, 20, "ICE"), (250, 120, "FIRE")],
+        emitters=[],
+    )
+
+
+class Scenario(NamedTuple):
+    """Settings of a generated layout.
+
+    The same scenario always generates the same layout. Densities are the average
+    numbers of entities in a `DENSITY_AREA_SIDE` by `DENSITY_AREA_SIDE` square.
+    """
+
+    seed: int = 0
+    obstacle_density: float = 1.0
+    pickupable_density: float = 1.0
+    emitter_density: float = 0.1
+    obstacle_health: float = 50
+    emitter_interval: float = 0.5  # Time between two shots of an emitter
+    spawn_clearance: float = 200  # Radius around the player spawn kept free
+
+    def validate(self, bounds: float):
+        """Check that a layout can be generated in a world.
+
+        Parameters
+        ----------
+        bounds : float
+            The world is the square of [-bounds, bounds].
+
+        Raises
+        ------
+        ValueError
+            If the emitter interval is not positive, or if the spawn clearance
+            does not fit into the world. Otherwise the emitters would shoot or
+            the entities would be placed endlessly.
+        """
+        if not self.emitter_interval > 0:
+            raise ValueError(
+                f"emitter_interval must be positive, got {self.emitter_interval}"
+            )
+        # Keeps the whole clearance inside the world, so that at least a fifth of
+        # the world is free and the positions are found after a few attempts
+        max_clearance = bounds - max(abs(coordinate) for coordinate in PLAYER_SPAWN)
+        if self.spawn_clearance >= max_clearance:
+            raise ValueError(
+                f"spawn_clearance must be less than {max_clearance}, got "
+                f"{self.spawn_clearance}"
+            )
+
+
+SCENARIOS = {
+    "sparse": Scenario(),
+    "dense": Scenario(obstacle_density=10, pickupable_density=10, emitter_density=1),
+    "stress": Scenario(
+        obstacle_density=25, pickupable_density=25, emitter_density=2.5
+    ),
+}
+
+
+def generate_layout(scenario: Scenario, bounds: float) -> Layout:
+    """Scatter the entities of a scenario uniformly over a world.
+
+    Parameters
+    ----------
+    scenario : Scenario
+        Densities and seed of the layout.
+    bounds : float
+        The world is the square of [-bounds, bounds].
+
+    Raises
+    ------
+    ValueError
+        If the scenario is not valid in the world, see `Scenario.validate`.
+    """
+    scenario.validate(bounds)
+    rng = random.Random(scenario.seed)
+    n_squares = (2 * bounds / DENSITY_AREA_SIDE) ** 2
+
+    def positions(density: float) -> List[Tuple[float, float]]:
+        result = []
+        while len(result) < round(density * n_squares):
+            x = rng.uniform(-bounds, bounds)
+            y = rng.uniform(-bounds, bounds)
+            spawn_x, spawn_y = PLAYER_SPAWN
+            if math.hypot(x - spawn_x, y - spawn_y) >= scenario.spawn_clearance:
+                result.append((x, y))
+        return result
+
+    element_names = sorted(get_elements())
+    skill_names = sorted(get_crafted_skills())
+    return Layout(
+        obstacles=[
+            (x, y, scenario.obstacle_health)
+            for x, y in positions(scenario.obstacle_density)
+        ],
+        pickupables=[
+            (x, y, rng.choice(element_names))
+            for x, y in positions(scenario.pickupable_density)
+        ],
+        emitters=[
+            ProjectileEmitter(
+                x,
+                y,
+                rng.choice(skill_names),
+                interval=scenario.emitter_interval,
+                angle=rng.uniform(0, 360),
+                turn_angle=rng.uniform(-45, 45),
+            )
+            for x, y in positions(scenario.emitter_density)
+        ],
+    )
@@ -0,0 +1,132 @@
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+import arcade
+
+from omg.structural.sprite_list import BatchSpriteList
+
+
+class StatusBar(NamedTuple):
+    """Appearance of a bar which shows a value of its owner, e.g. the health.
+
+    The bar is only shown for the owners which have the `value_attribute`.
+    """
+
+    value_attribute: str
+    max_value_attribute: str
+    offset_y: float  # Distance to the top of the owner
+    background_color: arcade.Color
+    foreground_color: arcade.Color
+
+
+HEALTH_BAR = StatusBar(
+    "current_health", "max_health", 10, arcade.color.RED, arcade.color.GREEN
+)
+MANA_BAR = StatusBar(
+    "current_mana", "max_mana", 2, arcade.color.DARK_BLUE, arcade.color.LIGHT_BLUE
+)
+
+
+class StatusBars:
+    """Batched status bars of the entities, drawn with a single call.
+
+    Every bar is a background and a foreground sprite in one sprite list. The
+    bars are not synchronised with their owners every frame. Owners are added
+    when they spawn and removed when they die, and an owner which moved or whose
+    shown values changed is passed to `mark_changed`. So `update` only costs the
+    changed owners, however many owners have bars.
+
+    Parameters
+    ----------
+    bar_width, bar_height : int
+        Size of a full bar in pixels.
+    bars : Iterable[StatusBar]
+        Bars to show above the owners.
+    """
+
+    def __init__(
+        self,
+        bar_width: int = 50,
+        bar_height: int = 5,
+        bars: Iterable[StatusBar] = (HEALTH_BAR, MANA_BAR),
+    ):
+        self.bar_width = bar_width
+        self.bar_height = bar_height
+        self.bars = tuple(bars)
+        self.sprite_list = BatchSpriteList()
+        self._owner_bars: Dict[
+            arcade.Sprite, List[Tuple[StatusBar, arcade.Sprite, arcade.Sprite]]
+        ] = {}
+        self._changed_owners: Set[arcade.Sprite] = set()
+
+    def __len__(self) -> int:
+        """Return the number of owners with status bars."""
+        return len(self._owner_bars)
+
+    def __contains__(self, owner: arcade.Sprite) -> bool:
+        """Return whether the owner has status bars."""
+        return owner in self._owner_bars
+
+    def add(self, owners: Iterable[arcade.Sprite]):
+        """Add the bars of new owners, e.g. spawned obstacles."""
+        for owner in owners:
+            if owner in self._owner_bars:
+                continue
+            owner_bars = []
+            for bar in self.bars:
+                if not hasattr(owner, bar.value_attribute):
+                    continue
+                background = arcade.SpriteSolidColor(
+                    self.bar_width, self.bar_height, bar.background_color
+                )
+                foreground = arcade.SpriteSolidColor(
+                    self.bar_width, self.bar_height, bar.foreground_color
+                )
+                self.sprite_list.extend((background, foreground))
+                owner_bars.append((bar, background, foreground))
+            self._owner_bars[owner] = owner_bars
+            self._place(owner)
+
+    def remove(self, owners: Iterable[arcade.Sprite]):
+        """Remove the bars of owners, e.g. destroyed obstacles, in one batch.
+
+        Owners without bars are ignored.
+        """
+        sprites = []
+        for owner in owners:
+            self._changed_owners.discard(owner)
+            for _, background, foreground in self._owner_bars.pop(owner, ()):
+                sprites.extend((background, foreground))
+        self.sprite_list.remove_many(sprites)
+
+    def mark_changed(self, owner: arcade.Sprite):
+        """Update the bars of an owner which moved, resized or whose values changed.
+
+        The bars are placed again by the next `update`.
+        """
+        self._changed_owners.add(owner)
+
+    def _place(self, owner: arcade.Sprite):
+        for bar, background, foreground in self._owner_bars[owner]:
+            x = owner.center_x
+            y = owner.center_y + owner.height / 2 + bar.offset_y
+            background.position = (x, y)
+
+            fraction = getattr(owner, bar.value_attribute) / getattr(
+                owner, bar.max_value_attribute
+            )
+            foreground_width = self.bar_width * min(max(fraction, 0), 1)
+            # Foreground is aligned to the left of the background
+            foreground.visible = foreground_width > 0
+            foreground.width = foreground_width
+            foreground.position = (x - (self.bar_width - foreground_width) / 2, y)
+
+    def update(self):
+        """Place the bars of the owners marked as changed since the last update."""
+        for owner in self._changed_owners:
+            if owner in self._owner_bars:
+                self._place(owner)
+        self._changed_owners.clear()
+
+    def draw(self):
+        """Draw every bar."""
+        self.sprite_list.draw()
@@ -0,0 +1,42 @@
+import unittest
+
+from omg.core.clock import FixedTimestep
+
+
+class TestFixedTimestep(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FixedTimestep(step=0.1, max_steps=3, max_frame_time=0.5)
+
+    def test_accumulates_partial_ticks(self):
+        self.assertEqual(self.clock.advance(0.05), 0)
+        self.assertAlmostEqual(self.clock.alpha, 0.5)
+        self.assertEqual(self.clock.advance(0.07), 1)
+        self.assertAlmostEqual(self.clock.alpha, 0.2)
+
+    def test_same_ticks_for_any_frame_rate(self):
+        fast = FixedTimestep(step=0.125, max_steps=100, max_frame_time=10)
+        slow = FixedTimestep(step=0.125, max_steps=100, max_frame_time=10)
+        fast_ticks = sum(fast.advance(0.03125) for _ in range(32))
+        slow_ticks = sum(slow.advance(0.25) for _ in range(4))
+        self.assertEqual(fast_ticks, 8)
+        self.assertEqual(slow_ticks, 8)
+
+    def test_catch_up_limit(self):
+        self.assertEqual(self.clock.advance(0.45), 3)
+        self.assertLess(self.clock.accumulator, self.clock.step)
+        self.assertAlmostEqual(self.clock.dropped_time, 0.1)
+
+    def test_frame_time_clamped(self):
+        self.clock.max_steps = 100
+        self.assertEqual(self.clock.advance(2.0), 5)
+        self.assertAlmostEqual(self.clock.dropped_time, 1.5)
+
+    def test_reset(self):
+        self.clock.advance(0.05)
+        self.clock.reset()
+        self.assertEqual(self.clock.alpha, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from omg.core.debug_overlay import DebugOverlay
+from omg.utils.profiler import FrameProfiler
+
+
+class TestDebugOverlay(unittest.TestCase):
+
+    def setUp(self):
+        # Texts need an OpenGL context
+        patcher = patch("arcade.Text", side_effect=lambda *args, **kwargs: MagicMock())
+        self.text_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.profiler = FrameProfiler()
+        self.profiler.record("physics_engine.update", 0.002)
+        self.profiler.record("scene.draw", 0.004)
+        self.overlay = DebugOverlay(self.profiler, 800, 600, refresh_interval=10)
+        self.counts = {"projectiles": 12, "obstacles": 1}
+
+    def test_lines(self):
+        self.overlay.update((10, 20), (1.5, 2.5), self.counts)
+        lines = [text.text for text in self.overlay._texts]
+
+        self.assertEqual(lines[0], "Mouse: (10, 20)")
+        self.assertEqual(lines[1], "Player: (1.5, 2.5)")
+        self.assertEqual(lines[2], "projectiles: 12, obstacles: 1")
+        self.assertTrue(lines[4].startswith("physics_engine.update"))
+        self.assertTrue(lines[4].endswith("2.00   2.00   2.00"))
+        self.assertTrue(lines[5].startswith("scene.draw"))
+
+    def test_texts_are_cached(self):
+        self.overlay.update((10, 20), (1.5, 2.5), self.counts)
+        texts = list(self.overlay._texts)
+        n_texts = self.text_class.call_count
+        self.overlay._refreshed_at = None
+        self.overlay.update((30, 40), (1.5, 2.5), self.counts)
+
+        self.assertEqual(self.text_class.call_count, n_texts)
+        self.assertEqual(self.overlay._texts, texts)
+        self.assertEqual(texts[0].text, "Mouse: (30, 40)")
+
+    def test_texts_are_refreshed_after_interval(self):
+        self.overlay.update((10, 20), (1.5, 2.5), self.counts)
+        self.overlay.update((30, 40), (1.5, 2.5), self.counts)
+        self.assertEqual(self.overlay._texts[0].text, "Mouse: (10, 20)")
+
+    def test_draw(self):
+        self.overlay.update((10, 20), (1.5, 2.5), self.counts)
+        self.overlay.draw()
+        for text in self.overlay._texts:
+            text.draw.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
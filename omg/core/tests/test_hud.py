@@ -0,0 +1,101 @@
+import os.path
+import unittest
+from unittest.mock import patch
+
+from omg.core.hud import Hud
+from omg.core.world import ASSET_DIR
+from omg.entities.tests import TEST_IMAGE_FILE
+
+ELEMENT_1 = {"name": "Fire", "image_file": TEST_IMAGE_FILE}
+ELEMENT_2 = {"name": "Ice", "image_file": ":resources:images/items/coinGold.png"}
+SKILL_SLOT_IMAGE_FILE = ":resources:images/tiles/boxCrate.png"
+# Case differs from the file on the disk, `FireIce.png`
+SKILL_IMAGE_FILES = {"FireIce": os.path.join(ASSET_DIR, "skills", "FireIce.PNG")}
+
+
+class TestHud(unittest.TestCase):
+
+    def setUp(self):
+        self.hud = Hud(window_height=600, icon_size=64, icon_margin_x=10)
+
+    def test_update_element_icons(self):
+        self.hud.update_element_icons([ELEMENT_1, ELEMENT_2], current_index=1)
+
+        icons = self.hud._element_icons
+        self.assertEqual(len(icons), 2)
+        self.assertEqual(icons[0].position, (42, 557))
+        self.assertEqual(icons[1].position, (116, 557))
+        self.assertEqual(icons[0].width, 64)
+        self.assertTrue(self.hud._selection_outline.visible)
+        self.assertEqual(self.hud._selection_outline.position, icons[1].position)
+        # Outline and icons are drawn by the same sprite list
+        self.assertEqual(len(self.hud.sprite_list), 3)
+
+    def test_textures_are_cached(self):
+        registry = self.hud._registry
+        with patch.object(registry, "load_texture", wraps=registry.load_texture) as load:
+            self.hud.update_element_icons([ELEMENT_1], current_index=0)
+            self.hud.update_element_icons([ELEMENT_1, ELEMENT_1], current_index=0)
+        load.assert_called_once_with(TEST_IMAGE_FILE)
+
+    def test_select_element(self):
+        self.hud.update_element_icons([ELEMENT_1, ELEMENT_2], current_index=0)
+        self.hud.select_element(1)
+        self.assertEqual(
+            self.hud._selection_outline.position, self.hud._element_icons[1].position
+        )
+
+    def test_no_selection_without_elements(self):
+        self.hud.update_element_icons([], current_index=0)
+        self.assertFalse(self.hud._selection_outline.visible)
+
+    def test_resize(self):
+        self.hud.update_element_icons([ELEMENT_1, ELEMENT_2], current_index=1)
+        self.hud.resize(window_height=800)
+
+        icons = self.hud._element_icons
+        self.assertEqual(icons[0].position, (42, 757))
+        self.assertEqual(icons[1].position, (116, 757))
+        self.assertEqual(self.hud._selection_outline.position, icons[1].position)
+
+
+class TestHudSkillSlots(unittest.TestCase):
+
+    def setUp(self):
+        self.hud = Hud(
+            window_height=600,
+            skill_slot_image_files=[SKILL_SLOT_IMAGE_FILE, SKILL_SLOT_IMAGE_FILE],
+            skill_image_files=SKILL_IMAGE_FILES,
+        )
+
+    def test_skill_slots(self):
+        slot_1, slot_2 = self.hud._skill_slots
+        self.assertEqual(slot_1.position, (slot_1.width // 2, slot_1.height // 2))
+        self.assertEqual(slot_2.center_x, slot_1.center_x + slot_1.width)
+        # Outline, crafted skill icons and skill slots share the sprite list
+        self.assertEqual(len(self.hud.sprite_list), 5)
+        self.assertFalse(any(icon.visible for icon in self.hud._crafted_skill_icons))
+
+    def test_update_crafted_skills(self):
+        self.hud.update_crafted_skills(["FireIce", None])
+
+        icon_1, icon_2 = self.hud._crafted_skill_icons
+        self.assertTrue(icon_1.visible)
+        self.assertFalse(icon_2.visible)
+        self.assertEqual(icon_1.position, (icon_1.width // 2, icon_1.height // 2))
+        self.assertEqual(len(self.hud.sprite_list), 5)
+
+    def test_crafted_skill_textures_are_cached(self):
+        # Icons are looked up by their id, the paths are not resolved again
+        with patch.object(self.hud._registry, "find") as find:
+            self.hud.update_crafted_skills(["FireIce", None])
+            self.hud.update_crafted_skills(["FireIce", "FireIce"])
+        find.assert_not_called()
+        self.assertIs(
+            self.hud._crafted_skill_icons[0].texture,
+            self.hud._crafted_skill_icons[1].texture,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
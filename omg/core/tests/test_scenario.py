@@ -0,0 +1,98 @@
+import math
+import unittest
+
+from omg.core.scenario import (
+    PLAYER_SPAWN,
+    Scenario,
+    default_layout,
+    generate_layout,
+)
+from omg.core.world import World
+from omg.entities.elements import get_elements
+from omg.entities.emitter import EMITTER_OWNER
+
+BOUNDS = 2000  # 4 x 4 density squares
+
+
+class TestScenario(unittest.TestCase):
+
+    def setUp(self):
+        self.scenario = Scenario(
+            seed=7, obstacle_density=2, pickupable_density=1, emitter_density=0.5
+        )
+
+    def test_counts(self):
+        layout = generate_layout(self.scenario, BOUNDS)
+        self.assertEqual(len(layout.obstacles), 32)
+        self.assertEqual(len(layout.pickupables), 16)
+        self.assertEqual(len(layout.emitters), 8)
+
+    def test_same_seed_same_layout(self):
+        layout_1 = generate_layout(self.scenario, BOUNDS)
+        layout_2 = generate_layout(self.scenario, BOUNDS)
+        other_layout = generate_layout(self.scenario._replace(seed=8), BOUNDS)
+
+        self.assertEqual(layout_1.obstacles, layout_2.obstacles)
+        self.assertEqual(layout_1.pickupables, layout_2.pickupables)
+        self.assertNotEqual(layout_1.obstacles, other_layout.obstacles)
+
+    def test_entities_are_in_bounds_and_clear_of_spawn(self):
+        layout = generate_layout(self.scenario, BOUNDS)
+        positions = [
+            *(entity[:2] for entity in layout.obstacles + layout.pickupables),
+            *((emitter.center_x, emitter.center_y) for emitter in layout.emitters),
+        ]
+        for x, y in positions:
+            self.assertLessEqual(max(abs(x), abs(y)), BOUNDS)
+            distance = math.hypot(x - PLAYER_SPAWN[0], y - PLAYER_SPAWN[1])
+            self.assertGreaterEqual(distance, self.scenario.spawn_clearance)
+
+    def test_pickupables_carry_elements(self):
+        layout = generate_layout(self.scenario, BOUNDS)
+        for _, _, element_name in layout.pickupables:
+            self.assertIn(element_name, get_elements())
+
+    def test_invalid_scenarios(self):
+        invalid_scenarios = [
+            self.scenario._replace(emitter_interval=0),
+            self.scenario._replace(emitter_interval=-0.5),
+            # Covers the whole world
+            self.scenario._replace(spawn_clearance=4 * BOUNDS),
+            self.scenario._replace(spawn_clearance=BOUNDS),
+        ]
+        for scenario in invalid_scenarios:
+            with self.subTest(scenario=scenario):
+                with self.assertRaises(ValueError):
+                    generate_layout(scenario, BOUNDS)
+
+
+class TestWorldScenario(unittest.TestCase):
+
+    def test_default_layout(self):
+        world = World()
+        world.setup()
+        layout = default_layout()
+        self.assertEqual(len(world.scene["Obstacles"]), len(layout.obstacles))
+        self.assertEqual(len(world.scene["Pickupables"]), len(layout.pickupables))
+        self.assertEqual(world.emitters, [])
+
+    def test_generated_world(self):
+        scenario = Scenario(
+            obstacle_density=0.05, pickupable_density=0.05, emitter_density=0.01
+        )
+        world = World()
+        world.setup(scenario)
+        self.assertEqual(len(world.scene["Obstacles"]), 20)
+        self.assertEqual(len(world.scene["Pickupables"]), 20)
+        self.assertEqual(len(world.emitters), 4)
+
+        for _ in range(60):
+            world.update(1 / 60, 0, 0)
+        # Every emitter shoots twice per second
+        self.assertGreater(len(world.projectiles), 0)
+        owners = world.projectiles.owner[: len(world.projectiles)]
+        self.assertTrue((owners == EMITTER_OWNER).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import patch
+
+from omg.core.status_bars import StatusBars
+from omg.entities.obstacle import Obstacle
+from omg.entities.tests import TEST_IMAGE_FILE
+
+
+class TestStatusBars(unittest.TestCase):
+
+    def setUp(self):
+        self.status_bars = StatusBars(bar_width=50, bar_height=5)
+        self.obstacle = Obstacle(TEST_IMAGE_FILE, 1.0, health=100)
+        self.obstacle.position = (100, 200)
+
+    def test_health_bar(self):
+        self.obstacle.take_damage(30)
+        self.status_bars.add([self.obstacle])
+
+        # Obstacles have no mana, only a health bar is shown
+        background, foreground = self.status_bars.sprite_list
+        health_bar_y = self.obstacle.center_y + self.obstacle.height / 2 + 10
+        self.assertEqual(background.position, (100, health_bar_y))
+        self.assertEqual(background.width, 50)
+        self.assertEqual(foreground.width, 35)
+        self.assertEqual(foreground.position, (100 - (50 - 35) / 2, health_bar_y))
+
+    def test_mana_bar(self):
+        self.obstacle.max_mana = 100
+        self.obstacle.current_mana = 50
+        self.status_bars.add([self.obstacle])
+
+        self.assertEqual(len(self.status_bars.sprite_list), 4)
+        _, _, background, foreground = self.status_bars.sprite_list
+        mana_bar_y = self.obstacle.center_y + self.obstacle.height / 2 + 2
+        self.assertEqual(background.position, (100, mana_bar_y))
+        self.assertEqual(foreground.width, 25)
+
+    def test_changed_owner_is_placed_again(self):
+        self.status_bars.add([self.obstacle])
+        self.obstacle.center_x = 300
+        self.obstacle.take_damage(50)
+        self.status_bars.mark_changed(self.obstacle)
+        self.status_bars.update()
+
+        background, foreground = self.status_bars.sprite_list
+        self.assertEqual(background.center_x, 300)
+        self.assertEqual(foreground.width, 25)
+
+    def test_only_changed_owners_are_placed(self):
+        others = [Obstacle(TEST_IMAGE_FILE, 1.0, health=100) for _ in range(3)]
+        self.status_bars.add([self.obstacle, *others])
+        self.status_bars.mark_changed(others[1])
+        with patch.object(self.status_bars, "_place") as place:
+            self.status_bars.update()
+            self.status_bars.update()
+        place.assert_called_once_with(others[1])
+
+    def test_remove(self):
+        others = [Obstacle(TEST_IMAGE_FILE, 1.0, health=100) for _ in range(10)]
+        self.status_bars.add([self.obstacle, *others])
+        self.status_bars.mark_changed(others[0])
+        self.status_bars.remove(others)
+        self.status_bars.update()
+
+        self.assertNotIn(others[0], self.status_bars)
+        self.assertEqual(len(self.status_bars), 1)
+        self.assertEqual(len(self.status_bars.sprite_list), 2)
+        # Owners without bars are ignored
+        self.status_bars.remove(others)
+
+    def test_empty_bar_is_hidden(self):
+        self.obstacle.current_health = 0
+        self.status_bars.add([self.obstacle])
+        self.assertFalse(self.status_bars.sprite_list[1].visible)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import arcade
+
+from omg.core.clock import FixedTimestep
+from omg.core.status_bars import StatusBars
+from omg.core.views import GameView, LoadingView, PauseView, game_loading_jobs
+from omg.core.world import ARCHER_PATH
+from omg.entities.obstacle import Obstacle
+from omg.entities.player import Player
+from omg.entities.tests import TEST_IMAGE_FILE
+
+
+def make_window(width=800, height=600):
+    window = MagicMock(width=width, height=height)
+    window.get_framebuffer_size.return_value = (width, height)
+    window.ctx.framebuffer.side_effect = lambda **kwargs: MagicMock(
+        size=window.get_framebuffer_size()
+    )
+    return window
+
+
+class TestGameView(unittest.TestCase):
+
+    def test_resuming_drops_the_accumulated_time(self):
+        window = make_window()
+        with patch("arcade.get_window", MagicMock(return_value=window)):
+            game_view = GameView(window=window)
+        game_view.on_show_view()  # Not set up yet
+
+        game_view.clock = FixedTimestep()
+        game_view.clock.advance(0.9 * game_view.clock.step)
+        game_view.on_show_view()
+
+        self.assertEqual(game_view.clock.accumulator, 0)
+        self.assertEqual(game_view.clock.advance(0.5 * game_view.clock.step), 0)
+
+    def test_status_bars_of_damaged_obstacles(self):
+        window = make_window()
+        with patch("arcade.get_window", MagicMock(return_value=window)):
+            game_view = GameView(window=window)
+        obstacles = [Obstacle(TEST_IMAGE_FILE, 1.0, health=100) for _ in range(3)]
+        game_view.world = MagicMock(player=Player("Hero", ARCHER_PATH, 1.0, 0))
+        game_view.status_bars = StatusBars()
+        game_view.status_bars.add([game_view.player, *obstacles])
+        damaged, destroyed, _ = obstacles
+        damaged.sprite_lists.append(MagicMock())  # Still in the scene
+        damaged.take_damage(50)
+        game_view.world.damaged_obstacles = {damaged, destroyed}
+
+        game_view._update_status_bars()
+
+        self.assertEqual(game_view.world.damaged_obstacles, set())
+        self.assertNotIn(destroyed, game_view.status_bars)
+        self.assertEqual(len(game_view.status_bars), 3)
+        health_bar = game_view.status_bars._owner_bars[damaged][0][2]
+        self.assertEqual(health_bar.width, 25)
+
+    def test_debug_overlay_is_created_on_first_toggle(self):
+        window = make_window()
+        with patch("arcade.get_window", MagicMock(return_value=window)):
+            game_view = GameView(window=window)
+        game_view.world = MagicMock()
+        game_view.active_keys = {}
+        self.assertIsNone(game_view.debug_overlay)
+
+        with patch("arcade.Text", MagicMock()):
+            game_view.on_key_press(arcade.key.F1, 0)
+            debug_overlay = game_view.debug_overlay
+            game_view.on_key_press(arcade.key.F1, 0)
+            game_view.on_key_press(arcade.key.F1, 0)
+
+        self.assertTrue(game_view.debug_mode)
+        self.assertIsNotNone(debug_overlay)
+        self.assertIs(game_view.debug_overlay, debug_overlay)
+
+    def test_resize_lays_out_the_gui(self):
+        window = make_window()
+        with patch("arcade.get_window", MagicMock(return_value=window)):
+            game_view = GameView(window=window)
+        game_view.on_resize(1024, 768)  # Not set up yet
+
+        game_view.world = MagicMock()
+        game_view.camera_sprite = MagicMock()
+        game_view.camera_gui = MagicMock()
+        game_view.hud = MagicMock()
+        game_view.debug_overlay = MagicMock()
+        window.width, window.height = 1024, 768
+        with patch("arcade.Text", MagicMock()):
+            game_view.on_resize(1024, 768)
+
+        game_view.camera_sprite.resize.assert_called_once_with(1024, 768)
+        game_view.camera_gui.resize.assert_called_once_with(1024, 768)
+        game_view.hud.resize.assert_called_once_with(768)
+        # Overlay is created again at the top right of the resized window
+        self.assertEqual(game_view.debug_overlay._x, 1024 - 400)
+
+
+class TestPauseView(unittest.TestCase):
+
+    def setUp(self):
+        self.window = make_window()
+        # Texts and cameras need an OpenGL context
+        patchers = [
+            patch("arcade.Text", MagicMock()),
+            patch("arcade.Camera", MagicMock()),
+            patch("arcade.get_window", MagicMock(return_value=self.window)),
+            patch("omg.core.views.geometry.quad_2d_fs", MagicMock()),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.pause_view = PauseView(window=self.window)
+        self.game_view = MagicMock()
+
+    def test_frame_is_captured_once(self):
+        self.pause_view.update_view_to_draw(self.game_view)
+        self.pause_view.on_show_view()
+        for _ in range(3):
+            self.pause_view.on_draw()
+
+        self.game_view.on_draw.assert_called_once()
+        self.assertEqual(self.pause_view._quad.render.call_count, 3)
+
+    def test_captured_frame_is_drawn_as_a_quad(self):
+        self.pause_view.update_view_to_draw(self.game_view)
+        self.pause_view.on_show_view()
+        frame_buffer = self.pause_view._frame_buffer
+        frame_buffer.activate.assert_called_once()
+
+        self.pause_view.on_draw()
+
+        # The colour attachment is sampled rather than blitted to the screen
+        frame_buffer.color_attachments[0].use.assert_called_once_with(0)
+        self.pause_view._quad.render.assert_called_once_with(
+            self.window.ctx.program.return_value
+        )
+        self.window.ctx.copy_framebuffer.assert_not_called()
+        # The program is built once, not per capture
+        self.pause_view.update_view_to_draw(self.game_view)
+        self.window.ctx.program.assert_called_once()
+
+    def test_texts_are_cached(self):
+        self.pause_view.update_view_to_draw(self.game_view)
+        self.pause_view.on_show_view()
+        texts = self.pause_view._texts
+        self.pause_view.on_draw()
+        self.pause_view.on_show_view()
+
+        self.assertEqual(len(texts), 3)
+        self.assertIs(self.pause_view._texts, texts)
+        for text in texts:
+            text.draw.assert_called()
+
+    def test_framebuffer_is_reused(self):
+        self.pause_view.update_view_to_draw(self.game_view)
+        self.pause_view.update_view_to_draw(self.game_view)
+        self.window.ctx.framebuffer.assert_called_once()
+
+    def test_resize_captures_again(self):
+        self.pause_view.update_view_to_draw(self.game_view)
+        self.window.get_framebuffer_size.return_value = (1024, 768)
+        self.pause_view.on_resize(1024, 768)
+
+        self.assertEqual(self.window.ctx.framebuffer.call_count, 2)
+        self.assertEqual(self.game_view.on_draw.call_count, 2)
+
+
+class TestLoadingView(unittest.TestCase):
+
+    def setUp(self):
+        self.window = make_window()
+        patchers = [
+            patch("arcade.Text", MagicMock()),
+            patch("arcade.get_window", MagicMock(return_value=self.window)),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.textures = [MagicMock(name=f"texture_{i}") for i in range(3)]
+        self.on_loaded = MagicMock()
+        self.loading_view = LoadingView(
+            window=self.window,
+            on_loaded=self.on_loaded,
+            jobs=[lambda: iter(self.textures)],
+        )
+
+    def test_textures_are_uploaded_before_on_loaded(self):
+        self.loading_view.on_show_view()
+        self.loading_view.loader._thread.join(timeout=5)
+        self.loading_view.on_update(1 / 60)
+        self.loading_view.on_update(1 / 60)
+
+        atlas = self.window.ctx.default_atlas
+        self.assertEqual(atlas.add.call_count, 3)
+        self.on_loaded.assert_called_once()
+
+    def test_loading_error_is_not_swallowed(self):
+        def job():
+            yield from self.textures
+            raise OSError("corrupt.png")
+
+        loading_view = LoadingView(
+            window=self.window, on_loaded=self.on_loaded, jobs=[job]
+        )
+        loading_view.on_show_view()
+        loading_view.loader._thread.join(timeout=5)
+
+        with self.assertRaises(OSError):
+            loading_view.on_update(1 / 60)
+        self.on_loaded.assert_not_called()
+
+    def test_loader_is_started_once(self):
+        self.loading_view.on_show_view()
+        self.loading_view.on_show_view()
+        self.assertTrue(self.loading_view.loader.started)
+
+    def test_game_loading_jobs(self):
+        textures = [texture for job in game_loading_jobs() for texture in job()]
+        self.assertGreater(len(textures), 0)
+        self.assertEqual(len(set(map(id, textures))), len(textures))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import gc
+import unittest
+import weakref
+from unittest.mock import MagicMock
+
+from omg.core.world import World
+from omg.entities.events import (
+    CraftedSkillSlotsChangedEvent,
+    ElementAcquiredEvent,
+    PickupRequestEvent,
+    ProjectileShotEvent,
+)
+from omg.entities.projectile import Projectile
+from omg.entities.projectile_pool import SkillPools
+from omg.entities.tests.test_projectile_pool import TEST_SKILL
+from omg.entities.tests import TEST_IMAGE_FILE
+from omg.utils.profiler import FrameProfiler
+
+
+class TestWorld(unittest.TestCase):
+
+    def setUp(self):
+        self.world = World()
+        self.world.setup()
+
+    def test_setup(self):
+        """The world is built without a window."""
+        self.assertEqual(len(self.world.scene["Obstacles"]), 1)
+        self.assertEqual(len(self.world.scene["Pickupables"]), 3)
+        self.assertEqual(len(self.world.scene["Projectiles"]), 0)
+        self.assertIs(self.world.physics_engine.player_sprite, self.world.player)
+
+    def test_setup_does_not_share_observers(self):
+        first_observer = weakref.ref(self.world.observer)
+        self.world.setup()
+
+        self.assertEqual(self.world.player.observers, [self.world.observer])
+        self.assertEqual(self.world.player.elements.observers, [self.world.observer])
+        # Nothing keeps the observer of the previous setup alive
+        gc.collect()
+        self.assertIsNone(first_observer())
+
+    def test_update_steps_all_systems(self):
+        self.world.player.update = MagicMock()
+        self.world.physics_engine.update = MagicMock()
+
+        self.world.update(1 / 60, 10, 20)
+
+        self.world.player.update.assert_called_once_with(10, 20, 1 / 60)
+        self.world.physics_engine.update.assert_called_once()
+        self.assertEqual(self.world.tick, 1)
+
+    def test_update_phases_are_profiled(self):
+        self.world.update(1 / 60, 0, 0)
+        # Profiling is off by default
+        self.assertEqual(self.world.profiler.phases, ())
+
+        world = World(profiler=FrameProfiler())
+        world.setup()
+        world.update(1 / 60, 0, 0)
+        self.assertEqual(
+            world.profiler.phases,
+            (
+                "observer.flush",
+                "scene.update",
+                "projectiles.update",
+                "emitters.update",
+                "player.update",
+                "pickup_collisions",
+                "physics_engine.update",
+                "handle_projectile_collisions",
+            ),
+        )
+
+    def test_many_ticks(self):
+        for _ in range(100):
+            self.world.update(1 / 60, 0, 0)
+        self.assertEqual(self.world.tick, 100)
+
+    def test_on_projectile_shot(self):
+        projectile = Projectile("Test", TEST_IMAGE_FILE, 0.05, 10, 5, -500, -500, 0)
+        self.world.observer.on_event(ProjectileShotEvent(projectile))
+        # Events are dispatched at the start of a tick
+        self.assertNotIn(projectile, self.world.scene["Projectiles"])
+        self.world.observer.flush()
+        self.assertIn(projectile, self.world.scene["Projectiles"])
+
+        self.world.update(1 / 60, 0, 0)
+        self.assertAlmostEqual(self.world.projectiles.position[0, 1], -495)
+
+    def test_damaged_obstacles(self):
+        obstacle = self.world.scene["Obstacles"][0]
+        projectile = Projectile(
+            "Test", TEST_IMAGE_FILE, 0.05, 10, 0, *obstacle.position, 0
+        )
+        self.world.observer.on_event(ProjectileShotEvent(projectile))
+        self.world.update(1 / 60, 0, 0)
+        self.world.update(1 / 60, 0, 0)
+
+        self.assertEqual(self.world.damaged_obstacles, {obstacle})
+        self.assertEqual(obstacle.current_health, obstacle.max_health - 10)
+
+    def test_shot_projectiles_are_recycled(self):
+        player = self.world.player
+        player.skill_pools = SkillPools({"Test": dict(TEST_SKILL, ttl=0.1)})
+        player.shoot("Test")
+        self.world.update(1 / 60, 0, 0)
+        self.assertEqual(len(self.world.projectiles), 1)
+
+        for _ in range(10):
+            self.world.update(1 / 60, 0, 0)
+        self.assertEqual(len(self.world.projectiles), 0)
+        self.assertEqual(player.skill_pools.get("Test").n_free, 1)
+
+    def test_interpolated(self):
+        player = self.world.player
+        player.position = (0, 0)
+        self.world.update(1 / 60, 0, 0)
+        player.position = (10, 20)
+
+        with self.world.interpolated(0.25):
+            self.assertEqual(player.position, (2.5, 5))
+        self.assertEqual(player.position, (10, 20))
+
+    def test_on_pickup_request(self):
+        item_manager = MagicMock()
+        pickupable = self.world.scene["Pickupables"][0]
+        self.world.player.center_x = pickupable.center_x
+        self.world.player.center_y = pickupable.center_y
+
+        on_element_acquired = MagicMock()
+        self.world.observer.register_handler(ElementAcquiredEvent, on_element_acquired)
+
+        event = PickupRequestEvent(item_manager, self.world.player.pickup_sprite)
+        self.world.observer.on_event(event)
+        self.world.observer.flush()
+
+        item_manager.add_item.assert_called_once_with(pickupable.item)
+        self.assertNotIn(pickupable, self.world.scene["Pickupables"])
+        acquired_event = on_element_acquired.call_args[0][0]
+        self.assertIs(acquired_event.elements, item_manager)
+        self.assertIs(acquired_event.element, pickupable.item)
+
+    def test_crafted_skill_slots_changed(self):
+        on_slots_changed = MagicMock()
+        self.world.observer.register_handler(
+            CraftedSkillSlotsChangedEvent, on_slots_changed
+        )
+
+        self.world.player._update_crafted_skill_slots("FireIce")
+        self.world.observer.flush()
+
+        slots_event = on_slots_changed.call_args[0][0]
+        self.assertEqual(slots_event.crafted_skill_slots[0], "FireIce")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,50 +1,88 @@
-import os.path
-from typing import Dict
+import logging
+import os
+from typing import Callable, Dict, Iterator, List, Sequence
 
 import arcade
 import arcade.key
-
+from arcade.gl import geometry
+
+from omg.assets.atlas import ATLAS_IMAGE_FILE
+from omg.assets.content_pack import get_content_pack
+from omg.assets.frames import FRAME_FILE_PATTERN
+from omg.assets.loader import BackgroundLoader, LoadingJob
+from omg.assets.registry import get_asset_registry
+from omg.core.clock import FIXED_DELTA_TIME, FixedTimestep
+from omg.core.scenario import Scenario
+from omg.core.hud import Hud
+from omg.core.status_bars import StatusBars
+from omg.core.world import ARCHER_PATH, World
 from omg.entities.events import (
-    PickupRequestEvent,
-    ProjectileShotEvent,
+    CraftedSkillSlotsChangedEvent,
+    ElementAcquiredEvent,
+    ElementSelectedEvent,
     PickupButtonKeyChangeRequestEvent,
 )
 from omg.entities.items import Pickupable
+from omg.entities.projectile import get_crafted_skills
 from omg.entities.player import Player
-from omg.entities.obstacle import Obstacle
-from omg.mechanics.collision import handle_projectile_collisions
+from omg.mechanics.animation import get_animation_library
+from omg.mechanics.animator import DIRECTIONS
 from omg.mechanics.physics import PhysicsEngineBoundary
-from omg.structural.observer import Observer
-from omg.entities.elements import ELEMENTS
-
-
-# TODO: Manage assets in a more generic way
-ASSET_DIR = os.path.join(
-    os.path.join(os.path.dirname(__file__), ".."), "assets", "images"
-)
-COIN_IMAGE_PATH = ":resources:images/items/coinGold.png"
-ARCHER_PATH = str(os.path.join(ASSET_DIR, "characters", "demo_archer", "sprites"))
+from omg.utils.profiler import FrameProfiler
+from omg.utils.tracing import get_trace_recorder
 
 SCREEN_WIDTH = 800  # Also defines player's POV
 SCREEN_HEIGHT = 600  # Also defines player's POV
-# player's coordinates are limited to -GAME_MAX_BOUNDS, GAME_MAX_BOUNDS
-GAME_MAX_BOUNDS = 10000
 SCREEN_TITLE = "2D Shooter RPG"
+# Time in seconds a loading frame spends on uploading textures to the GPU
+UPLOAD_TIME_BUDGET = 0.004
+
+# Shaders of the full-screen quad which draws the captured frame of PauseView
+FRAME_VERTEX_SHADER = """
+#version 330
+
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 uv;
+
+void main() {
+    gl_Position = vec4(in_vert, 0.0, 1.0);
+    uv = in_uv;
+}
+"""
+FRAME_FRAGMENT_SHADER = """
+#version 330
+
+uniform sampler2D frame;
+in vec2 uv;
+out vec4 fragment_color;
+
+void main() {
+    fragment_color = texture(frame, uv);
+}
+"""
 
 
 class GameView(arcade.View):
-    """Main game view."""
+    """Main game view.
 
-    def __init__(self, window: arcade.Window = None):
+    Parameters
+    ----------
+    window : arcade.Window, optional
+        Window of the view.
+    scenario : Scenario, optional
+        Scenario the world is generated from, the hand-placed layout by default.
+    """
+
+    def __init__(self, window: arcade.Window = None, scenario: Scenario = None):
         super().__init__(window)
-        self.observer: Observer = None
-        self.player: Player = None
-        self.scene: arcade.Scene = None
+        self.scenario = scenario
+        self.world: World = None
+        self.clock: FixedTimestep = None
+        self.hud: Hud = None
+        self.status_bars: StatusBars = None
         self.camera_sprite = None
         self.camera_gui = None
-        self.skill_slot_1: arcade.Sprite = None  # Skill slot 1
-        self.skill_slot_2: arcade.Sprite = None  # Skill slot 2
-        self.physics_engine = None
         self.mouse_x = 0
         self.mouse_y = 0
         self.icon_scale = 0.1
@@ -56,87 +94,53 @@ class GameView(arcade.View):
 
         # Debug state
         self.debug_mode: bool = False
+        self.profiler = FrameProfiler()
+        # DebugOverlay, created when the debug mode is first toggled
+        self.debug_overlay = None
 
     def setup(self):
         """Reset the game state."""
         self.active_keys = {}
         self.flag = True
 
-        self.observer = Observer()
-        self.observer.register_handler("projectile_shot", self._on_projectile_shot)
-        self.observer.register_handler("pickup_request", self._on_pickup_request)
-        self.observer.register_handler(
-            "pickup_button_key_change", self._on_player_pickup_button_key_change
-        )
-        self.player = Player(
-            name="Hero",
-            animation_file=ARCHER_PATH,
-            scale=1.0,
-            initial_angle=0,
+        self.world = World(profiler=self.profiler)
+        self.world.setup(self.scenario)
+        self.clock = FixedTimestep()
+        self.world.observer.register_handler(
+            PickupButtonKeyChangeRequestEvent, self._on_player_pickup_button_key_change
         )
-        self.player.add_observer(self.observer)
-
-        # Create scene
-        self.scene = arcade.Scene()
-
-        self._collided_pickupables: list[Pickupable] = arcade.SpriteList()
-
-        # Add obstacles to the scene
-        obstacle_image = os.path.join(ASSET_DIR, "obstacles", "obstacle.png")
-        obstacle = Obstacle(obstacle_image, 0.2, health=50)
-        obstacle.center_x = 400
-        obstacle.center_y = 300
-        self.scene.add_sprite_list("Obstacles", use_spatial_hash=True)
-        self.scene.add_sprite("Obstacles", obstacle)
-
-        # Add pickupables to the scene
-        self.scene.add_sprite_list_after(
-            name="Pickupables",
-            after="Obstacles",
-            use_spatial_hash=True,
+        self.world.observer.register_handler(
+            ElementAcquiredEvent, self._on_element_acquired
         )
-        self.scene.add_sprite(
-            "Pickupables", Pickupable(COIN_IMAGE_PATH, 0.5, ELEMENTS["FIRE"], 150, 10)
+        self.world.observer.register_handler(
+            ElementSelectedEvent, self._on_element_selected
         )
-        self.scene.add_sprite(
-            "Pickupables", Pickupable(COIN_IMAGE_PATH, 0.5, ELEMENTS["ICE"], 250, 20)
+        self.world.observer.register_handler(
+            CraftedSkillSlotsChangedEvent, self._on_crafted_skill_slots_changed
         )
-        self.scene.add_sprite(
-            "Pickupables", Pickupable(COIN_IMAGE_PATH, 0.5, ELEMENTS["FIRE"], 250, 120)
-        )
-
-        # Add projectiles to the scene
-        self.scene.add_sprite_list("Projectiles", use_spatial_hash=False)
 
         self.camera_sprite = arcade.Camera(window=self.window)
         self.camera_gui = arcade.Camera(window=self.window)
 
         # GUI elements, these are not added to the scene
-        # Skill slot 1
-        scale_factor_1 = 0.4
-        skill_slot_1_img = os.path.join(ASSET_DIR, "skill_slots_d_f", "D.png")
-        self.skill_slot_1 = arcade.Sprite(skill_slot_1_img, scale=scale_factor_1)
-        self.skill_slot_1.center_x = self.skill_slot_1.width // 2
-        self.skill_slot_1.center_y = self.skill_slot_1.height // 2
-
-        # Skill slot 2
-        scale_factor_2 = 0.4
-        skill_slot_2_img = os.path.join(ASSET_DIR, "skill_slots_d_f", "F.png")
-        self.skill_slot_2 = arcade.Sprite(skill_slot_2_img, scale=scale_factor_2)
-        self.skill_slot_2.center_x = (
-            self.skill_slot_1.center_x + self.skill_slot_2.width
-        )
-        self.skill_slot_2.center_y = self.skill_slot_2.height // 2
-
-        # Set up physics engine
-        self.physics_engine = PhysicsEngineBoundary(
-            player_sprite=self.player,
-            walls=self.scene["Obstacles"],
-            boundary_left=-GAME_MAX_BOUNDS,
-            boundary_right=GAME_MAX_BOUNDS,
-            boundary_up=GAME_MAX_BOUNDS,
-            boundary_down=-GAME_MAX_BOUNDS,
+        self.hud = Hud(
+            self.window.height,
+            self.icon_size,
+            self.icon_margin_x,
+            self.icon_margin_y,
+            skill_slot_image_files=[
+                "images/skill_slots_d_f/D.png",  # Skill slot 1
+                "images/skill_slots_d_f/F.png",  # Skill slot 2
+            ],
+            skill_image_files={
+                skill_name: skill["image_file"]
+                for skill_name, skill in get_crafted_skills().items()
+            },
         )
+        # Obstacles do not spawn after the setup, the bars of the destroyed ones
+        # are removed in `_update_status_bars`
+        self.status_bars = StatusBars()
+        self.status_bars.add([self.player, *self.scene["Obstacles"]])
 
         # Set up pickup button icon
         self.pickup_button = self._set_pickup_button()  # button background
@@ -157,6 +161,30 @@ class GameView(arcade.View):
             self.pickup_button_text_object.content_height - height_offset
         )
 
+    def on_show_view(self):
+        """Drop the time accumulated before the view was hidden, e.g. paused."""
+        if self.clock is not None:
+            self.clock.reset()
+
+    @property
+    def player(self) -> Player:
+        """Define self.player which always refers to the player of the world."""
+        return self.world.player if self.world else None
+
+    @property
+    def scene(self) -> arcade.Scene:
+        """Define self.scene which always refers to the scene of the world."""
+        return self.world.scene if self.world else None
+
+    @property
+    def physics_engine(self) -> PhysicsEngineBoundary:
+        """Define self.physics_engine which always refers to the world's engine."""
+        return self.world.physics_engine if self.world else None
+
+    @property
+    def _collided_pickupables(self) -> list[Pickupable]:
+        return self.world.collided_pickupables
+
     def _on_player_pickup_button_key_change(
         self, event: PickupButtonKeyChangeRequestEvent
     ):
@@ -165,90 +193,110 @@ class GameView(arcade.View):
 
     def _set_pickup_button(
         self,
-        pickup_button_dir: os.path = os.path.join(
-            ASSET_DIR, "pickup_button", "button_background.png"
-        ),
+        pickup_button_dir: str = "images/pickup_button/button_background.png",
         pickup_button_image_scale: float = 0.3,
     ):
         # Set pickup_button
         return arcade.Sprite(
-            pickup_button_dir,
+            texture=get_asset_registry().load_texture(pickup_button_dir),
             scale=pickup_button_image_scale,
         )
 
-    @property
-    def element_icons(self):
-        """Define self.element_icons."""
-        # TODO: refactor element_icons logic if causes a performance bottleneck
-        # For example "element_acquired event" can trigger an update when necessary
-        if self.player:
-            return [
-                arcade.load_texture(element_type["image_file"])
-                for element_type in self.player.elements
-            ]
-        else:
-            return None
+    def _on_element_acquired(self, event: ElementAcquiredEvent):
+        """Rebuild the element icons when the player acquires an element."""
+        if event.elements is self.player.elements:
+            self.hud.update_element_icons(
+                event.elements, event.elements.get_current_index()
+            )
+
+    def _on_element_selected(self, event: ElementSelectedEvent):
+        """Move the element selection when the player selects another element."""
+        if event.elements is self.player.elements:
+            self.hud.select_element(event.elements.get_current_index())
+
+    def _on_crafted_skill_slots_changed(self, event: CraftedSkillSlotsChangedEvent):
+        """Swap the crafted skill icons when the player crafts a skill."""
+        self.hud.update_crafted_skills(event.crafted_skill_slots)
 
     def on_draw(self):
-        """Drawing code."""
-        self.clear()
+        """Drawing code.
 
-        # Activate player camera to draw Sprites
-        # sprites outside of the player camera are not drawn
-        self.camera_sprite.use()
-        self.player.draw()
-        self.scene.draw()
+        The moving sprites are drawn between their last two simulated states
+        according to the time accumulated by the clock.
+        """
+        with self.profiler.phase("on_draw"):
+            self._draw()
 
-        if self.debug_mode:
-            self.scene.draw_hit_boxes(arcade.color.RED)
-            self.player.draw_hit_box(arcade.color.RED)
-            self.player.pickup_sprite.draw_hit_box(arcade.color.RED)
+    def _draw(self):
+        profiler = self.profiler
+        self.clear()
+
+        with self.world.interpolated(self.clock.alpha):
+            # Positions the camera to the player
+            with profiler.phase("camera"):
+                self._center_camera_to_sprite(self.camera_sprite, self.player)
+                # Activate player camera to draw Sprites
+                # sprites outside of the player camera are not drawn
+                self.camera_sprite.use()
+            with profiler.phase("player.draw"):
+                self.player.draw()
+            with profiler.phase("scene.draw"):
+                self.scene.draw()
+            # Health and mana bars of every entity are drawn at once
+            with profiler.phase("status_bars.draw"):
+                self._update_status_bars()
+                self.status_bars.draw()
+
+            if self.debug_mode:
+                with profiler.phase("debug.hit_boxes"):
+                    self.scene.draw_hit_boxes(arcade.color.RED)
+                    self.player.draw_hit_box(arcade.color.RED)
+                    self.player.pickup_sprite.draw_hit_box(arcade.color.RED)
         # Activate GUI camera before drawing GUI elements
         # This is to ensure GUI elements are drawn w.r.t the window
         self.camera_gui.use()
-        self._draw_ui()
-        self._draw_pickup_icon()
+        with profiler.phase("hud.draw"):
+            self._draw_ui()
+            self._draw_pickup_icon()
         if self.debug_mode:
-            self._draw_debug_info()
+            with profiler.phase("debug.draw"):
+                self._draw_debug_info()
 
-    def update(self, delta_time):
-        """Main update window.
+    def _update_status_bars(self):
+        """Update the bars of the player and of the obstacles damaged since then.
 
-        The main update is divided into two parts:
+        Only the changed owners are visited, not every obstacle of the scene.
+        """
+        destroyed = []
+        for obstacle in self.world.damaged_obstacles:
+            if obstacle.sprite_lists:
+                self.status_bars.mark_changed(obstacle)
+            else:
+                destroyed.append(obstacle)
+        self.world.damaged_obstacles.clear()
+        self.status_bars.remove(destroyed)
+        # Player moves, is interpolated and regenerates mana, so it always changes
+        self.status_bars.mark_changed(self.player)
+        self.status_bars.update()
 
-        First is to update the Sprites individually without taking any
-        interactions with the other Sprites into account.
+    def update(self, delta_time):
+        """Main update window.
 
-        The second part is to update the Sprites which have interactions with
-        each other.
+        The game logic is stepped by the world with a fixed delta time. The view
+        only accumulates the frame time and translates the window input to the
+        world.
         """
-        # Scene updates sprites individually
-        self.scene.update()
         # Mouse is tracked in the window coordinates, but the player logic needs
         # the mouse in the camera coordinates. Thus, the mouse position relative
         # to the window should be mapped to the mouse coordinates relative to
-        # the camera before passing it to the player.
+        # the camera before passing it to the world.
         mouse_in_camera_x = self.mouse_x + self.camera_sprite.position[0]
         mouse_in_camera_y = self.mouse_y + self.camera_sprite.position[1]
-        self.player.update(mouse_in_camera_x, mouse_in_camera_y, delta_time)
-
-        # Update behaviour between the player and the pickupables
-        self._collided_pickupables = arcade.check_for_collision_with_list(
-            self.player.pickup_sprite, self.scene["Pickupables"]
-        )
-
-        # Update behaviour between the player and the obstacles
-        self.physics_engine.update()
-
-        # Update behaviour between the projectiles and the obstacles
-        handle_projectile_collisions(self.scene["Projectiles"], self.scene["Obstacles"])
-
-        # Update behaviour between the camera and the player, positions the
-        # camera to the player
-        self._center_camera_to_sprite(self.camera_sprite, self.player)
-
-    def _on_projectile_shot(self, event: ProjectileShotEvent):
-        self.scene["Projectiles"].append(event.projectile)
+        with self.profiler.phase("update"):
+            for _ in range(self.clock.advance(delta_time)):
+                self.world.update(
+                    FIXED_DELTA_TIME, mouse_in_camera_x, mouse_in_camera_y
+                )
 
     def _get_pickup_button_coordinates(self, pickupable: Pickupable):
         # Calculate directional vector between player and pickupable
@@ -291,30 +339,15 @@ class GameView(arcade.View):
         else:
             return
 
-    def _on_pickup_request(self, event: PickupRequestEvent):
-        """Handles pickup request of an entity.
-
-        Handling logic:
-        1) Checks pickupables in the environment with the current posiiton of the entity
-           requesting a pickup.
-        2) Pickup area is indicated with the hitbox of the event.entity_pickup_sprite
-           so collision check can be used.
-        3) Out of all the collisions, let the entity pick up the closest object.
-        4) Remove the picked up item from the ground.
-        """
-        collided_sprites: list[Pickupable] = arcade.check_for_collision_with_list(
-            event.entity_pickup_sprite, self.scene["Pickupables"]
-        )
-        if len(collided_sprites) >= 1:
-            # Item is at pick up range
-            closes_pickupable: Pickupable = arcade.get_closest_sprite(
-                event.entity_pickup_sprite, collided_sprites
-            )[0]
-            item_to_add = closes_pickupable.item
-            item_manager = event.entity
-            item_manager.add_item(item_to_add)
-            # remove reference to the pickupables list
-            closes_pickupable.remove_from_sprite_lists()
+    def on_resize(self, width: int, height: int):
+        """Lay out the cameras, the HUD and the debug overlay for the new size."""
+        if self.hud is None:
+            return  # Not set up yet, everything is laid out by `setup`
+        self.camera_sprite.resize(width, height)
+        self.camera_gui.resize(width, height)
+        self.hud.resize(height)
+        if self.debug_overlay is not None:
+            self._create_debug_overlay()
 
     def on_key_press(self, key, modifiers):
         """Key press logic."""
@@ -324,7 +357,34 @@ class GameView(arcade.View):
 
         # Debug mode toggle
         if key == arcade.key.F1:
-            self.debug_mode = not self.debug_mode
+            self._toggle_debug_mode()
+        # Trace recording toggle, the trace is written when the recording stops
+        if key == arcade.key.F2:
+            self._toggle_trace_recording()
+
+    def _toggle_debug_mode(self):
+        if self.debug_overlay is None:
+            self._create_debug_overlay()
+        self.debug_mode = not self.debug_mode
+
+    def _create_debug_overlay(self):
+        # Imported here, the overlay is only needed while debugging and its
+        # import is a noticeable part of the start-up time
+        from omg.core.debug_overlay import DebugOverlay
+
+        self.debug_overlay = DebugOverlay(
+            self.profiler, self.window.width, self.window.height
+        )
+
+    @staticmethod
+    def _toggle_trace_recording():
+        tracer = get_trace_recorder()
+        if not tracer.enabled:
+            tracer.start()
+            logging.info("Recording a trace, press F2 again to save it")
+        else:
+            tracer.stop()
+            logging.info(f"Trace written to {tracer.dump()}")
 
     def on_key_release(self, key, modifiers):
         """Key release logic."""
@@ -359,76 +419,22 @@ class GameView(arcade.View):
         self.active_keys = {}  # reset the dictionary
 
     def _draw_ui(self):
-        # Draw picked up elements to top left corner
-        for i, icon in enumerate(self.element_icons):
-            x = self.icon_margin_x + i * (self.icon_size + self.icon_margin_x)
-            y = self.window.height - self.icon_margin_y
-            if i == self.player.elements.get_current_index():
-                arcade.draw_rectangle_outline(
-                    x + self.icon_size // 2,
-                    y + self.icon_size // 2,
-                    self.icon_size,
-                    self.icon_size,
-                    arcade.color.RED,
-                    border_width=3,
-                )
-            arcade.draw_texture_rectangle(
-                x + self.icon_size // 2,
-                y + self.icon_size // 2,
-                self.icon_size,
-                self.icon_size,
-                icon,
-            )
-
-        # Draw combined skill icons
-        if self.player.crafted_skill_slots[0] is not None:
-            scale_factor_crafted_skill_1 = 0.3
-            skill_1_img = os.path.join(
-                ASSET_DIR, "skills", f"{self.player.crafted_skill_slots[0]}.png"
-            )
-            skill_1 = arcade.Sprite(skill_1_img, scale=scale_factor_crafted_skill_1)
-            skill_1.center_x = skill_1.width // 2
-            skill_1.center_y = skill_1.height // 2
-            skill_1.draw()
-
-        if self.player.crafted_skill_slots[1] is not None:
-            scale_factor_crafted_skill_2 = 0.3
-            skill_2_img = os.path.join(
-                ASSET_DIR, "skills", f"{self.player.crafted_skill_slots[1]}.png"
-            )
-            skill_2 = arcade.Sprite(skill_2_img, scale=scale_factor_crafted_skill_2)
-            skill_2.center_x = skill_2.width // 2 + skill_2.width
-            skill_2.center_y = skill_2.height // 2
-            skill_2.draw()
-
-        # Draw usable skill slots to bottom left corner
-        self.skill_slot_1.draw()
-        self.skill_slot_2.draw()
+        # Draw picked up elements to top left corner, crafted skills and usable
+        # skill slots to bottom left corner
+        self.hud.draw()
 
     def _draw_debug_info(self):
-        """Print debug text information on the screen."""
-        # TODO: change arcade.draw_text to arcade.Text for better performance
-        arcade.draw_text(
-            f"Mouse: ({self.mouse_x}, {self.mouse_y})",
-            101,
-            101,
-            arcade.color.WHITE,
-            font_size=20,
-        )
-        arcade.draw_text(
-            f"Player: ({self.player.center_x:.1f}, {self.player.center_y:.1f})",
-            101,
-            135,
-            arcade.color.WHITE,
-            font_size=20,
-        )
-        arcade.draw_text(
-            "Debug mode",
-            self.window.width - 250,
-            self.window.height - 50,
-            arcade.color.RED,
-            font_size=20,
+        """Draw the positions, entity counts and phase timings on the screen."""
+        self.debug_overlay.update(
+            (self.mouse_x, self.mouse_y),
+            self.player.position,
+            {
+                "projectiles": len(self.world.projectiles),
+                "obstacles": len(self.scene["Obstacles"]),
+                "pickupables": len(self.scene["Pickupables"]),
+            },
         )
+        self.debug_overlay.draw()
 
     @staticmethod
     def _center_camera_to_sprite(camera: arcade.Camera, sprite: arcade.Sprite):
@@ -440,51 +446,200 @@ class GameView(arcade.View):
 
 
 class PauseView(arcade.View):
-    """Pause screen of the game."""
+    """Pause screen of the game.
+
+    The last frame of the paused view is rendered once into an offscreen
+    framebuffer when the pause starts. A pause frame only draws the texture of
+    that framebuffer as a full-screen quad and the cached texts on top of it.
+    The framebuffer is not blitted to the screen, since the window framebuffer
+    is multisampled by default and cannot be the target of a blit.
+    """
 
     def __init__(self, window: arcade.Window):
         super().__init__(window)
         self._view_to_draw: arcade.View = None
+        self._frame_buffer: arcade.gl.Framebuffer = None
+        self._quad: arcade.gl.Geometry = None
+        self._program: arcade.gl.Program = None
+        self._camera: arcade.Camera = None
+        self._texts: List[arcade.Text] = []
 
     def update_view_to_draw(self, new_view: arcade.View):
-        """Update the View to be drawn in the pause state."""
+        """Update the View to be drawn in the pause state and capture its frame."""
         self._view_to_draw = new_view
+        self._capture_frame()
 
-    def on_draw(self):
-        """Draw the game as is and the pause view extras."""
-        self.clear()
-        if self._view_to_draw:
+    def _capture_frame(self):
+        if self._view_to_draw is None:
+            self._frame_buffer = None
+            return
+        ctx = self.window.ctx
+        if self._program is None:
+            self._quad = geometry.quad_2d_fs()
+            self._program = ctx.program(
+                vertex_shader=FRAME_VERTEX_SHADER,
+                fragment_shader=FRAME_FRAGMENT_SHADER,
+            )
+        size = self.window.get_framebuffer_size()
+        if self._frame_buffer is None or self._frame_buffer.size != size:
+            self._frame_buffer = ctx.framebuffer(
+                color_attachments=[ctx.texture(size, components=4)]
+            )
+        with self._frame_buffer.activate():
+            self._frame_buffer.clear(self.window.background_color)
             self._view_to_draw.on_draw()
 
-        # Draw the Pause text on the given View as overlay
-        arcade.draw_text(
-            "PAUSED",
-            self.window.width / 2,
-            self.window.height / 2 + 50,
-            arcade.color.WHITE,
-            font_size=50,
-            anchor_x="center",
-        )
+    def _create_texts(self):
+        """Lay out the texts in the middle of the window."""
+        center_x = self.window.width / 2
+        center_y = self.window.height / 2
+        self._camera = arcade.Camera(window=self.window)
+        self._texts = [
+            # Pause text is drawn on the captured view as overlay
+            arcade.Text(
+                "PAUSED",
+                center_x,
+                center_y + 50,
+                arcade.color.WHITE,
+                font_size=50,
+                anchor_x="center",
+            ),
+            # Show tip to return or reset
+            arcade.Text(
+                "Press Esc. to return",
+                center_x,
+                center_y,
+                arcade.color.WHITE,
+                font_size=20,
+                anchor_x="center",
+            ),
+            arcade.Text(
+                "Press Q to quit",
+                center_x,
+                center_y - 30,
+                arcade.color.WHITE,
+                font_size=20,
+                anchor_x="center",
+            ),
+        ]
+
+    def on_show_view(self):
+        """Lay out the texts the first time the pause view is shown."""
+        if not self._texts:
+            self._create_texts()
+
+    def on_resize(self, width: int, height: int):
+        """Lay out the texts and capture the frame again for the new size."""
+        self._create_texts()
+        self._capture_frame()
 
-        # Show tip to return or reset
-        arcade.draw_text(
-            "Press Esc. to return",
-            self.window.width / 2,
-            self.window.height / 2,
-            arcade.color.WHITE,
-            font_size=20,
-            anchor_x="center",
-        )
-        arcade.draw_text(
-            "Press Q to quit",
-            self.window.width / 2,
-            self.window.height / 2 - 30,
-            arcade.color.WHITE,
-            font_size=20,
-            anchor_x="center",
-        )
+    def on_draw(self):
+        """Draw the captured frame of the game and the pause view extras."""
+        self.clear()
+        self._camera.use()
+        if self._frame_buffer is not None:
+            self._frame_buffer.color_attachments[0].use(0)
+            self._quad.render(self._program)
+        for text in self._texts:
+            text.draw()
 
     def on_key_release(self, key, modifiers):
         """Key release logic."""
         if key == arcade.key.Q:
             arcade.exit()
+
+
+def game_loading_jobs() -> List[LoadingJob]:
+    """Return the jobs which load the textures of the game view."""
+    # Opened on the main thread, the worker thread only reads from it
+    get_content_pack()
+    registry = get_asset_registry()
+
+    def load_animations() -> Iterator[arcade.Texture]:
+        library = get_animation_library(ARCHER_PATH)
+        for action in library.actions:
+            for direction in DIRECTIONS:
+                yield from library.frames(action, direction)
+
+    def load_images() -> Iterator[arcade.Texture]:
+        for asset_id in registry.image_ids():
+            file_name = os.path.basename(registry.path(asset_id))
+            # Animation frames are loaded by their library
+            if file_name != ATLAS_IMAGE_FILE and not FRAME_FILE_PATTERN.match(
+                file_name
+            ):
+                yield registry.texture(asset_id)
+
+    return [load_animations, load_images]
+
+
+class LoadingView(arcade.View):
+    """Loading screen shown while the assets of the game are loaded.
+
+    The assets are decoded on a worker thread, see `BackgroundLoader`. Every frame
+    uploads the finished textures to the GPU for at most `UPLOAD_TIME_BUDGET`
+    seconds and draws the progress.
+
+    Parameters
+    ----------
+    window : arcade.Window
+        Window of the view.
+    on_loaded : Callable[[], None]
+        Called once after every asset is loaded.
+    jobs : Sequence[LoadingJob], optional
+        Loading jobs, `game_loading_jobs` by default.
+    """
+
+    def __init__(
+        self,
+        window: arcade.Window,
+        on_loaded: Callable[[], None],
+        jobs: Sequence[LoadingJob] = None,
+    ):
+        super().__init__(window)
+        self.on_loaded = on_loaded
+        self.loader = BackgroundLoader(game_loading_jobs() if jobs is None else jobs)
+        self._loaded = False
+        self._text: arcade.Text = None
+
+    def on_show_view(self):
+        """Start loading the assets."""
+        if self._text is None:
+            self._text = arcade.Text(
+                "Loading",
+                self.window.width / 2,
+                self.window.height / 2 + 20,
+                arcade.color.WHITE,
+                font_size=20,
+                anchor_x="center",
+            )
+        if not self.loader.started:
+            self.loader.start()
+
+    def on_update(self, delta_time: float):
+        """Upload the loaded textures and finish once everything is loaded."""
+        if self._loaded:
+            return
+        self.loader.upload(UPLOAD_TIME_BUDGET, self.window.ctx.default_atlas)
+        if self.loader.done:
+            self._loaded = True
+            self.on_loaded()
+
+    def on_draw(self):
+        """Draw the progress of the loading."""
+        self.clear()
+        self._text.draw()
+        bar_width = self.window.width / 2
+        left = (self.window.width - bar_width) / 2
+        top = self.window.height / 2 - 10
+        arcade.draw_lrtb_rectangle_outline(
+            left, left + bar_width, top, top - 10, arcade.color.WHITE
+        )
+        if self.loader.progress > 0:
+            arcade.draw_lrtb_rectangle_filled(
+                left,
+                left + bar_width * self.loader.progress,
+                top,
+                top - 10,
+                arcade.color.WHITE,
+            )
@@ -0,0 +1,329 @@
+import argparse
+import os.path
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Set, Tuple
+
+import arcade
+
+from omg.assets.registry import get_asset_registry
+from omg.core.clock import FIXED_DELTA_TIME
+from omg.core.scenario import SCENARIOS, Scenario, default_layout, generate_layout
+from omg.entities.elements import get_elements
+from omg.entities.emitter import EMITTER_OWNER, ProjectileEmitter
+from omg.entities.events import (
+    ElementAcquiredEvent,
+    PickupRequestEvent,
+    ProjectileShotEvent,
+)
+from omg.entities.items import Pickupable
+from omg.entities.obstacle import Obstacle
+from omg.entities.player import Player
+from omg.entities.projectile_pool import SkillPools
+from omg.mechanics.broadphase import UniformGrid
+from omg.mechanics.collision import handle_projectile_system_collisions
+from omg.mechanics.physics import PhysicsEngineBoundary
+from omg.mechanics.projectile_system import ProjectileSystem
+from omg.structural.observer import Observer
+from omg.structural.sprite_list import BatchSpriteList
+from omg.utils.profiler import FrameProfiler
+from omg.utils.tracing import get_trace_recorder
+
+
+# TODO: Manage assets in a more generic way
+ASSET_DIR = os.path.join(
+    os.path.join(os.path.dirname(__file__), ".."), "assets", "images"
+)
+COIN_IMAGE_PATH = ":resources:images/items/coinGold.png"
+ARCHER_PATH = str(os.path.join(ASSET_DIR, "characters", "demo_archer", "sprites"))
+OBSTACLE_IMAGE_PATH = os.path.join(ASSET_DIR, "obstacles", "obstacle.PNG")
+
+# player's coordinates are limited to -GAME_MAX_BOUNDS, GAME_MAX_BOUNDS
+GAME_MAX_BOUNDS = 10000
+
+
+class World:
+    """Game state and simulation logic without any rendering.
+
+    The world owns the scene sprite lists, the player, the physics engine and the
+    observer which resolves the gameplay events. Since nothing in here depends on
+    a window, a camera or the mouse, a match can be stepped on machines without a
+    display, e.g. for servers, bots and benchmarks.
+
+    Parameters
+    ----------
+    profiler : FrameProfiler, optional
+        Profiler which times the phases of `update`, disabled by default.
+    """
+
+    def __init__(self, profiler: FrameProfiler = None):
+        self.profiler = FrameProfiler(enabled=False) if profiler is None else profiler
+        self.observer: Observer = None
+        self.player: Player = None
+        self.scene: arcade.Scene = None
+        self.projectiles: ProjectileSystem = None
+        self.physics_engine: PhysicsEngineBoundary = None
+        self.broadphase: UniformGrid = None
+        self.emitters: List[ProjectileEmitter] = []
+        self.emitter_skill_pools: SkillPools = None
+        self.collided_pickupables: List[Pickupable] = []
+        # Obstacles damaged by the ticks since the set was last cleared, e.g. by
+        # the view which draws their health bars
+        self.damaged_obstacles: Set[Obstacle] = set()
+        self.tick: int = 0
+        # Positions of the moving sprites at the start of the latest tick
+        self._previous_positions: Dict[arcade.Sprite, Tuple[float, float]] = {}
+
+    def setup(self, scenario: Scenario = None):
+        """Reset the world state.
+
+        Parameters
+        ----------
+        scenario : Scenario, optional
+            Scenario to generate the obstacles, pickupables and projectile
+            emitters from, the hand-placed layout of the game by default.
+        """
+        layout = (
+            default_layout()
+            if scenario is None
+            else generate_layout(scenario, GAME_MAX_BOUNDS)
+        )
+        self.tick = 0
+        self._previous_positions = {}
+        self.damaged_obstacles = set()
+        # Events are dispatched at the start of every tick, see `update`
+        self.observer = Observer(immediate=False)
+        self.observer.register_batch_handler(
+            ProjectileShotEvent, self._on_projectiles_shot
+        )
+        self.observer.register_handler(PickupRequestEvent, self._on_pickup_request)
+
+        self.player = Player(
+            name="Hero",
+            animation_file=ARCHER_PATH,
+            scale=1.0,
+            initial_angle=0,
+        )
+        self.player.add_observer(self.observer)
+
+        # Create scene
+        self.scene = arcade.Scene()
+
+        self.collided_pickupables = arcade.SpriteList()
+
+        # Add obstacles to the scene
+        obstacle_texture = get_asset_registry().load_texture(OBSTACLE_IMAGE_PATH)
+        self.scene.add_sprite_list("Obstacles", use_spatial_hash=True)
+        for x, y, health in layout.obstacles:
+            obstacle = Obstacle(
+                OBSTACLE_IMAGE_PATH, 0.2, health=health, texture=obstacle_texture
+            )
+            obstacle.center_x = x
+            obstacle.center_y = y
+            self.scene.add_sprite("Obstacles", obstacle)
+
+        # Add pickupables to the scene
+        elements = get_elements()
+        self.scene.add_sprite_list_after(
+            name="Pickupables",
+            after="Obstacles",
+            use_spatial_hash=True,
+        )
+        for x, y, element_name in layout.pickupables:
+            self.scene.add_sprite(
+                "Pickupables",
+                Pickupable(COIN_IMAGE_PATH, 0.5, elements[element_name], x, y),
+            )
+
+        # Emitters shoot from their own pools, they do not use mana
+        self.emitters = layout.emitters
+        self.emitter_skill_pools = SkillPools()
+
+        # Add projectiles to the scene, the scene only draws them. The projectile
+        # system updates them.
+        self.scene.add_sprite_list("Projectiles", sprite_list=BatchSpriteList())
+        self.projectiles = ProjectileSystem(sprite_list=self.scene["Projectiles"])
+
+        # Set up physics engine
+        self.physics_engine = PhysicsEngineBoundary(
+            player_sprite=self.player,
+            walls=self.scene["Obstacles"],
+            boundary_left=-GAME_MAX_BOUNDS,
+            boundary_right=GAME_MAX_BOUNDS,
+            boundary_up=GAME_MAX_BOUNDS,
+            boundary_down=-GAME_MAX_BOUNDS,
+        )
+
+        # Set up broadphase of the projectile - obstacle collisions
+        self.broadphase = UniformGrid()
+
+    def update(self, delta_time: float, aim_x: float, aim_y: float):
+        """Advance the simulation by a single tick.
+
+        The update is divided into two parts:
+
+        First is to update the Sprites individually without taking any
+        interactions with the other Sprites into account.
+
+        The second part is to update the Sprites which have interactions with
+        each other.
+
+        Movement speeds are defined in pixels per tick, hence the world should be
+        stepped with a constant `delta_time` (see `omg.core.clock`) to get
+        results which do not depend on the frame rate.
+
+        The events raised since the previous tick, e.g. by the input handlers,
+        are dispatched before anything moves. Hence no sprite list of the scene
+        changes while it is being iterated.
+
+        Parameters
+        ----------
+        delta_time : float
+            Time passed since the previous tick in seconds.
+        aim_x, aim_y : float
+            Point the player aims at, in world coordinates.
+        """
+        profiler = self.profiler
+        with profiler.phase("observer.flush"):
+            self.observer.flush()
+        self._store_previous_positions()
+
+        # Scene updates sprites individually
+        with profiler.phase("scene.update"):
+            self.scene.update(["Obstacles", "Pickupables"])
+        with profiler.phase("projectiles.update"):
+            self.projectiles.update(delta_time)
+        with profiler.phase("emitters.update"):
+            for emitter in self.emitters:
+                for projectile in emitter.update(delta_time, self.emitter_skill_pools):
+                    self.projectiles.spawn(projectile, owner=EMITTER_OWNER)
+        with profiler.phase("player.update"):
+            self.player.update(aim_x, aim_y, delta_time)
+
+        # Update behaviour between the player and the pickupables
+        with profiler.phase("pickup_collisions"):
+            self.collided_pickupables = arcade.check_for_collision_with_list(
+                self.player.pickup_sprite, self.scene["Pickupables"]
+            )
+
+        # Update behaviour between the player and the obstacles
+        with profiler.phase("physics_engine.update"):
+            self.physics_engine.update()
+
+        # Update behaviour between the projectiles and the obstacles. The grid
+        # treats the obstacles as static: moved obstacles are binned again when
+        # it is updated, but an obstacle which rotates or resizes in place must
+        # be passed to `self.broadphase.mark_moved`.
+        with profiler.phase("handle_projectile_collisions"):
+            self.damaged_obstacles.update(
+                handle_projectile_system_collisions(
+                    self.projectiles, self.scene["Obstacles"], self.broadphase
+                )
+            )
+            # Remove the projectiles which missed
+            self.projectiles.cull(GAME_MAX_BOUNDS)
+
+        self.tick += 1
+
+    def _store_previous_positions(self):
+        # Projectile system keeps the previous positions of the projectiles
+        self._previous_positions = {self.player: self.player.position}
+
+    @contextmanager
+    def interpolated(self, alpha: float):
+        """Place the moving sprites between their last two ticks while rendering.
+
+        Positions are restored when the context exits, so the simulation state is
+        not affected. Projectile sprites are only a render view of the projectile
+        system, so their positions are not restored.
+
+        Parameters
+        ----------
+        alpha : float
+            Progress from the previous tick (0) to the latest tick (1).
+        """
+        self.projectiles.sync_sprites(alpha)
+        current_positions = {}
+        for sprite, (previous_x, previous_y) in self._previous_positions.items():
+            current_x, current_y = sprite.position
+            current_positions[sprite] = (current_x, current_y)
+            sprite.position = (
+                previous_x + (current_x - previous_x) * alpha,
+                previous_y + (current_y - previous_y) * alpha,
+            )
+        try:
+            yield
+        finally:
+            for sprite, position in current_positions.items():
+                sprite.position = position
+
+    def _on_projectiles_shot(self, events: List[ProjectileShotEvent]):
+        for event in events:
+            self.projectiles.spawn(event.projectile)
+
+    def _on_pickup_request(self, event: PickupRequestEvent):
+        """Handles pickup request of an entity.
+
+        Handling logic:
+        1) Checks pickupables in the environment with the current posiiton of the entity
+           requesting a pickup.
+        2) Pickup area is indicated with the hitbox of the event.entity_pickup_sprite
+           so collision check can be used.
+        3) Out of all the collisions, let the entity pick up the closest object.
+        4) Remove the picked up item from the ground.
+        5) Publish the acquired item, e.g. for the HUD.
+        """
+        collided_sprites: list[Pickupable] = arcade.check_for_collision_with_list(
+            event.entity_pickup_sprite, self.scene["Pickupables"]
+        )
+        if len(collided_sprites) >= 1:
+            # Item is at pick up range
+            closes_pickupable: Pickupable = arcade.get_closest_sprite(
+                event.entity_pickup_sprite, collided_sprites
+            )[0]
+            item_to_add = closes_pickupable.item
+            item_manager = event.entity
+            item_manager.add_item(item_to_add)
+            # remove reference to the pickupables list
+            closes_pickupable.remove_from_sprite_lists()
+            self.observer.on_event(ElementAcquiredEvent(item_manager, item_to_add))
+
+
+def main():
+    """Step a headless world and report the simulation throughput."""
+    parser = argparse.ArgumentParser(description="Run the game without a window.")
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--delta-time", type=float, default=FIXED_DELTA_TIME)
+    parser.add_argument(
+        "--trace", metavar="PATH", help="Write a trace of the ticks to a file."
+    )
+    parser.add_argument(
+        "--scenario",
+        choices=sorted(SCENARIOS),
+        help="Generate the entities, the hand-placed layout by default.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # The phases of a tick are only recorded by an enabled profiler
+    world = World(profiler=FrameProfiler() if args.trace else None)
+    scenario = None
+    if args.scenario:
+        scenario = SCENARIOS[args.scenario]._replace(seed=args.seed)
+    world.setup(scenario)
+    tracer = get_trace_recorder()
+    if args.trace:
+        tracer.start()
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        with tracer.span("tick"):
+            world.update(args.delta_time, world.player.center_x, world.player.center_y)
+    elapsed = time.perf_counter() - start
+    print(f"{args.ticks} ticks in {elapsed:.3f} s ({args.ticks / elapsed:.0f} ticks/s)")
+    if args.trace:
+        tracer.stop()
+        print(f"Trace written to {tracer.dump(args.trace)}")
+
+
+if __name__ == "__main__":
+    main()
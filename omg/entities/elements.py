@@ -1,8 +1,20 @@
 import os
-import json
+from functools import lru_cache
 from typing import Dict
 
+from omg.assets.content_pack import load_data
+
 ELEMENTS_JSON_DIR = os.path.join(os.path.dirname(__file__), "Elements.JSON")
 
-with open(ELEMENTS_JSON_DIR, "r") as file:
-    ELEMENTS: Dict[str, Dict] = json.load(file)
+
+@lru_cache(maxsize=None)
+def get_elements() -> Dict[str, Dict]:
+    """Return the element data, it is loaded on the first call."""
+    return load_data(ELEMENTS_JSON_DIR)
+
+
+def __getattr__(name: str):
+    # `ELEMENTS` is loaded on first access instead of on import
+    if name == "ELEMENTS":
+        return get_elements()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,67 @@
+from typing import List
+
+from omg.entities.projectile import Projectile
+from omg.entities.projectile_pool import SkillPools
+
+# Owner id of the emitted projectiles, the player is 0
+EMITTER_OWNER = 1
+
+
+class ProjectileEmitter:
+    """Stationary source of projectiles, e.g. a turret.
+
+    The emitter shoots a crafted skill every `interval` seconds and turns by
+    `turn_angle` degrees after every shot.
+
+    Parameters
+    ----------
+    center_x, center_y : float
+        Position of the emitter.
+    skill_name : str
+        Crafted skill to shoot, see `CraftedSkills.JSON`.
+    interval : float
+        Time between two shots in seconds, it must be positive.
+    angle : float
+        Angle of the first shot in degrees.
+    turn_angle : float
+        Angle the emitter turns by after every shot in degrees.
+
+    Raises
+    ------
+    ValueError
+        If the interval is not positive, since the emitter would shoot endlessly
+        in a single update.
+    """
+
+    def __init__(
+        self,
+        center_x: float,
+        center_y: float,
+        skill_name: str,
+        interval: float = 1.0,
+        angle: float = 0.0,
+        turn_angle: float = 0.0,
+    ):
+        if not interval > 0:
+            raise ValueError(f"Emitter interval must be positive, got {interval}")
+        self.center_x = center_x
+        self.center_y = center_y
+        self.skill_name = skill_name
+        self.interval = interval
+        self.angle = angle
+        self.turn_angle = turn_angle
+        self.timer = 0.0
+
+    def update(self, delta_time: float, skill_pools: SkillPools) -> List[Projectile]:
+        """Advance the timer of the emitter and return the projectiles it shot."""
+        self.timer += delta_time
+        shots = []
+        while self.timer >= self.interval:
+            self.timer -= self.interval
+            shots.append(
+                skill_pools.get(self.skill_name).acquire(
+                    init_px=self.center_x, init_py=self.center_y, angle=self.angle
+                )
+            )
+            self.angle = (self.angle + self.turn_angle) % 360
+        return shots
@@ -9,7 +9,6 @@ class PickupRequestEvent(Event):
     """Event triggered when an entity wants to pick up an item from the ground."""
 
     def __init__(self, entity, entity_pickup_sprite):
-        super().__init__("pickup_request")
         self.entity: ItemManager = entity
         self.entity_pickup_sprite: arcade.Sprite = entity_pickup_sprite
 
@@ -18,7 +17,6 @@ class ProjectileShotEvent(Event):
     """Event triggered when a projectile is shot by an entity."""
 
     def __init__(self, projectile: Projectile):
-        super().__init__("projectile_shot")
         self.projectile = projectile
 
 
@@ -26,5 +24,26 @@ class PickupButtonKeyChangeRequestEvent(Event):
     """Event triggered when a pickup button key is changed."""
 
     def __init__(self, key: arcade.key):
-        super().__init__("pickup_button_key_change")
         self.key = key
+
+
+class ElementAcquiredEvent(Event):
+    """Event triggered when an entity acquires a new element."""
+
+    def __init__(self, elements: ItemManager, element: dict):
+        self.elements = elements
+        self.element = element
+
+
+class ElementSelectedEvent(Event):
+    """Event triggered when the selected element of an entity changes."""
+
+    def __init__(self, elements: ItemManager):
+        self.elements = elements
+
+
+class CraftedSkillSlotsChangedEvent(Event):
+    """Event triggered when a skill is crafted into the skill slots of an entity."""
+
+    def __init__(self, crafted_skill_slots: list):
+        self.crafted_skill_slots = crafted_skill_slots
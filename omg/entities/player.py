@@ -1,17 +1,18 @@
-from typing import Dict, TypeVar, Union
+from typing import Dict, Iterable, Type, TypeVar, Union
 
 import arcade
 import arcade.key
 
 from omg.entities.events import (
+    CraftedSkillSlotsChangedEvent,
+    ElementSelectedEvent,
     PickupRequestEvent,
-    ProjectileShotEvent,
     PickupButtonKeyChangeRequestEvent,
 )
 from omg.entities.items import CircularBuffer
-from omg.entities.projectile import SkillFactory, crafted_skill_dictionary
+from omg.entities.projectile_pool import SkillPools
 from omg.mechanics import movement
-from omg.structural.observer import ObservableSprite
+from omg.structural.observer import Event, Observable, ObservableSprite, Observer
 
 
 from omg.mechanics.animations import Animations
@@ -94,7 +95,21 @@ class Player(ObservableSprite):
         self.to_be_combined_element_buffer: list[str] = []
         # Initialize crafted skill slots as None
         self.crafted_skill_slots: list[str] = [None, None]
-        self.crafted_skill = SkillFactory()
+        self.skill_pools = SkillPools()
+
+    def add_observer(
+        self, observer: Observer, event_types: Iterable[Type[Event]] = None
+    ):
+        """Add an observer to the player and to its elements."""
+        if event_types is not None:
+            event_types = tuple(event_types)  # Used twice
+        super().add_observer(observer, event_types)
+        self.elements.add_observer(observer, event_types)
+
+    def remove_observer(self, observer: Observer):
+        """Remove an observer from the player and from its elements."""
+        super().remove_observer(observer)
+        self.elements.remove_observer(observer)
 
     @property
     def pickup_button_key(self):
@@ -149,6 +164,7 @@ class Player(ObservableSprite):
         """Update crafted skill slots after combining elements."""
         self.crafted_skill_slots[1] = self.crafted_skill_slots[0]
         self.crafted_skill_slots[0] = new_skill
+        self.notify_observers(CraftedSkillSlotsChangedEvent(self.crafted_skill_slots))
 
     def update(self, mouse_x, mouse_y, delta_time):
         """Update the sprite."""
@@ -185,24 +201,19 @@ class Player(ObservableSprite):
 
     def shoot(self, skill_name: str):
         """Shoot a projectile and inform the observers."""
-        skill_attributes: dict = crafted_skill_dictionary.get(skill_name, None)
-        if skill_attributes:
-            self.crafted_skill.set_skill_attributes(skill_attributes)
-        else:
+        skill_pool = self.skill_pools.get(skill_name)
+        if skill_pool is None:
             return
 
-        mana_cost = self.crafted_skill.mana_cost
+        mana_cost = skill_pool.mana_cost
         if self.current_mana < mana_cost:
             return
 
         self.current_mana -= mana_cost
-        projectile = self.crafted_skill.create(
+        projectile = skill_pool.acquire(
             init_px=self.center_x, init_py=self.center_y, angle=self.shoot_angle
-
         )
-
-        projectile_event = ProjectileShotEvent(projectile)
-        self.notify_observers(projectile_event)
+        self.notify_observers(projectile.shot_event)
 
     def _regenerate_mana(self, delta_time):
         self.mana_regen_cooldown += delta_time
@@ -224,60 +235,36 @@ class Player(ObservableSprite):
         self.movement_logic.key_left = left
         self.movement_logic.key_right = right
 
-    def draw(self):
-        """Draw the sprite."""
-        super().draw()
-        self._draw_health_bar()
-        self._draw_mana_bar()
-
-    def _draw_health_bar(self):
-        health_bar_width = 50
-        health_bar_height = 5
-        health_bar_x = self.center_x
-        health_bar_y = self.center_y + self.height / 2 + 10
-        arcade.draw_rectangle_filled(
-            health_bar_x,
-            health_bar_y,
-            health_bar_width,
-            health_bar_height,
-            arcade.color.RED,
-        )
-        current_health_width = health_bar_width * (
-            self.current_health / self.max_health
-        )
-        arcade.draw_rectangle_filled(
-            health_bar_x - (health_bar_width - current_health_width) / 2,
-            health_bar_y,
-            current_health_width,
-            health_bar_height,
-            arcade.color.GREEN,
-        )
 
-    def _draw_mana_bar(self):
-        mana_bar_width = 50
-        mana_bar_height = 5
-        mana_bar_x = self.center_x
-        mana_bar_y = (
-            self.center_y + self.height / 2 + 2
-        )  # Slightly below the health bar
-        arcade.draw_rectangle_filled(
-            mana_bar_x,
-            mana_bar_y,
-            mana_bar_width,
-            mana_bar_height,
-            arcade.color.DARK_BLUE,
-        )
-        current_mana_width = mana_bar_width * (self.current_mana / self.max_mana)
-        arcade.draw_rectangle_filled(
-            mana_bar_x - (mana_bar_width - current_mana_width) / 2,
-            mana_bar_y,
-            current_mana_width,
-            mana_bar_height,
-            arcade.color.LIGHT_BLUE,
-        )
+class ElementManager(CircularBuffer[Dict[str, Union[str, float]]], Observable):
+    """Manages skills of an entity.
+
+    Observers are notified with an `ElementSelectedEvent` whenever the current
+    element changes.
+    """
+
+    def __init__(self, max_size):
+        CircularBuffer.__init__(self, max_size)
+        Observable.__init__(self)
+
+    def get_next(self):
+        """Get next item and notify the observers."""
+        item = super().get_next()
+        self.notify_observers(ElementSelectedEvent(self))
+        return item
 
+    def get_prev(self):
+        """Get previous item and notify the observers."""
+        item = super().get_prev()
+        self.notify_observers(ElementSelectedEvent(self))
+        return item
 
-class ElementManager(CircularBuffer[Dict[str, Union[str, float]]]):
-    """Manages skills of an entity."""
+    def set_next(self):
+        """Shift current index to the next item and notify the observers."""
+        super().set_next()
+        self.notify_observers(ElementSelectedEvent(self))
 
-    pass
+    def set_prev(self):
+        """Shift current index to the previous item and notify the observers."""
+        super().set_prev()
+        self.notify_observers(ElementSelectedEvent(self))
@@ -1,23 +1,55 @@
 from abc import ABC
+from functools import lru_cache
 from typing import Dict, Union
 import arcade
 import math
 import os
-import json
+
+from omg.assets.content_pack import load_data
 
 CRAFTED_SKILLS_JSON_DIR = os.path.join(os.path.dirname(__file__), "CraftedSkills.JSON")
 
 
 # TODO: add source as the projectiles are emitted now
 class Projectile(arcade.Sprite):
-    """Projectile logic."""
+    """Projectile logic.
+
+    A projectile flies until it hits an obstacle, travels `max_range` pixels or
+    lives for `ttl` seconds. `None` means no limit.
 
-    def __init__(self, name, image_file, scale, damage, speed, init_px, init_py, angle):
-        super().__init__(image_file, scale)
+    Projectiles created by a `ProjectilePool` are recycled: `release` returns them
+    to their pool and `reset` reuses them for a new shot.
+    """
+
+    def __init__(
+        self,
+        name,
+        image_file,
+        scale,
+        damage,
+        speed,
+        init_px,
+        init_py,
+        angle,
+        max_range=None,
+        ttl=None,
+        texture: arcade.Texture = None,
+    ):
+        if texture is None:
+            super().__init__(image_file, scale)
+        else:
+            super().__init__(scale=scale, texture=texture)
         self.image_file = image_file
         self.name = name
         self.damage = damage
         self.speed = speed
+        self.max_range = max_range
+        self.ttl = ttl
+        self.pool = None  # Pool to return to, if the projectile is recycled
+        self.reset(init_px, init_py, angle)
+
+    def reset(self, init_px, init_py, angle):
+        """Place the projectile for a new shot without creating a new sprite."""
         # Set position + orientation
         self.center_x = init_px
         self.center_y = init_py
@@ -27,6 +59,11 @@ class Projectile(arcade.Sprite):
         self.change_x = self.speed * math.cos(angle_rad)
         self.change_y = self.speed * math.sin(angle_rad)
 
+    def release(self):
+        """Return the projectile to its pool once it is removed from the game."""
+        if self.pool is not None:
+            self.pool.release(self)
+
 
 class ProjectileFactory(ABC):
     """Abstract base class for projectile factories."""
@@ -38,8 +75,10 @@ class ProjectileFactory(ABC):
         self.damage: float = None
         self.speed: float = None
         self.mana_cost: float = None
+        self.max_range: float = None
+        self.ttl: float = None
 
-    def create(self, init_px, init_py, angle) -> Projectile:
+    def create(self, init_px, init_py, angle, texture=None) -> Projectile:
         """Create a projectile with class-specific attributes."""
         return Projectile(
             name=self.name,
@@ -50,11 +89,23 @@ class ProjectileFactory(ABC):
             init_py=init_py,
             speed=self.speed,
             angle=angle,
+            max_range=self.max_range,
+            ttl=self.ttl,
+            texture=texture,
         )
 
 
-with open(CRAFTED_SKILLS_JSON_DIR, "r") as file:
-    crafted_skill_dictionary: Dict[str, Dict] = json.load(file)
+@lru_cache(maxsize=None)
+def get_crafted_skills() -> Dict[str, Dict]:
+    """Return the crafted skill data, it is loaded on the first call."""
+    return load_data(CRAFTED_SKILLS_JSON_DIR)
+
+
+def __getattr__(name: str):
+    # `crafted_skill_dictionary` is loaded on first access instead of on import
+    if name == "crafted_skill_dictionary":
+        return get_crafted_skills()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SkillFactory(ProjectileFactory):
@@ -67,6 +118,8 @@ class SkillFactory(ProjectileFactory):
         self.damage = None
         self.speed = None
         self.mana_cost = None
+        self.max_range = None
+        self.ttl = None
 
     def set_skill_attributes(self, skill_attributes: Dict[str, Union[str, float]]):
         """Set the skill attributes."""
@@ -76,3 +129,5 @@ class SkillFactory(ProjectileFactory):
         self.damage = skill_attributes["damage"]
         self.speed = skill_attributes["speed"]
         self.mana_cost = skill_attributes["mana_cost"]
+        self.max_range = skill_attributes.get("max_range")
+        self.ttl = skill_attributes.get("ttl")
@@ -0,0 +1,84 @@
+from typing import Dict, List, Union
+
+from omg.assets.registry import get_asset_registry
+from omg.entities.events import ProjectileShotEvent
+from omg.entities.projectile import (
+    Projectile,
+    SkillFactory,
+    get_crafted_skills,
+)
+
+
+class ProjectilePool:
+    """Recycles the projectiles of a single skill.
+
+    The skill attributes and the texture are bound once when the pool is created.
+    Every projectile owns the `ProjectileShotEvent` which announces it, so
+    shooting with a warm pool creates neither sprites nor events.
+
+    Parameters
+    ----------
+    skill_attributes : Dict[str, Union[str, float]]
+        Attributes of the skill, see `CraftedSkills.JSON`.
+    """
+
+    def __init__(self, skill_attributes: Dict[str, Union[str, float]]):
+        self.factory = SkillFactory()
+        self.factory.set_skill_attributes(skill_attributes)
+        # Image paths of the skills may differ in case from the files
+        self.texture = get_asset_registry().load_texture(self.factory.image_file)
+        self._free: List[Projectile] = []
+        self.n_created = 0
+
+    @property
+    def mana_cost(self) -> float:
+        """Define self.mana_cost of the skill."""
+        return self.factory.mana_cost
+
+    @property
+    def n_free(self) -> int:
+        """Define self.n_free, the number of projectiles ready to be reused."""
+        return len(self._free)
+
+    def _create(self) -> Projectile:
+        projectile = self.factory.create(0, 0, 0, texture=self.texture)
+        projectile.pool = self
+        projectile.shot_event = ProjectileShotEvent(projectile)
+        self.n_created += 1
+        return projectile
+
+    def prefill(self, n_projectiles: int):
+        """Create projectiles up front, e.g. while loading."""
+        for _ in range(n_projectiles):
+            self._free.append(self._create())
+
+    def acquire(self, init_px, init_py, angle) -> Projectile:
+        """Get a projectile placed for a new shot."""
+        projectile = self._free.pop() if self._free else self._create()
+        projectile.reset(init_px, init_py, angle)
+        return projectile
+
+    def release(self, projectile: Projectile):
+        """Take back a projectile which is removed from the game."""
+        self._free.append(projectile)
+
+
+class SkillPools:
+    """Projectile pools keyed by the crafted skill name.
+
+    Pools are created on the first shot of each skill.
+    """
+
+    def __init__(self, skills: Dict[str, Dict] = None):
+        self._skills = get_crafted_skills() if skills is None else skills
+        self._pools: Dict[str, ProjectilePool] = {}
+
+    def get(self, skill_name: str) -> ProjectilePool:
+        """Return the pool of a skill or None if the skill does not exist."""
+        pool = self._pools.get(skill_name)
+        if pool is None:
+            skill_attributes = self._skills.get(skill_name)
+            if skill_attributes is None:
+                return None
+            pool = self._pools[skill_name] = ProjectilePool(skill_attributes)
+        return pool
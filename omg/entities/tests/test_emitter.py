@@ -0,0 +1,35 @@
+import unittest
+
+from omg.entities.emitter import ProjectileEmitter
+from omg.entities.projectile_pool import SkillPools
+from omg.entities.tests.test_projectile_pool import TEST_SKILL
+
+
+class TestProjectileEmitter(unittest.TestCase):
+
+    def setUp(self):
+        self.skill_pools = SkillPools({"TestBall": TEST_SKILL})
+        self.emitter = ProjectileEmitter(
+            10, 20, "TestBall", interval=0.5, angle=350, turn_angle=20
+        )
+
+    def test_shoots_every_interval(self):
+        self.assertEqual(self.emitter.update(0.4, self.skill_pools), [])
+        (projectile,) = self.emitter.update(0.2, self.skill_pools)
+        self.assertEqual(projectile.position, (10, 20))
+        self.assertEqual(projectile.angle, 350)
+        self.assertAlmostEqual(self.emitter.timer, 0.1)
+
+    def test_turns_after_every_shot(self):
+        projectiles = self.emitter.update(1.0, self.skill_pools)
+        self.assertEqual([projectile.angle for projectile in projectiles], [350, 10])
+        self.assertEqual(self.emitter.angle, 30)
+
+    def test_interval_must_be_positive(self):
+        for interval in (0, -1):
+            with self.assertRaises(ValueError):
+                ProjectileEmitter(0, 0, "TestBall", interval=interval)
+
+
+if __name__ == "__main__":
+    unittest.main()
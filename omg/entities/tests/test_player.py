@@ -2,7 +2,8 @@ import unittest
 from unittest.mock import patch, MagicMock, call
 from venv import create
 import arcade
-from omg.entities.player import CircularBuffer, Player
+from omg.entities.events import ElementSelectedEvent
+from omg.entities.player import CircularBuffer, ElementManager, Player
 from omg.entities.tests import TEST_IMAGE_FILE
 
 class TestPlayer(unittest.TestCase):
@@ -63,66 +64,23 @@ class TestPlayer(unittest.TestCase):
         self.player._regenerate_mana(delta_time=1.5)
         self.assertEqual(self.player.current_mana, 55)
 
-    def test_draw(self):
-        with patch('arcade.Sprite.draw') as mock_draw, \
-             patch.object(self.player, '_draw_health_bar') as mock_draw_health_bar, \
-             patch.object(self.player, '_draw_mana_bar') as mock_draw_mana_bar:
-            self.player.draw()
-            mock_draw.assert_called_once()
-            mock_draw_health_bar.assert_called_once()
-            mock_draw_mana_bar.assert_called_once()
+class TestElementManager(unittest.TestCase):
 
-    def test_draw_health_bar(self):
-        with patch('arcade.draw_rectangle_filled') as mock_draw_rectangle_filled:
-            self.player._draw_health_bar()
-            health_bar_width = 50
-            health_bar_height = 5
-            health_bar_x = self.player.center_x
-            health_bar_y = self.player.center_y + self.player.height / 2 + 10
-            current_health_width = health_bar_width * (self.player.current_health / self.player.max_health)
-            calls = [
-                call(
-                    health_bar_x,
-                    health_bar_y,
-                    health_bar_width,
-                    health_bar_height,
-                    arcade.color.RED,
-                ),
-                call(
-                    health_bar_x - (health_bar_width - current_health_width) / 2,
-                    health_bar_y,
-                    current_health_width,
-                    health_bar_height,
-                    arcade.color.GREEN,
-                )
-            ]
-            mock_draw_rectangle_filled.assert_has_calls(calls, any_order=True)
+    def test_selection_change_notifies_observers(self):
+        elements = ElementManager(3)
+        observer = MagicMock()
+        elements.add_observer(observer)
+        elements.add_item({"name": "Fire"})
+        elements.add_item({"name": "Ice"})
+        observer.on_event.assert_not_called()
 
-    def test_draw_mana_bar(self):
-        with patch('arcade.draw_rectangle_filled') as mock_draw_rectangle_filled:
-            self.player._draw_mana_bar()
-            mana_bar_width = 50
-            mana_bar_height = 5
-            mana_bar_x = self.player.center_x
-            mana_bar_y = self.player.center_y + self.player.height / 2 + 2
-            current_mana_width = mana_bar_width * (self.player.current_mana / self.player.max_mana)
-            calls = [
-                call(
-                    mana_bar_x,
-                    mana_bar_y,
-                    mana_bar_width,
-                    mana_bar_height,
-                    arcade.color.DARK_BLUE,
-                ),
-                call(
-                    mana_bar_x - (mana_bar_width - current_mana_width) / 2,
-                    mana_bar_y,
-                    current_mana_width,
-                    mana_bar_height,
-                    arcade.color.LIGHT_BLUE,
-                )
-            ]
-            mock_draw_rectangle_filled.assert_has_calls(calls, any_order=True)
+        elements.set_next()
+        elements.set_prev()
+
+        self.assertEqual(observer.on_event.call_count, 2)
+        event = observer.on_event.call_args[0][0]
+        self.assertIsInstance(event, ElementSelectedEvent)
+        self.assertIs(event.elements, elements)
 
 if __name__ == "__main__":
     unittest.main()
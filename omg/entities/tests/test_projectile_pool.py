@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import MagicMock
+
+from omg.entities.events import ProjectileShotEvent
+from omg.entities.projectile_pool import ProjectilePool, SkillPools
+from omg.entities.tests import TEST_IMAGE_FILE
+
+TEST_SKILL = {
+    "name": "TestBall",
+    "image_file": TEST_IMAGE_FILE,
+    "scale": 0.05,
+    "damage": 15,
+    "speed": 7,
+    "mana_cost": 20,
+    "max_range": 800,
+    "ttl": 3.0,
+}
+
+
+class TestProjectilePool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ProjectilePool(TEST_SKILL)
+
+    def test_acquire(self):
+        projectile = self.pool.acquire(init_px=10, init_py=20, angle=0)
+
+        self.assertEqual(projectile.name, "TestBall")
+        self.assertEqual(projectile.damage, 15)
+        self.assertEqual(projectile.max_range, 800)
+        self.assertEqual(projectile.position, (10, 20))
+        self.assertIs(projectile.texture, self.pool.texture)
+        self.assertIsInstance(projectile.shot_event, ProjectileShotEvent)
+        self.assertIs(projectile.shot_event.projectile, projectile)
+
+    def test_skill_without_limits(self):
+        skill = {
+            key: value
+            for key, value in TEST_SKILL.items()
+            if key not in ("max_range", "ttl")
+        }
+        projectile = ProjectilePool(skill).acquire(init_px=0, init_py=0, angle=0)
+
+        self.assertIsNone(projectile.max_range)
+        self.assertIsNone(projectile.ttl)
+
+    def test_release_recycles(self):
+        projectile = self.pool.acquire(init_px=10, init_py=20, angle=0)
+        event = projectile.shot_event
+        projectile.release()
+        self.assertEqual(self.pool.n_free, 1)
+
+        recycled = self.pool.acquire(init_px=-5, init_py=5, angle=90)
+
+        self.assertIs(recycled, projectile)
+        self.assertIs(recycled.shot_event, event)
+        self.assertEqual(recycled.position, (-5, 5))
+        self.assertAlmostEqual(recycled.change_x, -7)
+        self.assertEqual(self.pool.n_created, 1)
+
+    def test_prefill(self):
+        self.pool.prefill(8)
+        for _ in range(8):
+            self.pool.acquire(0, 0, 0)
+        self.assertEqual(self.pool.n_created, 8)
+
+
+class TestSkillPools(unittest.TestCase):
+
+    def test_get(self):
+        pools = SkillPools({"Test": TEST_SKILL})
+        pool = pools.get("Test")
+        self.assertIsInstance(pool, ProjectilePool)
+        self.assertIs(pools.get("Test"), pool)
+        self.assertIsNone(pools.get("Unknown"))
+
+    def test_shoot_reuses_projectiles(self):
+        pools = SkillPools({"Test": TEST_SKILL})
+        observer = MagicMock()
+        for _ in range(3):
+            projectile = pools.get("Test").acquire(0, 0, 0)
+            observer.on_event(projectile.shot_event)
+            projectile.release()
+        self.assertEqual(pools.get("Test").n_created, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,45 +1,120 @@
-import os
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, Tuple
 
 import arcade
 
+from omg.assets.atlas import load_atlas
+from omg.assets.content_pack import load_texture
+from omg.assets.frames import index_frame_files
 
-class Animation():
-    """Class to represent a single type of animation."""
-
-    def __init__(self, path: str, action: str):
-        self._my_hidden_dict = dict[str, list[list, int, int]]
-        self.textures: dict[str, list] = {}
-        self.counters: dict[str, int] = {}
-        self._number_of_textures: dict[str, int] = {}
-
-        directions = ['up', 'down', 'left', 'right']
-        for direction in directions:
-            self.textures[direction] = []
-            self.counters[direction] = 0
-
-            for file_name in os.listdir(path):
-                # print(file_name)
-                if file_name.startswith(f'{action}_{direction}') and (
-                    file_name.endswith('.png')
-                ):
-                    image_path = os.path.join(path, file_name)
-                    # image = Image.open(image_path)
-                    self.textures[direction].append(arcade.load_texture(image_path))
-
-            self._number_of_textures[direction] = len(self.textures[direction])
-
-    def get_next_texture(self, direction: str) -> Tuple[arcade.Texture, bool]:
-        """Get next texture."""
-        current_texture = self.textures[direction][self.counters[direction]]
-        self.counters[direction] += 1
-        if self.counters[direction] >= self._number_of_textures[direction]:
-            # Animation reached its final texture, reset the counter to the first image
-            self._reset_index(direction)
-            return current_texture, True
-        else:
-            # Animation has not reached its final texture yet
-            return current_texture, False
+# Action shown in place of an action which has no frames in a direction
+FALLBACK_ACTION = "idle"
+
+
+class AnimationLibrary:
+    """Frames of every animation in a sprite directory.
+
+    A library holds the immutable frame data only. It is shared by every entity
+    animated from the same directory (see `get_animation_library`), the state of an
+    entity lives in its `AnimationCursor`.
+
+    Textures are cut out of the atlas of the sprite directory if it has been built
+    (see `omg.assets.atlas`), otherwise every frame is loaded from its own file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        atlas = load_atlas(path)
+        if atlas is None:
+            atlas = {
+                action: {
+                    direction: [load_texture(image_path) for image_path in paths]
+                    for direction, paths in directions.items()
+                }
+                for action, directions in index_frame_files(path).items()
+            }
+        self._frames: Dict[str, Dict[str, Tuple[arcade.Texture, ...]]] = {
+            action: {
+                direction: tuple(textures) for direction, textures in directions.items()
+            }
+            for action, directions in atlas.items()
+        }
+
+    @property
+    def actions(self) -> Tuple[str, ...]:
+        """Define self.actions, the names of the animated actions."""
+        return tuple(self._frames)
+
+    def frames(self, action: str, direction: str) -> Tuple[arcade.Texture, ...]:
+        """Return the frames of an action facing the given direction, in order."""
+        return self._frames.get(action, {}).get(direction, ())
+
+    def fallback_texture(self, direction: str) -> arcade.Texture:
+        """Return the texture of an action which has no frames in a direction.
+
+        It is the first frame of the fallback action facing the direction if
+        there is one, otherwise the first frame of the library.
+
+        Raises
+        ------
+        ValueError
+            If the library has no frames at all.
+        """
+        frames = self.frames(FALLBACK_ACTION, direction)
+        if frames:
+            return frames[0]
+        for directions in self._frames.values():
+            for textures in directions.values():
+                if textures:
+                    return textures[0]
+        raise ValueError(f"No animation frames in {self.path}")
 
-    def _reset_index(self, direction: str):
-        self.counters[direction] = 0
+
+@lru_cache(maxsize=None)
+def get_animation_library(path: str) -> AnimationLibrary:
+    """Return the shared animation library of a sprite directory."""
+    return AnimationLibrary(path)
+
+
+class AnimationCursor:
+    """Animation state of a single entity.
+
+    Parameters
+    ----------
+    state : str
+        Action being animated, e.g. "walk".
+    direction : str
+        Direction the entity is facing.
+    """
+
+    __slots__ = ("state", "direction", "frame_index", "timer")
+
+    def __init__(self, state: str, direction: str):
+        self.state = state
+        self.direction = direction
+        self.frame_index = 0
+        self.timer = 0.0
+
+    def next_texture(self, library: AnimationLibrary) -> Tuple[arcade.Texture, bool]:
+        """Get the current texture and move to the next frame.
+
+        An action which has no frames in the direction, e.g. of a sprite sheet
+        missing a direction, shows the fallback texture of the library and
+        finishes at once.
+
+        Returns
+        -------
+        Tuple[arcade.Texture, bool]
+            Current texture and whether it was the final frame of the animation.
+        """
+        frames = library.frames(self.state, self.direction)
+        if not frames:
+            self.frame_index = 0
+            return library.fallback_texture(self.direction), True
+        current_texture = frames[self.frame_index % len(frames)]
+        self.frame_index += 1
+        if self.frame_index >= len(frames):
+            # Animation reached its final texture, restart from the first image
+            self.frame_index = 0
+            return current_texture, True
+        return current_texture, False
@@ -1,4 +1,8 @@
-from omg.mechanics.animation import Animation
+from omg.mechanics.animation import (
+    AnimationCursor,
+    AnimationLibrary,
+    get_animation_library,
+)
 
 # Movement speed of player, in pixels per frame
 PLAYER_MOVEMENT_SPEED = 3
@@ -22,7 +26,11 @@ LEFT_FACING = 'left'
 
 
 class Animations():
-    """Class to manage a group of animations."""
+    """Class to manage a group of animations.
+
+    The frames are shared with every other entity animated from the same
+    `animation_file`, only the cursor into them belongs to this entity.
+    """
 
     def __init__(self, animation_file, slash_key, cast_key, thrust_key, shoot_key):
 
@@ -33,27 +41,14 @@ class Animations():
             shoot_key: SHOOT,
         }
 
-        self._player_state = IDLE
-        self.character_face_direction = DOWN_FACING
-        self.player_texture = ""
-
-        animation_types = [
-            "idle",
-            "walk",
-            "slash",
-            "spellcast",
-            "thrust",
-            "shoot",
-            "die"
-        ]
-        self.all_animations = {}
-        for action in animation_types:
-            self.all_animations[action] = Animation(animation_file, action)
+        self.library: AnimationLibrary = get_animation_library(animation_file)
+        self.cursor = AnimationCursor(IDLE, DOWN_FACING)
+        # Start from the first idle frame so that the texture is valid before the
+        # first animation tick elapses
+        self.player_texture = self.library.frames(IDLE, DOWN_FACING)[0]
 
         self.active_direction = "down"
 
-        self.animation_timer = 0
-
         # Key states
         self.w_pressed = False
         self.a_pressed = False
@@ -66,6 +61,35 @@ class Animations():
         # Action finish checker
         self.action_finished = 0
 
+    @property
+    def _player_state(self) -> str:
+        return self.cursor.state
+
+    @_player_state.setter
+    def _player_state(self, state: str):
+        if state != self.cursor.state:
+            # A new action starts from its first frame
+            self.cursor.state = state
+            self.cursor.frame_index = 0
+
+    @property
+    def character_face_direction(self) -> str:
+        """Define self.character_face_direction, the direction of the cursor."""
+        return self.cursor.direction
+
+    @character_face_direction.setter
+    def character_face_direction(self, direction: str):
+        self.cursor.direction = direction
+
+    @property
+    def animation_timer(self) -> float:
+        """Define self.animation_timer, the time since the latest frame change."""
+        return self.cursor.timer
+
+    @animation_timer.setter
+    def animation_timer(self, timer: float):
+        self.cursor.timer = timer
+
     def update(self, delta_time, player_change_x, player_change_y, is_moving):
         """Update logic."""
         self._is_moving = is_moving
@@ -93,9 +117,8 @@ class Animations():
         self.animation_timer += delta_time
 
         if self.animation_timer > ANIMATION_SPEED:
-            current_animation: Animation = self.all_animations[self._player_state]
-            self.player_texture, is_animation_finished = (
-                current_animation.get_next_texture(self.character_face_direction)
+            self.player_texture, is_animation_finished = self.cursor.next_texture(
+                self.library
             )
 
             if is_animation_finished:
@@ -0,0 +1,191 @@
+from typing import Dict, List, Tuple
+
+import arcade
+import numpy as np
+
+from omg.mechanics.animation import AnimationLibrary
+from omg.mechanics.animations import (
+    ANIMATION_SPEED,
+    DOWN_FACING,
+    IDLE,
+    LEFT_FACING,
+    RIGHT_FACING,
+    UP_FACING,
+)
+
+DIRECTIONS = (UP_FACING, DOWN_FACING, LEFT_FACING, RIGHT_FACING)
+DEFAULT_CAPACITY = 64
+
+
+class BatchAnimator:
+    """Animation cursors of many entities stored as a struct of arrays.
+
+    Every animated entity is a row in the NumPy arrays below, so the animation
+    clocks of all of them are advanced with a single vectorised step instead of a
+    method call per entity. Entities share the frames of one `AnimationLibrary`.
+
+    Parameters
+    ----------
+    library : AnimationLibrary
+        Frames of the animated entities.
+    frame_duration : float
+        Time in seconds after which an animation moves to its next frame.
+    capacity : int
+        Number of rows allocated up front, the arrays grow when they are full.
+
+    Attributes
+    ----------
+    count : int
+        Number of animated entities, i.e. valid rows of the arrays.
+    state, direction : np.ndarray
+        Ids of the animated action and the facing direction.
+    frame_index : np.ndarray
+        Index of the next frame in the animation.
+    timer : np.ndarray
+        Time since the latest frame change in seconds.
+    shown : np.ndarray
+        Id of the texture the entity shows, -1 before its first frame.
+    entities : List[arcade.Sprite]
+        Animated entities, parallel to the arrays.
+    """
+
+    _COLUMNS = ("state", "direction", "frame_index", "timer", "shown")
+
+    def __init__(
+        self,
+        library: AnimationLibrary,
+        frame_duration: float = ANIMATION_SPEED,
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        self.library = library
+        self.frame_duration = frame_duration
+        self._state_ids = {action: i for i, action in enumerate(library.actions)}
+        self._direction_ids = {direction: i for i, direction in enumerate(DIRECTIONS)}
+
+        # Frames of every (state, direction) are a slice of a single texture table
+        self._textures: List[arcade.Texture] = []
+        shape = (len(self._state_ids), len(DIRECTIONS))
+        self._first_frame = np.zeros(shape, dtype=np.int64)
+        self._frame_count = np.zeros(shape, dtype=np.int64)
+        for action, state_id in self._state_ids.items():
+            for direction, direction_id in self._direction_ids.items():
+                frames = library.frames(action, direction)
+                self._first_frame[state_id, direction_id] = len(self._textures)
+                self._frame_count[state_id, direction_id] = len(frames)
+                self._textures.extend(frames)
+
+        self.count = 0
+        self.state = np.zeros(capacity, dtype=np.int64)
+        self.direction = np.zeros(capacity, dtype=np.int64)
+        self.frame_index = np.zeros(capacity, dtype=np.int64)
+        self.timer = np.zeros(capacity)
+        self.shown = np.full(capacity, -1, dtype=np.int64)
+        self.entities: List[arcade.Sprite] = []
+        self._rows: Dict[arcade.Sprite, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of animated entities."""
+        return self.count
+
+    def __contains__(self, entity: arcade.Sprite) -> bool:
+        """Return whether the entity is animated."""
+        return entity in self._rows
+
+    @property
+    def capacity(self) -> int:
+        """Define self.capacity, the number of rows allocated in the arrays."""
+        return len(self.timer)
+
+    def _grow(self, min_capacity: int):
+        capacity = max(min_capacity, 2 * self.capacity)
+        for column in self._COLUMNS:
+            old = getattr(self, column)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, column, new)
+
+    def add(
+        self, entity: arcade.Sprite, state: str = IDLE, direction: str = DOWN_FACING
+    ):
+        """Start animating an entity."""
+        if self.count == self.capacity:
+            self._grow(self.count + 1)
+        row = self.count
+        self.state[row] = self._state_ids[state]
+        self.direction[row] = self._direction_ids[direction]
+        self.frame_index[row] = 0
+        self.timer[row] = 0
+        self.shown[row] = -1
+        self.entities.append(entity)
+        self._rows[entity] = row
+        self.count += 1
+
+    def remove(self, entity: arcade.Sprite):
+        """Stop animating an entity, the last row is moved into its place."""
+        row = self._rows.pop(entity)
+        last = self.count - 1
+        if row != last:
+            for column in self._COLUMNS:
+                array = getattr(self, column)
+                array[row] = array[last]
+            moved_entity = self.entities[last]
+            self.entities[row] = moved_entity
+            self._rows[moved_entity] = row
+        self.entities.pop()
+        self.count -= 1
+
+    def set_state(self, entity: arcade.Sprite, state: str):
+        """Change the animated action, a new action starts from its first frame."""
+        row = self._rows[entity]
+        state_id = self._state_ids[state]
+        if self.state[row] != state_id:
+            self.state[row] = state_id
+            self.frame_index[row] = 0
+
+    def set_direction(self, entity: arcade.Sprite, direction: str):
+        """Change the direction the entity faces."""
+        self.direction[self._rows[entity]] = self._direction_ids[direction]
+
+    def advance(
+        self, delta_time: float
+    ) -> Tuple[List[Tuple[arcade.Sprite, arcade.Texture]], List[arcade.Sprite]]:
+        """Advance the animation clocks of every entity in one step.
+
+        Returns
+        -------
+        Tuple[List[Tuple[arcade.Sprite, arcade.Texture]], List[arcade.Sprite]]
+            Texture swaps, i.e. the entities whose texture has changed together
+            with their new texture, and the entities which have shown the final
+            frame of their animation in this step.
+        """
+        n = self.count
+        timer = self.timer[:n]
+        timer += delta_time
+        state = self.state[:n]
+        direction = self.direction[:n]
+        frame_count = self._frame_count[state, direction]
+        rows = np.flatnonzero((timer > self.frame_duration) & (frame_count > 0))
+        if len(rows) == 0:
+            return [], []
+
+        frame_count = frame_count[rows]
+        frame_index = self.frame_index[rows] % frame_count
+        texture_ids = self._first_frame[state[rows], direction[rows]] + frame_index
+        frame_index += 1
+        finished = frame_index >= frame_count
+        frame_index[finished] = 0
+        self.frame_index[rows] = frame_index
+        timer[rows] = 0
+
+        changed = texture_ids != self.shown[rows]
+        self.shown[rows] = texture_ids
+        entities = self.entities
+        textures = self._textures
+        swaps = [
+            (entities[row], textures[texture_id])
+            for row, texture_id in zip(
+                rows[changed].tolist(), texture_ids[changed].tolist()
+            )
+        ]
+        finished_entities = [entities[row] for row in rows[finished].tolist()]
+        return swaps, finished_entities
@@ -0,0 +1,218 @@
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import arcade
+import numpy as np
+
+Cell = Tuple[int, int]
+Bounds = Tuple[float, float, float, float]  # left, bottom, right, top
+
+
+class UniformGrid:
+    """Uniform grid broadphase between moving sprites and mostly static sprites.
+
+    Static sprites (e.g. obstacles) are binned into the cells their bounding box
+    overlaps. Moving sprites (e.g. projectiles) are looked up with their bounding
+    box, so that only the pairs whose bounding boxes overlap are returned as
+    candidates for the exact, polygon based collision check.
+
+    The binned sprites are treated as static unless they are marked. `update`
+    bins a sprite again when its position changed, but a sprite which rotates or
+    resizes in place has to be passed to `mark_moved`, otherwise its cells are
+    stale and its collisions can be missed.
+
+    Parameters
+    ----------
+    cell_size : float
+        Edge length of a cell in pixels. It should be in the order of the size of
+        the static sprites.
+    """
+
+    def __init__(self, cell_size: float = 128):
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, List[arcade.Sprite]] = defaultdict(list)
+        self._sprite_cells: Dict[arcade.Sprite, List[Cell]] = {}
+        self._sprite_bounds: Dict[arcade.Sprite, Bounds] = {}
+        # Positions of the sprites when they were binned
+        self._sprite_positions: Dict[arcade.Sprite, Tuple[float, float]] = {}
+        # Sprites of the latest update and their positions, in order
+        self._synced_sprites: List[arcade.Sprite] = None
+        self._synced_positions: List[Tuple[float, float]] = None
+        self._occupied_keys: np.ndarray = None  # Sorted keys of non-empty cells
+
+    def __len__(self) -> int:
+        """Return the number of sprites in the grid."""
+        return len(self._sprite_cells)
+
+    def __contains__(self, sprite: arcade.Sprite) -> bool:
+        """Return whether the sprite is in the grid."""
+        return sprite in self._sprite_cells
+
+    def _cells_in(self, bounds: Bounds) -> Iterator[Cell]:
+        left, bottom, right, top = bounds
+        cell_size = self.cell_size
+        cells_x = range(math.floor(left / cell_size), math.floor(right / cell_size) + 1)
+        cells_y = range(math.floor(bottom / cell_size), math.floor(top / cell_size) + 1)
+        for cell_x in cells_x:
+            for cell_y in cells_y:
+                yield cell_x, cell_y
+
+    @staticmethod
+    def _cell_keys(cells_x: np.ndarray, cells_y: np.ndarray) -> np.ndarray:
+        return cells_x.astype(np.int64) * (1 << 32) + cells_y.astype(np.int64)
+
+    def insert(self, sprite: arcade.Sprite):
+        """Add a sprite to the cells its bounding box overlaps."""
+        bounds = (sprite.left, sprite.bottom, sprite.right, sprite.top)
+        cells = list(self._cells_in(bounds))
+        for cell in cells:
+            self._cells[cell].append(sprite)
+        self._sprite_cells[sprite] = cells
+        self._sprite_bounds[sprite] = bounds
+        self._sprite_positions[sprite] = sprite.position
+        self._occupied_keys = None
+        self._synced_sprites = None
+
+    def remove(self, sprite: arcade.Sprite):
+        """Remove a sprite from the grid."""
+        for cell in self._sprite_cells.pop(sprite):
+            sprites_in_cell = self._cells[cell]
+            sprites_in_cell.remove(sprite)
+            if not sprites_in_cell:
+                del self._cells[cell]
+        del self._sprite_bounds[sprite]
+        del self._sprite_positions[sprite]
+        self._occupied_keys = None
+        self._synced_sprites = None
+
+    def update(self, sprites: Iterable[arcade.Sprite]):
+        """Synchronise the grid with the given sprites.
+
+        New sprites are inserted, the missing ones are removed and the ones whose
+        position changed are binned again. If the sprites and their positions are
+        the same as in the previous update, nothing is done beyond comparing two
+        lists, so updating every tick is cheap while the obstacles stay. Rotated
+        or resized sprites are not detected, see `mark_moved`.
+        """
+        sprites = list(sprites)
+        positions = [sprite.position for sprite in sprites]
+        # Compared by identity, sprites do not define equality. Position tuples
+        # of the sprites which did not move are the same objects as well.
+        if sprites == self._synced_sprites and positions == self._synced_positions:
+            return
+        seen = set(sprites)
+        for sprite in [sprite for sprite in self._sprite_cells if sprite not in seen]:
+            self.remove(sprite)
+        sprite_positions = self._sprite_positions
+        for sprite, position in zip(sprites, positions):
+            binned_position = sprite_positions.get(sprite)
+            if binned_position is None:
+                self.insert(sprite)
+            elif binned_position != position:
+                self.remove(sprite)
+                self.insert(sprite)
+        self._synced_sprites = sprites
+        self._synced_positions = positions
+
+    def mark_moved(self, sprite: arcade.Sprite):
+        """Bin a sprite of the grid again after it moved, rotated or resized.
+
+        Moves are also detected by `update`, rotations and resizes are not.
+        """
+        synced_sprites = self._synced_sprites
+        self.remove(sprite)
+        self.insert(sprite)
+        self._synced_sprites = synced_sprites
+
+    def query_pairs(
+        self, sprites: Iterable[arcade.Sprite]
+    ) -> List[Tuple[arcade.Sprite, arcade.Sprite]]:
+        """Return the candidate pairs between the given sprites and the grid.
+
+        A pair is a candidate if the bounding boxes of the sprites overlap. The
+        bounding box of a moving sprite is the square around its bounding circle,
+        so that it does not have to be recalculated for its rotated hit box.
+
+        Parameters
+        ----------
+        sprites : Iterable[arcade.Sprite]
+            Moving sprites, e.g. the projectiles.
+
+        Returns
+        -------
+        List[Tuple[arcade.Sprite, arcade.Sprite]]
+            Pairs of (moving sprite, static sprite), grouped by the moving sprite.
+        """
+        cells = self._cells
+        sprite_bounds = self._sprite_bounds
+        pairs = []
+        for sprite in sprites:
+            radius = math.hypot(sprite.width, sprite.height) / 2
+            left = sprite.center_x - radius
+            bottom = sprite.center_y - radius
+            right = sprite.center_x + radius
+            top = sprite.center_y + radius
+
+            candidates = []
+            for cell in self._cells_in((left, bottom, right, top)):
+                for other in cells.get(cell, ()):
+                    if other in candidates:
+                        continue  # Other sprite spans multiple cells
+                    other_left, other_bottom, other_right, other_top = (
+                        sprite_bounds[other]
+                    )
+                    overlap_x = left <= other_right and other_left <= right
+                    overlap_y = bottom <= other_top and other_bottom <= top
+                    if overlap_x and overlap_y:
+                        candidates.append(other)
+            pairs.extend((sprite, other) for other in candidates)
+        return pairs
+
+    def touches_occupied_cells(
+        self,
+        left: np.ndarray,
+        bottom: np.ndarray,
+        right: np.ndarray,
+        top: np.ndarray,
+    ) -> np.ndarray:
+        """Return which of the boxes touch a cell with at least one sprite.
+
+        This is a vectorised pre-filter for many small moving objects, e.g. the
+        rows of a `ProjectileSystem`. Only the boxes in the returned mask can have
+        candidate pairs, so only those need to be passed to `query_pairs`.
+
+        Parameters
+        ----------
+        left, bottom, right, top : np.ndarray
+            Bounds of the boxes.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of the boxes.
+        """
+        if self._occupied_keys is None:
+            cells = np.array(list(self._cells), dtype=np.int64).reshape(-1, 2)
+            self._occupied_keys = np.sort(self._cell_keys(cells[:, 0], cells[:, 1]))
+        mask = np.zeros(len(left), dtype=bool)
+        if len(self._occupied_keys) == 0:
+            return mask
+
+        cells_left = np.floor(left / self.cell_size)
+        cells_bottom = np.floor(bottom / self.cell_size)
+        cells_right = np.floor(right / self.cell_size)
+        cells_top = np.floor(top / self.cell_size)
+        # Boxes are assumed to be smaller than a cell, so that their corners
+        # cover every cell they touch. Larger boxes are always returned.
+        mask |= (cells_right - cells_left > 1) | (cells_top - cells_bottom > 1)
+        occupied_keys = self._occupied_keys
+        for cells_x in (cells_left, cells_right):
+            for cells_y in (cells_bottom, cells_top):
+                keys = self._cell_keys(cells_x, cells_y)
+                # Binary search in the sorted keys, np.isin would sort them again
+                indices = np.searchsorted(occupied_keys, keys)
+                found = indices < len(occupied_keys)
+                found[found] = occupied_keys[indices[found]] == keys[found]
+                mask |= found
+        return mask
@@ -1,17 +1,92 @@
 import arcade
+import numpy as np
 from typing import List
 from omg.entities.obstacle import Obstacle
 from omg.entities.projectile import Projectile
+from omg.mechanics.broadphase import UniformGrid
+from omg.mechanics.projectile_system import ProjectileSystem
 
 
 def handle_projectile_collisions(
-    projectiles: List[Projectile], obstacles: List[Obstacle]
+    projectiles: List[Projectile],
+    obstacles: List[Obstacle],
+    broadphase: UniformGrid = None,
 ):
-    """Projectile - obstacle collison logic."""
-    for projectile in projectiles:
-        hit_list: List[Obstacle] = arcade.check_for_collision_with_list(
-            projectile, obstacles
-        )
-        for obstacle in hit_list:
+    """Projectile - obstacle collison logic.
+
+    Parameters
+    ----------
+    projectiles : List[Projectile]
+        Projectiles to check.
+    obstacles : List[Obstacle]
+        Obstacles which take damage from the projectiles.
+    broadphase : UniformGrid, optional
+        Grid of the obstacles. If given, it is synchronised with the obstacles and
+        only the candidate pairs it returns are checked with the hit box
+        polygons. Otherwise, every projectile is checked against every obstacle.
+    """
+    if broadphase is None:
+        for projectile in projectiles:
+            hit_list: List[Obstacle] = arcade.check_for_collision_with_list(
+                projectile, obstacles
+            )
+            for obstacle in hit_list:
+                obstacle.take_damage(projectile.damage)
+                projectile.kill()
+        return
+
+    broadphase.update(obstacles)
+    for projectile, obstacle in broadphase.query_pairs(projectiles):
+        if not obstacle.sprite_lists:
+            continue  # Destroyed by an earlier projectile in this pass
+        if arcade.check_for_collision(projectile, obstacle):
             obstacle.take_damage(projectile.damage)
             projectile.kill()
+
+
+def handle_projectile_system_collisions(
+    projectiles: ProjectileSystem,
+    obstacles: List[Obstacle],
+    broadphase: UniformGrid,
+) -> List[Obstacle]:
+    """Projectile - obstacle collison logic of a `ProjectileSystem`.
+
+    The projectiles near an obstacle are found with a vectorised pass over the
+    arrays. Only their sprites are synchronised and checked with the hit box
+    polygons. Projectiles which hit an obstacle are removed in one batch.
+
+    Returns
+    -------
+    List[Obstacle]
+        Obstacles which took damage, including the destroyed ones. An obstacle
+        is listed once per hit.
+    """
+    n = len(projectiles)
+    if n == 0:
+        return []
+    broadphase.update(obstacles)
+
+    x = projectiles.position[:n, 0]
+    y = projectiles.position[:n, 1]
+    radius = projectiles.radius[:n]
+    near_obstacles = broadphase.touches_occupied_cells(
+        x - radius, y - radius, x + radius, y + radius
+    )
+    rows = np.flatnonzero(near_obstacles)
+    if len(rows) == 0:
+        return []
+
+    projectiles.sync_sprites(indices=rows)
+    row_of_sprite = {projectiles.sprites[row]: row for row in rows.tolist()}
+    dead = np.zeros(n, dtype=bool)
+    damaged = []
+    for projectile, obstacle in broadphase.query_pairs(row_of_sprite):
+        if not obstacle.sprite_lists:
+            continue  # Destroyed by an earlier projectile in this pass
+        if arcade.check_for_collision(projectile, obstacle):
+            row = row_of_sprite[projectile]
+            obstacle.take_damage(float(projectiles.damage[row]))
+            dead[row] = True
+            damaged.append(obstacle)
+    projectiles.remove(dead)
+    return damaged
@@ -0,0 +1,195 @@
+from itertools import compress
+from typing import Dict, List
+
+import arcade
+import numpy as np
+
+from omg.entities.projectile import Projectile
+from omg.structural.sprite_list import BatchSpriteList
+
+DEFAULT_CAPACITY = 256
+
+
+class ProjectileSystem:
+    """Projectile state stored as a struct of arrays.
+
+    Every live projectile is a row in the contiguous NumPy arrays below, so all of
+    them are advanced with a single vectorised operation per tick. The
+    `Projectile` sprites are only the render view of the arrays; their positions
+    are written by `sync_sprites` before drawing.
+
+    Attributes
+    ----------
+    count : int
+        Number of live projectiles, i.e. valid rows of the arrays.
+    position, previous_position, velocity : np.ndarray
+        (capacity, 2) arrays in pixels and pixels per tick. `previous_position`
+        holds the positions before the latest tick and is used to interpolate
+        rendering.
+    damage : np.ndarray
+        Damage dealt to an obstacle on hit.
+    owner : np.ndarray
+        Id of the entity which shot the projectile.
+    lifetime : np.ndarray
+        Time since the projectile was shot in seconds.
+    ttl : np.ndarray
+        Lifetime after which the projectile is culled, `inf` if unlimited.
+    range_left : np.ndarray
+        Distance the projectile can still travel, `inf` if unlimited.
+    texture_id : np.ndarray
+        Id of the projectile image, see `texture_ids`.
+    radius : np.ndarray
+        Radius of the bounding circle, used by the broadphase.
+    sprites : List[Projectile]
+        Render view, parallel to the arrays.
+    sprite_list : arcade.SpriteList
+        Sprite list which draws the render view, a `BatchSpriteList` by default
+        so that the dead sprites of a tick are removed in one pass.
+    """
+
+    _COLUMNS = (
+        "position",
+        "previous_position",
+        "velocity",
+        "damage",
+        "owner",
+        "lifetime",
+        "ttl",
+        "range_left",
+        "texture_id",
+        "radius",
+    )
+
+    def __init__(
+        self, capacity: int = DEFAULT_CAPACITY, sprite_list: arcade.SpriteList = None
+    ):
+        self.count = 0
+        self.position = np.zeros((capacity, 2))
+        self.previous_position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.damage = np.zeros(capacity)
+        self.owner = np.zeros(capacity, dtype=np.int32)
+        self.lifetime = np.zeros(capacity)
+        self.ttl = np.zeros(capacity)
+        self.range_left = np.zeros(capacity)
+        self.texture_id = np.zeros(capacity, dtype=np.int32)
+        self.radius = np.zeros(capacity)
+        self.sprites: List[Projectile] = []
+        if sprite_list is None:
+            sprite_list = BatchSpriteList()
+        self.sprite_list = sprite_list
+        self.texture_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of live projectiles."""
+        return self.count
+
+    @property
+    def capacity(self) -> int:
+        """Define self.capacity, the number of rows allocated in the arrays."""
+        return len(self.damage)
+
+    def _grow(self, min_capacity: int):
+        capacity = max(min_capacity, 2 * self.capacity)
+        for column in self._COLUMNS:
+            old = getattr(self, column)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, column, new)
+
+    def spawn(self, projectile: Projectile, owner: int = 0):
+        """Add a projectile to the system.
+
+        The state of the sprite is copied into the arrays, afterwards the sprite
+        is only used to draw the projectile.
+        """
+        if self.count == self.capacity:
+            self._grow(self.count + 1)
+        i = self.count
+        self.position[i] = self.previous_position[i] = projectile.position
+        self.velocity[i] = (projectile.change_x, projectile.change_y)
+        self.damage[i] = projectile.damage
+        self.owner[i] = owner
+        self.lifetime[i] = 0
+        self.ttl[i] = np.inf if projectile.ttl is None else projectile.ttl
+        self.range_left[i] = (
+            np.inf if projectile.max_range is None else projectile.max_range
+        )
+        self.texture_id[i] = self.texture_ids.setdefault(
+            projectile.image_file, len(self.texture_ids)
+        )
+        self.radius[i] = np.hypot(projectile.width, projectile.height) / 2
+        self.count += 1
+
+        self.sprites.append(projectile)
+        self.sprite_list.append(projectile)
+
+    def update(self, delta_time: float):
+        """Advance every projectile by a single tick."""
+        n = self.count
+        self.previous_position[:n] = self.position[:n]
+        self.position[:n] += self.velocity[:n]
+        self.lifetime[:n] += delta_time
+        self.range_left[:n] -= np.hypot(self.velocity[:n, 0], self.velocity[:n, 1])
+
+    def cull(self, bound: float):
+        """Remove the expired projectiles in one batched sweep.
+
+        A projectile expires when it outlives its `ttl`, travels its maximum
+        range or leaves the world, i.e. the square of [-bound, bound].
+        """
+        n = self.count
+        x = self.position[:n, 0]
+        y = self.position[:n, 1]
+        expired = (self.lifetime[:n] >= self.ttl[:n]) | (self.range_left[:n] <= 0)
+        expired |= (np.abs(x) > bound) | (np.abs(y) > bound)
+        self.remove(expired)
+
+    def remove(self, dead: np.ndarray):
+        """Remove the projectiles marked by the boolean mask in one pass.
+
+        The surviving rows are compacted to the front of the arrays, keeping their
+        order. If the sprite list is a `BatchSpriteList`, the dead sprites are
+        removed from it in one pass. Removed projectiles are returned to their
+        pools.
+        """
+        n = self.count
+        alive = ~dead[:n]
+        n_alive = int(np.count_nonzero(alive))
+        if n_alive == n:
+            return
+        for column in self._COLUMNS:
+            array = getattr(self, column)
+            array[:n_alive] = array[:n][alive]
+
+        dead_sprites = list(compress(self.sprites, dead[:n]))
+        self.sprites = list(compress(self.sprites, alive))
+        self.count = n_alive
+        if isinstance(self.sprite_list, BatchSpriteList):
+            self.sprite_list.remove_many(dead_sprites)
+        else:
+            for sprite in dead_sprites:
+                self.sprite_list.remove(sprite)
+        for sprite in dead_sprites:
+            sprite.release()
+
+    def sync_sprites(self, alpha: float = 1.0, indices: np.ndarray = None):
+        """Write the positions from the arrays to the render view.
+
+        Parameters
+        ----------
+        alpha : float
+            Progress from the previous tick (0) to the latest tick (1), used to
+            interpolate the positions.
+        indices : np.ndarray, optional
+            Rows to synchronise, all of them by default.
+        """
+        n = self.count
+        if indices is None:
+            indices = slice(0, n)
+        previous = self.previous_position[indices]
+        positions = previous + (self.position[indices] - previous) * alpha
+        sprites = self.sprites
+        rows = range(n) if isinstance(indices, slice) else indices.tolist()
+        for row, (x, y) in zip(rows, positions.tolist()):
+            sprites[row].position = (x, y)
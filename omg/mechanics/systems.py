@@ -0,0 +1,212 @@
+from typing import Callable, Dict, List, Tuple
+
+import arcade
+import numpy as np
+
+from omg.structural.entity_store import Archetype, EntityStore
+
+# Components queried by the systems
+MOVING = ("position", "velocity")
+PROJECTILES = ("position", "radius", "damage", "owner")
+TARGETS = ("position", "radius", "health")
+MANA_REGEN = ("mana", "max_mana", "mana_regen_rate", "mana_regen_cooldown")
+
+
+def movement_system(store: EntityStore):
+    """Move every entity with a velocity by a single tick."""
+    for archetype in store.query(*MOVING):
+        archetype.column("position")[:] += archetype.column("velocity")
+
+
+def mana_regen_system(store: EntityStore, delta_time: float):
+    """Regenerate mana once per second, as `Player` does, for every entity."""
+    for archetype in store.query(*MANA_REGEN):
+        cooldown = archetype.column("mana_regen_cooldown")
+        cooldown += delta_time
+        ready = cooldown >= 1
+        if not ready.any():
+            continue
+        mana = archetype.column("mana")
+        mana[ready] = np.minimum(
+            mana[ready] + archetype.column("mana_regen_rate")[ready],
+            archetype.column("max_mana")[ready],
+        )
+        cooldown[ready] = 0
+
+
+def _gather(
+    store: EntityStore, components: Tuple[str, ...]
+) -> Tuple[List[Archetype], Dict[str, np.ndarray], np.ndarray, np.ndarray]:
+    """Concatenate the columns of every archetype of a query."""
+    archetypes = list(store.query(*components))
+    if not archetypes:
+        empty = np.zeros(0, dtype=np.int64)
+        return archetypes, {}, empty, empty
+    columns = {
+        name: np.concatenate([archetype.column(name) for archetype in archetypes])
+        for name in components
+    }
+    counts = [archetype.count for archetype in archetypes]
+    archetype_index = np.repeat(np.arange(len(archetypes)), counts)
+    rows = np.concatenate([np.arange(count) for count in counts])
+    return archetypes, columns, archetype_index, rows
+
+
+def _candidate_pairs(
+    positions: np.ndarray, others: np.ndarray, cell_size: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the candidate pairs between the positions and the other positions.
+
+    The other positions are sorted into a uniform grid, and every position is
+    paired with the other positions in the 3 x 3 cells around its own cell. So
+    every pair closer than `cell_size` is a candidate.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Indices of the positions and of the other positions of every pair.
+    """
+    def sorted_keys(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        cells = np.floor(points / cell_size).astype(np.int64)
+        # Cells are keyed by a single integer, so that they can be sorted
+        keys = cells[:, 0] * (1 << 32) + cells[:, 1]
+        order = np.argsort(keys, kind="stable")
+        return keys[order], order
+
+    other_keys, other_order = sorted_keys(others)
+    keys, order = sorted_keys(positions)
+
+    firsts, seconds = [], []
+    for offset_x in (-1, 0, 1):
+        for offset_y in (-1, 0, 1):
+            # Shifted keys stay sorted, which makes the search much faster
+            neighbour_keys = keys + (offset_x * (1 << 32) + offset_y)
+            starts = np.searchsorted(other_keys, neighbour_keys, side="left")
+            stops = np.searchsorted(other_keys, neighbour_keys, side="right")
+            counts = stops - starts
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            # Position of every pair within the range of its point
+            within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            firsts.append(np.repeat(order, counts))
+            seconds.append(other_order[np.repeat(starts, counts) + within])
+    if not firsts:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+def damage_system(store: EntityStore) -> np.ndarray:
+    """Damage the entities hit by projectiles in one batched pass.
+
+    Projectiles are the entities with a damage and an owner, targets are the
+    entities with a health. A projectile hits the targets whose bounding circle
+    overlaps its own, except for its owner. Every hit target takes the damage
+    of the projectile, the projectile is destroyed, and so are the targets whose
+    health drops to zero.
+
+    Returns
+    -------
+    np.ndarray
+        Ids of the destroyed targets.
+    """
+    no_entities = np.zeros(0, dtype=np.int64)
+    projectile_archetypes, projectiles, projectile_archetype, projectile_rows = (
+        _gather(store, PROJECTILES)
+    )
+    target_archetypes, targets, target_archetype, target_rows = _gather(
+        store, TARGETS
+    )
+    if len(projectile_rows) == 0 or len(target_rows) == 0:
+        return no_entities
+    target_entities = np.concatenate(
+        [archetype.entities for archetype in target_archetypes]
+    )
+
+    # Overlapping circles are at most the largest two radii apart
+    cell_size = max(projectiles["radius"].max() + targets["radius"].max(), 1.0)
+    shots, hits = _candidate_pairs(
+        projectiles["position"], targets["position"], cell_size
+    )
+    offsets = targets["position"][hits] - projectiles["position"][shots]
+    reach = projectiles["radius"][shots] + targets["radius"][hits]
+    overlap = np.einsum("ij,ij->i", offsets, offsets) < reach * reach
+    overlap &= projectiles["owner"][shots] != target_entities[hits]
+    shots, hits = shots[overlap], hits[overlap]
+    if len(shots) == 0:
+        return no_entities
+
+    health = targets["health"].copy()
+    np.subtract.at(health, hits, projectiles["damage"][shots])
+    for i, archetype in enumerate(target_archetypes):
+        archetype.column("health")[:] = health[target_archetype == i]
+
+    spent = np.zeros(len(projectile_rows), dtype=bool)
+    spent[shots] = True
+    for i, archetype in enumerate(projectile_archetypes):
+        dead = np.zeros(archetype.count, dtype=bool)
+        dead[projectile_rows[spent & (projectile_archetype == i)]] = True
+        store.remove(archetype, dead)
+
+    # Projectiles which are also targets may have been destroyed above
+    destroyed = []
+    for archetype in target_archetypes:
+        destroyed.append(store.remove(archetype, archetype.column("health") <= 0))
+    return np.concatenate(destroyed)
+
+
+class SpriteProjection:
+    """Render view of the entities of an `EntityStore` as arcade sprites.
+
+    Sprites are created for the new entities of a query and removed with their
+    entities. Otherwise, they are only written to by `sync`, the store stays the
+    state of the simulation.
+
+    Parameters
+    ----------
+    store : EntityStore
+        Store of the entities.
+    components : Tuple[str, ...]
+        Components of the drawn entities, they must include the position.
+    make_sprite : Callable[[int], arcade.Sprite]
+        Returns a new sprite of an entity, called with the entity id.
+    sprite_list : arcade.SpriteList, optional
+        Sprite list which draws the sprites.
+    """
+
+    def __init__(
+        self,
+        store: EntityStore,
+        components: Tuple[str, ...],
+        make_sprite: Callable[[int], arcade.Sprite],
+        sprite_list: arcade.SpriteList = None,
+    ):
+        self.store = store
+        self.components = components
+        self.make_sprite = make_sprite
+        self.sprite_list = arcade.SpriteList() if sprite_list is None else sprite_list
+        self.sprites: Dict[int, arcade.Sprite] = {}
+
+    def sync(self):
+        """Create and remove sprites and write the transforms of the entities."""
+        store = self.store
+        sprites = self.sprites
+        for entity in [entity for entity in sprites if entity not in store]:
+            sprites.pop(entity).remove_from_sprite_lists()
+        for archetype in store.query(*self.components):
+            angles = (
+                archetype.column("angle").tolist()
+                if "angle" in archetype.components
+                else None
+            )
+            entities = archetype.entities.tolist()
+            positions = archetype.column("position").tolist()
+            for i, (entity, (x, y)) in enumerate(zip(entities, positions)):
+                sprite = sprites.get(entity)
+                if sprite is None:
+                    sprite = sprites[entity] = self.make_sprite(entity)
+                    self.sprite_list.append(sprite)
+                sprite.position = (x, y)
+                if angles is not None:
+                    sprite.angle = angles[i]
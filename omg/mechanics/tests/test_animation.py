@@ -0,0 +1,96 @@
+import unittest
+
+from omg.core.world import ARCHER_PATH
+from omg.mechanics.animation import (
+    AnimationCursor,
+    AnimationLibrary,
+    get_animation_library,
+)
+from omg.mechanics.animations import (
+    DOWN_FACING,
+    IDLE,
+    LEFT_FACING,
+    SHOOT,
+    WALK,
+    Animations,
+)
+
+
+class TestAnimationLibrary(unittest.TestCase):
+
+    def test_library_is_shared(self):
+        library = get_animation_library(ARCHER_PATH)
+        self.assertIs(get_animation_library(ARCHER_PATH), library)
+
+    def test_frames(self):
+        library = get_animation_library(ARCHER_PATH)
+        self.assertEqual(len(library.frames(SHOOT, DOWN_FACING)), 12)
+        self.assertIsInstance(library.frames(WALK, LEFT_FACING), tuple)
+        self.assertEqual(library.frames("unknown", DOWN_FACING), ())
+
+
+class TestAnimationCursor(unittest.TestCase):
+
+    def setUp(self):
+        self.library = get_animation_library(ARCHER_PATH)
+
+    def test_cursor_has_no_dict(self):
+        cursor = AnimationCursor(IDLE, DOWN_FACING)
+        with self.assertRaises(AttributeError):
+            cursor.extra = 1
+
+    def test_next_texture(self):
+        cursor = AnimationCursor(WALK, DOWN_FACING)
+        frames = self.library.frames(WALK, DOWN_FACING)
+
+        textures = [cursor.next_texture(self.library) for _ in range(len(frames))]
+
+        self.assertEqual([texture for texture, _ in textures], list(frames))
+        self.assertEqual(
+            [finished for _, finished in textures], [False] * (len(frames) - 1) + [True]
+        )
+        self.assertEqual(cursor.frame_index, 0)
+
+    def test_action_without_frames(self):
+        library = AnimationLibrary(ARCHER_PATH)
+        # Sprite sheet without the walking frames facing left
+        del library._frames[WALK][LEFT_FACING]
+        cursor = AnimationCursor(WALK, LEFT_FACING)
+
+        texture, finished = cursor.next_texture(library)
+
+        self.assertIs(texture, library.frames(IDLE, LEFT_FACING)[0])
+        self.assertTrue(finished)
+        self.assertEqual(cursor.frame_index, 0)
+
+        del library._frames[IDLE][LEFT_FACING]
+        texture, _ = cursor.next_texture(library)
+        self.assertIsNotNone(texture)
+
+        library._frames.clear()
+        with self.assertRaises(ValueError):
+            cursor.next_texture(library)
+
+
+class TestAnimations(unittest.TestCase):
+
+    def test_entities_share_frames(self):
+        animations_1 = Animations(ARCHER_PATH, None, None, None, None)
+        animations_2 = Animations(ARCHER_PATH, None, None, None, None)
+        self.assertIsInstance(animations_1.library, AnimationLibrary)
+        self.assertIs(animations_1.library, animations_2.library)
+        self.assertIsNot(animations_1.cursor, animations_2.cursor)
+
+    def test_state_change_restarts_animation(self):
+        animations = Animations(ARCHER_PATH, None, None, None, None)
+        animations._player_state = WALK
+        animations.update_animation(1.0)
+        self.assertEqual(animations.cursor.frame_index, 1)
+
+        animations._player_state = SHOOT
+        self.assertEqual(animations.cursor.frame_index, 0)
+        self.assertEqual(animations.cursor.state, SHOOT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+import arcade
+
+from omg.core.world import ARCHER_PATH
+from omg.mechanics.animation import AnimationCursor, get_animation_library
+from omg.mechanics.animations import (
+    ANIMATION_SPEED,
+    DOWN_FACING,
+    IDLE,
+    LEFT_FACING,
+    SHOOT,
+    WALK,
+)
+from omg.mechanics.animator import BatchAnimator
+
+# Longer than a frame, so that every advance moves to the next frame
+FRAME_STEP = ANIMATION_SPEED * 1.5
+
+
+class TestBatchAnimator(unittest.TestCase):
+
+    def setUp(self):
+        self.library = get_animation_library(ARCHER_PATH)
+        self.animator = BatchAnimator(self.library, capacity=2)
+        self.entities = [arcade.Sprite() for _ in range(3)]
+        for entity in self.entities:
+            self.animator.add(entity, WALK, DOWN_FACING)
+
+    def test_add_grows_arrays(self):
+        self.assertEqual(len(self.animator), 3)
+        self.assertGreaterEqual(self.animator.capacity, 3)
+
+    def test_matches_animation_cursor(self):
+        self.animator.set_direction(self.entities[1], LEFT_FACING)
+        cursor = AnimationCursor(WALK, LEFT_FACING)
+
+        for _ in range(20):
+            swaps, _ = self.animator.advance(FRAME_STEP)
+            textures = dict(swaps)
+            expected_texture, _ = cursor.next_texture(self.library)
+            self.assertIs(textures[self.entities[1]], expected_texture)
+
+    def test_no_swaps_before_frame_duration(self):
+        swaps, finished = self.animator.advance(ANIMATION_SPEED / 2)
+        self.assertEqual((swaps, finished), ([], []))
+
+    def test_only_changed_textures_are_swapped(self):
+        self.animator.set_state(self.entities[0], IDLE)
+
+        self.animator.advance(FRAME_STEP)
+        swaps, finished = self.animator.advance(FRAME_STEP)
+
+        # Idle animation has a single frame, so its texture never changes
+        swapped_entities = [entity for entity, _ in swaps]
+        self.assertNotIn(self.entities[0], swapped_entities)
+        self.assertIn(self.entities[0], finished)
+        self.assertIn(self.entities[2], swapped_entities)
+
+    def test_finished_animations(self):
+        self.animator.set_state(self.entities[2], SHOOT)
+        n_frames = len(self.library.frames(SHOOT, DOWN_FACING))
+
+        for _ in range(n_frames - 1):
+            _, finished = self.animator.advance(FRAME_STEP)
+            self.assertNotIn(self.entities[2], finished)
+        _, finished = self.animator.advance(FRAME_STEP)
+        self.assertIn(self.entities[2], finished)
+
+    def test_set_state_restarts_animation(self):
+        self.animator.advance(FRAME_STEP)
+        self.animator.set_state(self.entities[0], SHOOT)
+        swaps, _ = self.animator.advance(FRAME_STEP)
+        first_frame = self.library.frames(SHOOT, DOWN_FACING)[0]
+        self.assertIs(dict(swaps)[self.entities[0]], first_frame)
+
+    def test_remove(self):
+        self.animator.set_direction(self.entities[2], LEFT_FACING)
+        self.animator.remove(self.entities[0])
+
+        self.assertNotIn(self.entities[0], self.animator)
+        self.assertEqual(len(self.animator), 2)
+        swaps = dict(self.animator.advance(FRAME_STEP)[0])
+        self.assertEqual(set(swaps), {self.entities[1], self.entities[2]})
+        first_frame = self.library.frames(WALK, LEFT_FACING)[0]
+        self.assertIs(swaps[self.entities[2]], first_frame)
+
+
+if __name__ == "__main__":
+    unittest.main()
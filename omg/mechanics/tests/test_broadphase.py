@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import patch
+import arcade
+import numpy as np
+from omg.mechanics.broadphase import UniformGrid
+
+
+def make_sprite(center_x, center_y, size):
+    sprite = arcade.SpriteSolidColor(size, size, arcade.color.RED)
+    sprite.center_x = center_x
+    sprite.center_y = center_y
+    return sprite
+
+
+class TestUniformGrid(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = UniformGrid(cell_size=100)
+        self.obstacle_1 = make_sprite(50, 50, 40)
+        self.obstacle_2 = make_sprite(500, 500, 40)
+        # Spans four cells
+        self.obstacle_3 = make_sprite(1000, 1000, 60)
+        self.grid.update([self.obstacle_1, self.obstacle_2, self.obstacle_3])
+
+    def test_query_pairs(self):
+        near_1 = make_sprite(60, 60, 10)
+        near_3 = make_sprite(980, 1020, 10)
+        far = make_sprite(-300, 200, 10)
+
+        pairs = self.grid.query_pairs([near_1, near_3, far])
+
+        self.assertEqual(pairs, [(near_1, self.obstacle_1), (near_3, self.obstacle_3)])
+
+    def test_same_cell_without_overlap(self):
+        # Same cell as obstacle_1 but the bounding boxes do not overlap
+        projectile = make_sprite(95, 95, 10)
+        self.assertEqual(self.grid.query_pairs([projectile]), [])
+
+    def test_touches_occupied_cells(self):
+        # Near obstacle_1, an empty cell, beyond the last occupied cell and near
+        # obstacle_3 which spans four cells
+        x = np.array([60.0, 250, 5000, 1010])
+        y = np.array([60.0, 250, 5000, 1010])
+        mask = self.grid.touches_occupied_cells(x - 5, y - 5, x + 5, y + 5)
+        self.assertEqual(mask.tolist(), [True, False, False, True])
+
+    def test_update_removes_missing_sprites(self):
+        self.grid.update([self.obstacle_1])
+        self.assertEqual(len(self.grid), 1)
+        self.assertNotIn(self.obstacle_2, self.grid)
+
+    def test_update_without_changes(self):
+        with patch.object(self.grid, "insert") as insert:
+            self.grid.update([self.obstacle_1, self.obstacle_2, self.obstacle_3])
+        insert.assert_not_called()
+
+        new_obstacle = make_sprite(-500, -500, 40)
+        self.grid.update([self.obstacle_1, self.obstacle_3, new_obstacle])
+        self.assertEqual(len(self.grid), 3)
+        self.assertIn(new_obstacle, self.grid)
+
+    def test_update_rebins_moved_sprites(self):
+        self.obstacle_2.center_x = -500
+        with patch.object(self.grid, "insert", wraps=self.grid.insert) as insert:
+            self.grid.update([self.obstacle_1, self.obstacle_2, self.obstacle_3])
+        insert.assert_called_once_with(self.obstacle_2)
+
+        projectile = make_sprite(-500, 500, 10)
+        self.assertEqual(
+            self.grid.query_pairs([projectile]), [(projectile, self.obstacle_2)]
+        )
+        self.assertEqual(self.grid.query_pairs([make_sprite(500, 500, 10)]), [])
+
+    def test_mark_moved(self):
+        # Resizing in place does not change the position
+        self.obstacle_2.width = 400
+        self.grid.mark_moved(self.obstacle_2)
+        self.grid.update([self.obstacle_1, self.obstacle_2, self.obstacle_3])
+
+        projectile = make_sprite(680, 500, 10)
+        self.assertEqual(
+            self.grid.query_pairs([projectile]), [(projectile, self.obstacle_2)]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,14 @@
 import unittest
 import arcade
-from unittest.mock import MagicMock
-from omg.mechanics.collision import handle_projectile_collisions
+from unittest.mock import MagicMock, patch
+from omg.mechanics.broadphase import UniformGrid
+from omg.mechanics.collision import (
+    handle_projectile_collisions,
+    handle_projectile_system_collisions,
+)
+from omg.mechanics.projectile_system import ProjectileSystem
+from omg.mechanics.tests.test_projectile_system import make_projectile
+from omg.mechanics.tests.test_broadphase import make_sprite
 
 class TestHandleProjectileCollision(unittest.TestCase):
 
@@ -27,15 +34,65 @@ class TestHandleProjectileCollision(unittest.TestCase):
         # The side_effect attribute of a MagicMock can be used to define a
         # sequence of return values or behaviors for successive calls to the
         # mock function.
-        arcade.check_for_collision_with_list = MagicMock(side_effect=[
+        with patch("arcade.check_for_collision_with_list", side_effect=[
             [obstacle1],  # projectile1 hits obstacle1
             []           # projectile2 hits no obstacles
-        ])
-        handle_projectile_collisions(projectiles, obstacles)
+        ]):
+            handle_projectile_collisions(projectiles, obstacles)
         obstacle1.take_damage.assert_called_once_with(10)
         obstacle2.take_damage.assert_not_called()
         projectile_1.kill.assert_called_once()
         projectile_2.kill.assert_not_called()
 
+    def test_projectile_collision_with_broadphase(self):
+        """Only the pairs returned by the broadphase are checked."""
+        projectiles = arcade.SpriteList()
+        projectile_1 = make_sprite(100, 100, 10)
+        projectile_1.damage = 10
+        projectile_2 = make_sprite(300, 100, 10)
+        projectile_2.damage = 20
+        projectiles.extend([projectile_1, projectile_2])
+
+        obstacles = arcade.SpriteList()
+        obstacle_1 = make_sprite(105, 100, 20)
+        obstacle_1.take_damage = MagicMock()
+        obstacle_2 = make_sprite(600, 100, 20)
+        obstacle_2.take_damage = MagicMock()
+        obstacles.extend([obstacle_1, obstacle_2])
+
+        handle_projectile_collisions(projectiles, obstacles, UniformGrid())
+
+        obstacle_1.take_damage.assert_called_once_with(10)
+        obstacle_2.take_damage.assert_not_called()
+        self.assertNotIn(projectile_1, projectiles)
+        self.assertIn(projectile_2, projectiles)
+
+    def test_projectile_system_collision(self):
+        """Projectiles which hit an obstacle are removed from the system."""
+        projectiles = ProjectileSystem()
+        projectile_1 = make_projectile(100, 100, damage=10)
+        projectile_2 = make_projectile(300, 100, damage=20)
+        projectiles.spawn(projectile_1)
+        projectiles.spawn(projectile_2)
+        projectiles.update(1 / 60)
+
+        obstacles = arcade.SpriteList()
+        obstacle_1 = make_sprite(100, 110, 20)
+        obstacle_1.take_damage = MagicMock()
+        obstacle_2 = make_sprite(600, 100, 20)
+        obstacle_2.take_damage = MagicMock()
+        obstacles.extend([obstacle_1, obstacle_2])
+
+        damaged = handle_projectile_system_collisions(
+            projectiles, obstacles, UniformGrid()
+        )
+
+        self.assertEqual(damaged, [obstacle_1])
+        obstacle_1.take_damage.assert_called_once_with(10)
+        obstacle_2.take_damage.assert_not_called()
+        self.assertEqual(projectiles.sprites, [projectile_2])
+        self.assertNotIn(projectile_1, projectiles.sprite_list)
+
+
 if __name__ == "__main__":
     unittest.main()
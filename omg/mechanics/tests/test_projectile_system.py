@@ -0,0 +1,114 @@
+import unittest
+import numpy as np
+from omg.entities.projectile import Projectile
+from omg.entities.tests import TEST_IMAGE_FILE
+from omg.mechanics.projectile_system import ProjectileSystem
+
+
+def make_projectile(
+    init_px=0, init_py=0, angle=0, damage=10, speed=5, max_range=None, ttl=None
+):
+    return Projectile(
+        name="Test",
+        image_file=TEST_IMAGE_FILE,
+        scale=0.05,
+        damage=damage,
+        speed=speed,
+        init_px=init_px,
+        init_py=init_py,
+        angle=angle,
+        max_range=max_range,
+        ttl=ttl,
+    )
+
+
+class TestProjectileSystem(unittest.TestCase):
+
+    def setUp(self):
+        self.system = ProjectileSystem(capacity=2)
+
+    def test_spawn(self):
+        projectile = make_projectile(100, 200, angle=45, damage=25)
+        self.system.spawn(projectile, owner=3)
+
+        self.assertEqual(len(self.system), 1)
+        self.assertEqual(tuple(self.system.position[0]), (100, 200))
+        self.assertAlmostEqual(self.system.velocity[0, 0], projectile.change_x)
+        self.assertAlmostEqual(self.system.velocity[0, 1], projectile.change_y)
+        self.assertEqual(self.system.damage[0], 25)
+        self.assertEqual(self.system.owner[0], 3)
+        self.assertIn(projectile, self.system.sprite_list)
+
+    def test_spawn_grows_arrays(self):
+        for _ in range(5):
+            self.system.spawn(make_projectile())
+        self.assertEqual(len(self.system), 5)
+        self.assertGreaterEqual(self.system.capacity, 5)
+
+    def test_update(self):
+        self.system.spawn(make_projectile(0, 0, angle=0, speed=5))
+        self.system.spawn(make_projectile(0, 0, angle=90, speed=2))
+
+        self.system.update(0.5)
+
+        np.testing.assert_allclose(
+            self.system.position[:2], [[0, 5], [-2, 0]], atol=1e-9
+        )
+        np.testing.assert_allclose(self.system.previous_position[:2], [[0, 0], [0, 0]])
+        np.testing.assert_allclose(self.system.lifetime[:2], [0.5, 0.5])
+
+    def test_remove(self):
+        projectiles = [make_projectile(i, 0, damage=i) for i in range(4)]
+        for projectile in projectiles:
+            self.system.spawn(projectile)
+
+        self.system.remove(np.array([False, True, False, True]))
+
+        self.assertEqual(len(self.system), 2)
+        np.testing.assert_array_equal(self.system.damage[:2], [0, 2])
+        self.assertEqual(self.system.sprites, [projectiles[0], projectiles[2]])
+        self.assertEqual(list(self.system.sprite_list), self.system.sprites)
+
+    def test_remove_many(self):
+        projectiles = [make_projectile(i, 0) for i in range(500)]
+        for projectile in projectiles:
+            self.system.spawn(projectile)
+
+        dead = np.arange(500) % 2 == 1
+        self.system.remove(dead)
+
+        self.assertEqual(self.system.sprites, projectiles[::2])
+        self.assertEqual(list(self.system.sprite_list), projectiles[::2])
+        self.assertFalse(projectiles[1].sprite_lists)
+
+    def test_cull(self):
+        alive = make_projectile(0, 0, speed=5, max_range=100, ttl=1.0)
+        out_of_range = make_projectile(0, 0, speed=5, max_range=9)
+        expired = make_projectile(0, 0, speed=5, ttl=0.02)
+        out_of_world = make_projectile(0, 995, speed=10)
+        for projectile in (alive, out_of_range, expired, out_of_world):
+            self.system.spawn(projectile)
+
+        self.system.update(1 / 60)
+        self.system.cull(bound=1000)
+        self.assertEqual(len(self.system), 3)
+
+        self.system.update(1 / 60)
+        self.system.cull(bound=1000)
+        self.assertEqual(self.system.sprites, [alive])
+
+    def test_sync_sprites(self):
+        projectile = make_projectile(0, 0, angle=0, speed=4)
+        self.system.spawn(projectile)
+        self.system.update(1 / 60)
+
+        self.system.sync_sprites(alpha=0.5)
+        self.assertAlmostEqual(projectile.center_x, 0)
+        self.assertAlmostEqual(projectile.center_y, 2)
+
+        self.system.sync_sprites(indices=np.array([0]))
+        self.assertAlmostEqual(projectile.center_y, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
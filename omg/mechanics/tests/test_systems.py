@@ -0,0 +1,136 @@
+import unittest
+
+import arcade
+import numpy as np
+
+from omg.mechanics.systems import (
+    SpriteProjection,
+    damage_system,
+    mana_regen_system,
+    movement_system,
+)
+from omg.structural.entity_store import EntityStore
+
+
+class TestSystems(unittest.TestCase):
+
+    def setUp(self):
+        self.store = EntityStore()
+
+    def _target(self, x, y, health=10):
+        return self.store.create(position=(x, y), radius=10, health=health)
+
+    def _projectile(self, x, y, damage=4, owner=-1):
+        return self.store.create(
+            position=(x, y), velocity=(0, 0), radius=5, damage=damage, owner=owner
+        )
+
+    def test_movement_system(self):
+        moving = self.store.create(position=(0, 0), velocity=(1, 2))
+        still = self.store.create(position=(5, 5))
+
+        movement_system(self.store)
+        movement_system(self.store)
+
+        self.assertEqual(self.store.get(moving, "position").tolist(), [2, 4])
+        self.assertEqual(self.store.get(still, "position").tolist(), [5, 5])
+
+    def test_mana_regen_system(self):
+        regen = dict(max_mana=100, mana_regen_rate=5, mana_regen_cooldown=0)
+        low = self.store.create(mana=50, **regen)
+        full = self.store.create(mana=98, **regen)
+
+        mana_regen_system(self.store, 0.5)
+        self.assertEqual(self.store.get(low, "mana"), 50)
+        mana_regen_system(self.store, 0.5)
+
+        self.assertEqual(self.store.get(low, "mana"), 55)
+        self.assertEqual(self.store.get(full, "mana"), 100)
+        self.assertEqual(self.store.get(low, "mana_regen_cooldown"), 0)
+
+    def test_damage_system(self):
+        target = self._target(0, 0)
+        hit = self._projectile(12, 0)
+        miss = self._projectile(100, 0)
+
+        destroyed = damage_system(self.store)
+
+        self.assertEqual(destroyed.tolist(), [])
+        self.assertEqual(self.store.get(target, "health"), 6)
+        self.assertNotIn(hit, self.store)
+        self.assertIn(miss, self.store)
+
+    def test_damage_system_destroys_targets(self):
+        targets = [self._target(0, 0, health=5), self._target(1000, 1000)]
+        self._projectile(0, 0)
+        self._projectile(-3, 0)
+
+        destroyed = damage_system(self.store)
+
+        self.assertEqual(destroyed.tolist(), [targets[0]])
+        self.assertEqual(len(self.store), 1)
+
+    def test_owner_is_not_damaged(self):
+        target = self._target(0, 0)
+        projectile = self._projectile(0, 0, owner=target)
+
+        damage_system(self.store)
+
+        self.assertEqual(self.store.get(target, "health"), 10)
+        self.assertIn(projectile, self.store)
+
+    def test_damage_system_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        targets = self.store.create_many(
+            200, position=rng.uniform(0, 500, (200, 2)), radius=10, health=1e6
+        )
+        projectile_positions = rng.uniform(0, 500, (300, 2))
+        self.store.create_many(
+            300,
+            position=projectile_positions,
+            velocity=(0, 0),
+            radius=5,
+            damage=1,
+            owner=-1,
+        )
+        target_positions = self.store.archetype(
+            ["position", "radius", "health"]
+        ).column("position")
+        distances = np.linalg.norm(
+            target_positions[:, None] - projectile_positions[None], axis=2
+        )
+        expected_hits = (distances < 15).sum(axis=1)
+
+        damage_system(self.store)
+
+        health = np.array([self.store.get(target, "health") for target in targets])
+        np.testing.assert_array_equal(1e6 - health, expected_hits)
+
+
+class TestSpriteProjection(unittest.TestCase):
+
+    def test_sync(self):
+        store = EntityStore()
+        entity = store.create(position=(10, 20), angle=45)
+        projection = SpriteProjection(store, ("position",), lambda _: arcade.Sprite())
+
+        projection.sync()
+
+        sprite = projection.sprites[entity]
+        self.assertIn(sprite, projection.sprite_list)
+        self.assertEqual(sprite.position, (10, 20))
+        self.assertEqual(sprite.angle, 45)
+
+        store.set(entity, "position", (30, 40))
+        projection.sync()
+        self.assertIs(projection.sprites[entity], sprite)
+        self.assertEqual(sprite.position, (30, 40))
+
+        store.destroy(entity)
+        projection.sync()
+        self.assertEqual(projection.sprites, {})
+        self.assertEqual(len(projection.sprite_list), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
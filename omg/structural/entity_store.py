@@ -0,0 +1,304 @@
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Tuple
+
+import numpy as np
+
+DEFAULT_CAPACITY = 64
+NO_ELEMENT = -1  # Value of the element component of entities without an element
+
+
+class Component(NamedTuple):
+    """Data type and shape of a single entity's value of a component."""
+
+    dtype: type
+    shape: Tuple[int, ...] = ()
+
+
+# Components of the game entities. The transform is the position and the angle,
+# speeds are in pixels per tick (see `omg.core.clock`).
+COMPONENTS: Dict[str, Component] = {
+    "position": Component(np.float64, (2,)),
+    "angle": Component(np.float64),
+    "velocity": Component(np.float64, (2,)),
+    "radius": Component(np.float64),  # Radius of the bounding circle
+    "health": Component(np.float64),
+    "max_health": Component(np.float64),
+    "mana": Component(np.float64),
+    "max_mana": Component(np.float64),
+    "mana_regen_rate": Component(np.float64),  # Mana regenerated per second
+    "mana_regen_cooldown": Component(np.float64),
+    "damage": Component(np.float64),
+    "owner": Component(np.int64),  # Entity which created this one, e.g. a shooter
+    "element": Component(np.int32),  # Index of the element item, or NO_ELEMENT
+}
+
+
+class Archetype:
+    """Entities which have exactly the same components.
+
+    Every component is a column, i.e. a NumPy array with a row per entity, so a
+    system processes every entity of the archetype with vectorised operations.
+    Rows are kept contiguous, an entity's row changes when entities are removed.
+
+    Attributes
+    ----------
+    components : FrozenSet[str]
+        Names of the components.
+    count : int
+        Number of entities, i.e. valid rows of the columns.
+    """
+
+    def __init__(
+        self,
+        components: FrozenSet[str],
+        schema: Dict[str, Component],
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        self.components = components
+        self.count = 0
+        self._entities = np.zeros(capacity, dtype=np.int64)
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros((capacity,) + schema[name].shape, dtype=schema[name].dtype)
+            for name in sorted(components)
+        }
+
+    def __len__(self) -> int:
+        """Return the number of entities."""
+        return self.count
+
+    @property
+    def capacity(self) -> int:
+        """Define self.capacity, the number of rows allocated in the columns."""
+        return len(self._entities)
+
+    @property
+    def entities(self) -> np.ndarray:
+        """Define self.entities, the entity ids in row order."""
+        return self._entities[: self.count]
+
+    def column(self, name: str) -> np.ndarray:
+        """Return the values of a component, a view which can be written in place.
+
+        The view is only valid until entities are added or removed.
+        """
+        return self._columns[name][: self.count]
+
+    def _grow(self, min_capacity: int):
+        capacity = max(min_capacity, 2 * self.capacity)
+        arrays = {"_entities": self._entities, **self._columns}
+        for name, old in arrays.items():
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            if name == "_entities":
+                self._entities = new
+            else:
+                self._columns[name] = new
+
+    def _append(self, entities: np.ndarray, values: Dict[str, object]) -> slice:
+        n = self.count
+        if n + len(entities) > self.capacity:
+            self._grow(n + len(entities))
+        rows = slice(n, n + len(entities))
+        self._entities[rows] = entities
+        for name, column in self._columns.items():
+            column[rows] = values[name]
+        self.count += len(entities)
+        return rows
+
+    def _remove(self, dead: np.ndarray) -> np.ndarray:
+        """Compact the surviving rows to the front, keeping their order."""
+        n = self.count
+        alive = ~dead[:n]
+        removed = self._entities[:n][dead[:n]]
+        n_alive = n - len(removed)
+        self._entities[:n_alive] = self._entities[:n][alive]
+        for column in self._columns.values():
+            column[:n_alive] = column[:n][alive]
+        self.count = n_alive
+        return removed
+
+
+class EntityStore:
+    """Entity component store which keeps the entities in archetypes.
+
+    An entity is an integer id and its data are the values of its components,
+    e.g. the position and the velocity of a projectile. Entities with the same
+    components belong to the same `Archetype`, which stores every component as a
+    NumPy column. Systems query the archetypes having the components they need
+    and process them column by column, so the cost per entity is a few array
+    elements rather than a Python object.
+
+    Entity ids are never reused. Arcade sprites are not part of the store, they
+    are created as a render view of the entities, see
+    `omg.mechanics.systems.SpriteProjection`.
+
+    Parameters
+    ----------
+    schema : Dict[str, Component]
+        Components an entity can have, the components of the game by default.
+    capacity : int
+        Rows allocated up front per archetype.
+
+    Examples
+    --------
+    >>> store = EntityStore()
+    >>> entity = store.create(position=(0, 0), velocity=(1, 2))
+    >>> for archetype in store.query("position", "velocity"):
+    ...     archetype.column("position")[:] += archetype.column("velocity")
+    >>> store.get(entity, "position").tolist()
+    [1.0, 2.0]
+    """
+
+    def __init__(
+        self,
+        schema: Dict[str, Component] = None,
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        self.schema = COMPONENTS if schema is None else schema
+        self.capacity = capacity
+        self._archetypes: Dict[FrozenSet[str], Archetype] = {}
+        self._archetype_list: List[Archetype] = []
+        # Location of every entity ever created, indexed by its id
+        self._archetype_of = np.zeros(0, dtype=np.int32)  # -1 if destroyed
+        self._row_of = np.zeros(0, dtype=np.int64)
+        self._next_entity = 0
+        self._queries: Dict[FrozenSet[str], List[Archetype]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of live entities."""
+        return sum(archetype.count for archetype in self._archetype_list)
+
+    def __contains__(self, entity: int) -> bool:
+        """Return whether the entity is alive."""
+        return 0 <= entity < self._next_entity and self._archetype_of[entity] >= 0
+
+    @property
+    def archetypes(self) -> Tuple[Archetype, ...]:
+        """Define self.archetypes in order of creation."""
+        return tuple(self._archetype_list)
+
+    def archetype(self, components: Iterable[str]) -> Archetype:
+        """Return the archetype of the components, it is created if needed."""
+        components = frozenset(components)
+        archetype = self._archetypes.get(components)
+        if archetype is None:
+            unknown = components.difference(self.schema)
+            if unknown:
+                raise KeyError(f"Unknown components: {', '.join(sorted(unknown))}")
+            archetype = Archetype(components, self.schema, self.capacity)
+            self._archetypes[components] = archetype
+            self._archetype_list.append(archetype)
+            self._queries.clear()
+        return archetype
+
+    def create(self, **components) -> int:
+        """Create an entity with the given component values.
+
+        Returns
+        -------
+        int
+            Id of the entity.
+        """
+        values = {name: [value] for name, value in components.items()}
+        return int(self.create_many(1, **values)[0])
+
+    def create_many(self, count: int, **components) -> np.ndarray:
+        """Create entities with the same components in one batch.
+
+        Parameters
+        ----------
+        count : int
+            Number of entities.
+        **components
+            Values of every component, either an array with a row per entity or
+            a single value shared by the entities.
+
+        Returns
+        -------
+        np.ndarray
+            Ids of the entities.
+        """
+        archetype = self.archetype(components)
+        entities = np.arange(self._next_entity, self._next_entity + count)
+        self._next_entity += count
+        if self._next_entity > len(self._row_of):
+            size = max(self._next_entity, 2 * len(self._row_of))
+            self._archetype_of = np.resize(self._archetype_of, size)
+            self._row_of = np.resize(self._row_of, size)
+        rows = archetype._append(entities, components)
+        self._archetype_of[entities] = self._archetype_list.index(archetype)
+        self._row_of[entities] = np.arange(rows.start, rows.stop)
+        return entities
+
+    def _locate(self, entity: int) -> Tuple[Archetype, int]:
+        if entity not in self:
+            raise KeyError(f"No entity {entity}")
+        return (
+            self._archetype_list[self._archetype_of[entity]],
+            int(self._row_of[entity]),
+        )
+
+    def components(self, entity: int) -> FrozenSet[str]:
+        """Return the names of the components of an entity."""
+        return self._locate(entity)[0].components
+
+    def get(self, entity: int, component: str):
+        """Return a copy of the value of a component of an entity."""
+        archetype, row = self._locate(entity)
+        return archetype._columns[component][row].copy()
+
+    def set(self, entity: int, component: str, value):
+        """Change the value of a component of an entity."""
+        archetype, row = self._locate(entity)
+        archetype._columns[component][row] = value
+
+    def destroy(self, entity: int):
+        """Destroy an entity."""
+        self.destroy_many([entity])
+
+    def destroy_many(self, entities: Iterable[int]):
+        """Destroy entities in one pass per archetype."""
+        entities = np.unique(np.asarray(entities, dtype=np.int64))
+        created = (entities >= 0) & (entities < self._next_entity)
+        if not created.all() or (self._archetype_of[entities] < 0).any():
+            raise KeyError("Some of the entities are not alive")
+        locations = self._archetype_of[entities]
+        for index in np.unique(locations).tolist():
+            archetype = self._archetype_list[index]
+            dead = np.zeros(archetype.count, dtype=bool)
+            dead[self._row_of[entities[locations == index]]] = True
+            self.remove(archetype, dead)
+
+    def remove(self, archetype: Archetype, dead: np.ndarray) -> np.ndarray:
+        """Destroy the entities of an archetype marked by a boolean mask.
+
+        This is the batched removal of the systems, e.g. of the entities whose
+        health dropped to zero.
+
+        Returns
+        -------
+        np.ndarray
+            Ids of the destroyed entities.
+        """
+        if not dead.any():
+            return np.zeros(0, dtype=np.int64)
+        removed = archetype._remove(dead)
+        self._archetype_of[removed] = -1
+        self._row_of[archetype.entities] = np.arange(archetype.count)
+        return removed
+
+    def query(self, *components: str) -> Iterator[Archetype]:
+        """Iterate over the non-empty archetypes having every given component.
+
+        Archetypes which are created or emptied while iterating are skipped.
+        """
+        key = frozenset(components)
+        archetypes = self._queries.get(key)
+        if archetypes is None:
+            archetypes = self._queries[key] = [
+                archetype
+                for archetype in self._archetype_list
+                if key <= archetype.components
+            ]
+        for archetype in archetypes:
+            if archetype.count:
+                yield archetype
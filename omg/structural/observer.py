@@ -1,68 +1,237 @@
-from typing import List
+import weakref
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
 import logging
 import arcade
 
+from omg.utils.tracing import get_trace_recorder
+
+_tracer = get_trace_recorder()
+
 
 class Event:
-    """Base class for events in the Observer pattern."""
+    """Base class for events in the Observer pattern.
 
-    def __init__(self, event_type: str):
-        self.event_type = event_type
+    Events are dispatched by their class, every kind of event is a subclass.
+    """
 
 
 class Observer:
     """Observer for game-related events, managing event handling.
 
+    By default, an event is dispatched as soon as it is raised. A deferred
+    observer (`immediate=False`) queues the events instead, grouped by their type,
+    and dispatches them when `flush` is called, e.g. at a fixed point of the game
+    tick. Then an event never interrupts the code which raised it, and every type
+    costs a single dispatch per flush however many of its events were raised.
+
+    Any number of handlers can be registered per event type, i.e. per event
+    class. Handlers take a single event, batch handlers take the list of the
+    grouped events. Subclasses of a registered class are not dispatched to its
+    handlers, so finding the handlers is a single dictionary lookup.
+
+    Parameters
+    ----------
+    immediate : bool
+        Dispatch the events as soon as they are raised instead of queueing them.
+
     Attributes
     ----------
-    _handlers : dict
-        A dictionary mapping event types to handler methods.
+    event_counts : collections.Counter
+        Number of the raised events per event type.
+    dispatch_counts : collections.Counter
+        Number of the dispatches per event type.
     """
 
-    def __init__(self):
-        self._handlers: dict = {}
-
-    def register_handler(self, event_type: str, handler):
+    def __init__(self, immediate: bool = True):
+        self.immediate = immediate
+        self._handlers: Dict[Type[Event], List[Callable[[Event], None]]] = {}
+        self._batch_handlers: Dict[
+            Type[Event], List[Callable[[List[Event]], None]]
+        ] = {}
+        self._queue: Dict[Type[Event], List[Event]] = {}
+        self._unhandled_event_types: Set[Type[Event]] = set()
+        self.event_counts: Counter = Counter()
+        self.dispatch_counts: Counter = Counter()
+
+    def register_handler(self, event_type: Type[Event], handler):
         """Register a new event handler for a specific event type.
 
         Parameters
         ----------
-        event_type : str
-            The type of event the handler will process.
+        event_type : Type[Event]
+            The class of the events the handler will process.
+        handler : function
+            The handler function to be called with every event of the type.
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def register_batch_handler(self, event_type: Type[Event], handler):
+        """Register a handler which is called once with every grouped event.
+
+        Parameters
+        ----------
+        event_type : Type[Event]
+            The class of the events the handler will process.
         handler : function
-            The handler function to be called when the event occurs.
+            The handler function to be called with the list of the events of the
+            type, in the order they were raised.
         """
-        self._handlers[event_type] = handler
+        self._batch_handlers.setdefault(event_type, []).append(handler)
+
+    @property
+    def n_pending(self) -> int:
+        """Define self.n_pending, the number of queued events."""
+        return sum(len(events) for events in self._queue.values())
 
     def on_event(self, event: Event):
-        """Handle an event by dispatching to the appropriate handler.
+        """Handle an event by dispatching or queueing it.
 
         Parameters
         ----------
         event : Event
             The event to handle.
         """
-        handler = self._handlers.get(event.event_type)
-        if handler:
-            handler(event)
+        event_type = type(event)
+        self.event_counts[event_type] += 1
+        if not self.immediate:
+            self._queue.setdefault(event_type, []).append(event)
+            return
+        handlers = self._handlers.get(event_type)
+        if handlers and event_type not in self._batch_handlers and not _tracer.enabled:
+            # Common case of the immediate dispatch without the list of the events
+            self.dispatch_counts[event_type] += 1
+            for handler in handlers:
+                handler(event)
         else:
-            logging.warning(f"No handler for event type:{event.event_type}")
+            self._dispatch(event_type, [event])
 
+    def flush(self):
+        """Dispatch the queued events, grouped by their type.
 
-class ObservableSprite(arcade.Sprite):
-    """Wrapper to the sprite class to interact with Observers."""
+        Groups are dispatched in the order their first event was raised. Events
+        raised by the handlers are dispatched in the same flush after the current
+        groups.
+        """
+        while self._queue:
+            queue, self._queue = self._queue, {}
+            for event_type, events in queue.items():
+                self._dispatch(event_type, events)
+
+    def _dispatch(self, event_type: Type[Event], events: List[Event]):
+        handlers = self._handlers.get(event_type, ())
+        batch_handlers = self._batch_handlers.get(event_type, ())
+        if not handlers and not batch_handlers:
+            # Warned once per type, unhandled events may be raised every tick
+            if event_type not in self._unhandled_event_types:
+                self._unhandled_event_types.add(event_type)
+                logging.warning("No handler for event type:%s", event_type.__name__)
+            return
+        self.dispatch_counts[event_type] += 1
+        if not _tracer.enabled:
+            self._call_handlers(handlers, batch_handlers, events)
+            return
+        with _tracer.span(event_type.__name__, "event"):
+            self._call_handlers(handlers, batch_handlers, events)
+
+    @staticmethod
+    def _call_handlers(handlers, batch_handlers, events: List[Event]):
+        for batch_handler in batch_handlers:
+            batch_handler(events)
+        for handler in handlers:
+            for event in events:
+                handler(event)
+
+
+class Observable:
+    """Base class for objects other than sprites to interact with Observers.
+
+    Observers subscribe to a single observable, either to every event or only
+    to some event classes, so notifying an event only visits the observers
+    interested in it. The observers are weakly referenced: subscribing does not
+    keep an observer alive, and a released observer is unsubscribed.
+    """
 
-    observers: List[Observer] = []
+    def __init__(self):
+        # Weak references per event class, None for the observers of every event.
+        # Tuples are replaced rather than changed, so an observer can subscribe or
+        # unsubscribe while an event is being notified.
+        self._subscriptions: Dict[
+            Optional[Type[Event]], Tuple[weakref.ref, ...]
+        ] = {}
+
+    @property
+    def observers(self) -> List[Observer]:
+        """Define self.observers, the subscribed observers in subscription order."""
+        observers = []
+        for refs in self._subscriptions.values():
+            for ref in refs:
+                observer = ref()
+                if observer is not None and observer not in observers:
+                    observers.append(observer)
+        return observers
+
+    def add_observer(
+        self, observer: Observer, event_types: Iterable[Type[Event]] = None
+    ):
+        """Subscribe an observer to the events of this object.
 
-    def add_observer(self, observer: Observer):
-        """Add an observer to the list."""
-        self.observers.append(observer)
+        Parameters
+        ----------
+        observer : Observer
+            Observer which is notified, it is weakly referenced.
+        event_types : Iterable[Type[Event]], optional
+            Classes of the events the observer is notified of, every event by
+            default.
+        """
+        ref = weakref.ref(observer, self._discard)
+        for event_type in (None,) if event_types is None else event_types:
+            refs = self._subscriptions.get(event_type, ())
+            if ref not in refs:
+                self._subscriptions[event_type] = refs + (ref,)
 
     def remove_observer(self, observer: Observer):
-        """Remove an observer from the list."""
-        self.observers.remove(observer)
+        """Unsubscribe an observer from every event.
+
+        Raises
+        ------
+        ValueError
+            If the observer is not subscribed.
+        """
+        ref = weakref.ref(observer)
+        if not any(ref in refs for refs in self._subscriptions.values()):
+            raise ValueError(f"{observer!r} is not an observer")
+        self._discard(ref)
+
+    def _discard(self, ref: weakref.ref):
+        # Weak references to the same observer compare equal, also when dead
+        for event_type, refs in list(self._subscriptions.items()):
+            if ref in refs:
+                refs = tuple(other for other in refs if other != ref)
+                if refs:
+                    self._subscriptions[event_type] = refs
+                else:
+                    del self._subscriptions[event_type]
 
     def notify_observers(self, event: Event):
-        """Notify all observers of an event."""
-        for observer in self.observers:
-            observer.on_event(event)
+        """Notify the observers of the event class and of every event."""
+        subscriptions = self._subscriptions
+        for ref in subscriptions.get(type(event), ()):
+            observer = ref()
+            if observer is not None:
+                observer.on_event(event)
+        for ref in subscriptions.get(None, ()):
+            observer = ref()
+            if observer is not None:
+                observer.on_event(event)
+
+
+class ObservableSprite(arcade.Sprite, Observable):
+    """Wrapper to the sprite class to interact with Observers.
+
+    Every sprite has its own observers, see `Observable`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        arcade.Sprite.__init__(self, *args, **kwargs)
+        Observable.__init__(self)
@@ -0,0 +1,65 @@
+from array import array
+from typing import Iterable
+
+import arcade
+
+# Removing a sprite from an arcade.SpriteList costs O(N), so when more sprites
+# than this are removed at once, the survivors are sliced out in a single pass.
+BATCH_REMOVAL_THRESHOLD = 8
+# Versions of arcade whose sprite list internals `remove_many` was written for
+BATCH_REMOVAL_ARCADE_VERSIONS = ("2.6.",)
+BATCH_REMOVAL_SUPPORTED = arcade.version.VERSION.startswith(
+    BATCH_REMOVAL_ARCADE_VERSIONS
+)
+
+
+class BatchSpriteList(arcade.SpriteList):
+    """Sprite list which removes many sprites in a single pass.
+
+    `arcade.SpriteList.remove` searches and shifts the whole list and its index
+    buffer for every sprite, so removing k of N sprites costs O(k * N). Here the
+    survivors are sliced out of the list and of the index buffer at once. Their
+    slots in the vertex buffers do not change, so unlike a rebuild nothing is
+    written again for them.
+
+    This does what `remove` does to the internals of the sprite list, which are
+    private to arcade. It is only used with the arcade versions it was written
+    for, see `BATCH_REMOVAL_ARCADE_VERSIONS`, other versions remove the sprites
+    one by one.
+    """
+
+    def remove_many(self, sprites: Iterable[arcade.Sprite]):
+        """Remove sprites of the list.
+
+        Raises
+        ------
+        ValueError
+            If a sprite is not in the list.
+        """
+        sprites = list(sprites)
+        if not BATCH_REMOVAL_SUPPORTED or len(sprites) <= BATCH_REMOVAL_THRESHOLD:
+            for sprite in sprites:
+                self.remove(sprite)
+            return
+        if any(sprite not in self.sprite_slot for sprite in sprites):
+            raise ValueError("Sprite is not in the SpriteList")
+
+        dead = set(sprites)
+        dead_slots = set()
+        for sprite in dead:
+            dead_slots.add(self.sprite_slot.pop(sprite))
+            sprite.sprite_lists.remove(self)
+            if self.spatial_hash:
+                self.spatial_hash.remove_object(sprite)
+        self.sprite_list = [sprite for sprite in self.sprite_list if sprite not in dead]
+        self._sprite_buffer_free_slots.extend(dead_slots)
+
+        # Draw order is the order of the slots in the index buffer
+        index_data = self._sprite_index_data
+        n_slots = self._sprite_index_slots
+        slots = [slot for slot in index_data[:n_slots] if slot not in dead_slots]
+        index_data[:n_slots] = array(
+            index_data.typecode, slots + [0] * (n_slots - len(slots))
+        )
+        self._sprite_index_slots = len(slots)
+        self._sprite_index_changed = True
@@ -0,0 +1,96 @@
+import unittest
+
+import numpy as np
+
+from omg.structural.entity_store import EntityStore
+
+
+class TestEntityStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = EntityStore(capacity=2)
+
+    def test_create(self):
+        entity = self.store.create(position=(1, 2), health=10)
+
+        self.assertIn(entity, self.store)
+        self.assertEqual(len(self.store), 1)
+        self.assertEqual(self.store.components(entity), {"position", "health"})
+        self.assertEqual(self.store.get(entity, "position").tolist(), [1, 2])
+        self.assertEqual(self.store.get(entity, "health"), 10)
+
+    def test_entities_with_the_same_components_share_an_archetype(self):
+        first = self.store.create(position=(0, 0), velocity=(1, 0))
+        second = self.store.create(velocity=(0, 1), position=(5, 5))
+        self.store.create(position=(0, 0))
+
+        self.assertEqual(len(self.store.archetypes), 2)
+        archetype = self.store.archetype(["position", "velocity"])
+        self.assertEqual(archetype.entities.tolist(), [first, second])
+
+    def test_create_many_grows_the_columns(self):
+        positions = np.arange(10).reshape(5, 2)
+        entities = self.store.create_many(5, position=positions, damage=3)
+
+        archetype = self.store.archetype(["position", "damage"])
+        self.assertEqual(archetype.entities.tolist(), entities.tolist())
+        np.testing.assert_array_equal(archetype.column("position"), positions)
+        np.testing.assert_array_equal(archetype.column("damage"), [3] * 5)
+
+    def test_unknown_component(self):
+        with self.assertRaises(KeyError):
+            self.store.create(position=(0, 0), colour=1)
+
+    def test_set(self):
+        entity = self.store.create(health=10)
+        self.store.set(entity, "health", 4)
+        self.assertEqual(self.store.get(entity, "health"), 4)
+
+    def test_destroy_keeps_the_other_entities(self):
+        entities = self.store.create_many(4, health=[1, 2, 3, 4])
+
+        self.store.destroy_many(entities[[0, 2]])
+
+        self.assertNotIn(entities[0], self.store)
+        self.assertEqual(len(self.store), 2)
+        # Rows are compacted, ids still locate the surviving entities
+        self.assertEqual(self.store.get(entities[1], "health"), 2)
+        self.assertEqual(self.store.get(entities[3], "health"), 4)
+        with self.assertRaises(KeyError):
+            self.store.destroy(entities[0])
+
+    def test_entity_ids_are_not_reused(self):
+        entity = self.store.create(health=1)
+        self.store.destroy(entity)
+        self.assertNotEqual(self.store.create(health=1), entity)
+
+    def test_remove(self):
+        entities = self.store.create_many(3, health=[0, 5, -1])
+        archetype = self.store.archetype(["health"])
+
+        removed = self.store.remove(archetype, archetype.column("health") <= 0)
+
+        self.assertEqual(sorted(removed.tolist()), [entities[0], entities[2]])
+        self.assertEqual(archetype.entities.tolist(), [entities[1]])
+
+    def test_query(self):
+        self.store.create(position=(0, 0), velocity=(1, 1))
+        self.store.create(position=(0, 0), velocity=(1, 1), health=3)
+        self.store.create(position=(0, 0))
+        # Empty archetypes are skipped
+        self.store.archetype(["velocity"])
+
+        moving = list(self.store.query("position", "velocity"))
+        self.assertEqual(
+            [archetype.components for archetype in moving],
+            [{"position", "velocity"}, {"position", "velocity", "health"}],
+        )
+        self.assertEqual(len(list(self.store.query("velocity"))), 2)
+
+        # Query results are updated with the new archetypes
+        self.store.create(velocity=(0, 0), damage=1)
+        self.assertEqual(len(list(self.store.query("velocity"))), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
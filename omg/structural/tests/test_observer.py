@@ -1,14 +1,25 @@
+import gc
 import logging
 import unittest
 from unittest.mock import MagicMock, patch
-from omg.structural.observer import Event, Observer, ObservableSprite
+from omg.structural.observer import Event, Observable, Observer, ObservableSprite
+from omg.utils.tracing import get_trace_recorder
 
 
-class TestEvent(unittest.TestCase):
+class SampleEvent(Event):
+    pass
 
-    def test_event_initialization(self):
-        event = Event("test_event")
-        self.assertEqual(event.event_type, "test_event")
+
+class OtherEvent(Event):
+    pass
+
+
+class FollowUpEvent(Event):
+    pass
+
+
+class UnhandledEvent(Event):
+    pass
 
 
 class TestObserver(unittest.TestCase):
@@ -16,10 +27,10 @@ class TestObserver(unittest.TestCase):
     def test_observer_registration_and_event_handling(self):
         observer = Observer()
         mock_handler = MagicMock()
-        observer.register_handler("test_event", mock_handler)
+        observer.register_handler(SampleEvent, mock_handler)
 
         # Create a mock event
-        event = Event("test_event")
+        event = SampleEvent()
 
         # Handle the event
         observer.on_event(event)
@@ -27,9 +38,21 @@ class TestObserver(unittest.TestCase):
         # Check if the handler was called
         mock_handler.assert_called_once_with(event)
 
+    def test_handlers_are_keyed_by_event_class(self):
+        class DerivedEvent(SampleEvent):
+            pass
+
+        observer = Observer()
+        handler = MagicMock()
+        observer.register_handler(SampleEvent, handler)
+
+        with self.assertLogs(level="WARNING"):
+            observer.on_event(DerivedEvent())
+        handler.assert_not_called()
+
     def test_observer_without_handler(self):
         observer = Observer()
-        event = Event("unhandled_event")
+        event = UnhandledEvent()
 
         # Capture the output using a mock for print
         with self.assertLogs(level="WARNING") as log:
@@ -37,9 +60,83 @@ class TestObserver(unittest.TestCase):
 
         # Verify that "No handler for event type" message is in the logs
         self.assertIn(
-            "WARNING:root:No handler for event type:unhandled_event", log.output[0]
+            "WARNING:root:No handler for event type:UnhandledEvent", log.output[0]
         )
 
+    def test_dispatch_is_traced(self):
+        tracer = get_trace_recorder()
+        tracer.start()
+        self.addCleanup(tracer.stop)
+        observer = Observer()
+        observer.register_handler(SampleEvent, MagicMock())
+
+        observer.on_event(SampleEvent())
+
+        (event,) = tracer.trace_events()
+        self.assertEqual((event["name"], event["cat"]), ("SampleEvent", "event"))
+
+
+class TestDeferredObserver(unittest.TestCase):
+
+    def setUp(self):
+        self.observer = Observer(immediate=False)
+        self.handler = MagicMock()
+        self.observer.register_handler(SampleEvent, self.handler)
+
+    def test_events_are_dispatched_on_flush(self):
+        event = SampleEvent()
+        self.observer.on_event(event)
+        self.handler.assert_not_called()
+        self.assertEqual(self.observer.n_pending, 1)
+
+        self.observer.flush()
+        self.handler.assert_called_once_with(event)
+        self.assertEqual(self.observer.n_pending, 0)
+
+    def test_events_are_grouped_by_type(self):
+        calls = []
+        self.observer.register_handler(OtherEvent, calls.append)
+        self.handler.side_effect = calls.append
+        events = [SampleEvent(), OtherEvent(), SampleEvent()]
+        for event in events:
+            self.observer.on_event(event)
+        self.observer.flush()
+
+        self.assertEqual(calls, [events[0], events[2], events[1]])
+        self.assertEqual(self.observer.event_counts[SampleEvent], 2)
+        self.assertEqual(self.observer.dispatch_counts[SampleEvent], 1)
+
+    def test_batch_and_multiple_handlers(self):
+        batch_handler = MagicMock()
+        second_handler = MagicMock()
+        self.observer.register_batch_handler(SampleEvent, batch_handler)
+        self.observer.register_handler(SampleEvent, second_handler)
+        events = [SampleEvent(), SampleEvent()]
+        for event in events:
+            self.observer.on_event(event)
+        self.observer.flush()
+
+        batch_handler.assert_called_once_with(events)
+        self.assertEqual(self.handler.call_count, 2)
+        self.assertEqual(second_handler.call_count, 2)
+
+    def test_events_raised_by_handlers_are_flushed(self):
+        follow_up = MagicMock()
+        self.observer.register_handler(FollowUpEvent, follow_up)
+        self.handler.side_effect = lambda event: self.observer.on_event(
+            FollowUpEvent()
+        )
+        self.observer.on_event(SampleEvent())
+        self.observer.flush()
+        follow_up.assert_called_once()
+
+    def test_unhandled_event_is_warned_once(self):
+        with self.assertLogs(level="WARNING") as log:
+            for _ in range(3):
+                self.observer.on_event(UnhandledEvent())
+                self.observer.flush()
+        self.assertEqual(len(log.output), 1)
+
 
 class TestObservableSprite(unittest.TestCase):
 
@@ -55,6 +152,91 @@ class TestObservableSprite(unittest.TestCase):
         sprite.remove_observer(observer)
         self.assertNotIn(observer, sprite.observers)
 
+    def test_observers_are_per_instance(self):
+        sprite_1 = ObservableSprite()
+        sprite_2 = ObservableSprite()
+        observer = Observer()
+        sprite_1.add_observer(observer)
+        self.assertEqual(sprite_2.observers, [])
+
+
+class TestObservable(unittest.TestCase):
+
+    def test_observers_are_per_instance(self):
+        observable_1 = Observable()
+        observable_2 = Observable()
+        observer = MagicMock()
+        observable_1.add_observer(observer)
+        self.assertNotIn(observer, observable_2.observers)
+
+        event = SampleEvent()
+        observable_1.notify_observers(event)
+        observer.on_event.assert_called_once_with(event)
+
+        observable_1.remove_observer(observer)
+        self.assertNotIn(observer, observable_1.observers)
+
+    def test_observers_of_event_classes(self):
+        observable = Observable()
+        sample_observer = MagicMock()
+        every_observer = MagicMock()
+        observable.add_observer(sample_observer, [SampleEvent])
+        observable.add_observer(every_observer)
+
+        sample_event = SampleEvent()
+        observable.notify_observers(sample_event)
+        observable.notify_observers(OtherEvent())
+
+        sample_observer.on_event.assert_called_once_with(sample_event)
+        self.assertEqual(every_observer.on_event.call_count, 2)
+
+    def test_observer_is_added_once(self):
+        observable = Observable()
+        observer = MagicMock()
+        observable.add_observer(observer)
+        observable.add_observer(observer)
+
+        observable.notify_observers(SampleEvent())
+
+        observer.on_event.assert_called_once()
+        self.assertEqual(observable.observers, [observer])
+
+    def test_remove_unknown_observer(self):
+        with self.assertRaises(ValueError):
+            Observable().remove_observer(Observer())
+
+    def test_observers_are_weakly_referenced(self):
+        observable = Observable()
+        observer = Observer()
+        observable.add_observer(observer, [SampleEvent])
+        observable.add_observer(observer, [OtherEvent])
+
+        del observer
+        gc.collect()
+
+        self.assertEqual(observable.observers, [])
+        self.assertEqual(observable._subscriptions, {})
+        observable.notify_observers(SampleEvent())
+
+    def test_observer_removed_while_notifying(self):
+        observable = Observable()
+        first, second = MagicMock(), MagicMock()
+
+        def remove_second(event):
+            observable.remove_observer(second)
+            first.on_event.side_effect = None
+
+        first.on_event.side_effect = remove_second
+        observable.add_observer(first)
+        observable.add_observer(second)
+
+        observable.notify_observers(SampleEvent())
+        observable.notify_observers(SampleEvent())
+
+        self.assertEqual(first.on_event.call_count, 2)
+        # Notified of the event during which it was removed
+        second.on_event.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
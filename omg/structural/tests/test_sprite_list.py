@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch
+
+import arcade
+
+from omg.structural.sprite_list import BatchSpriteList
+
+
+class TestBatchSpriteList(unittest.TestCase):
+
+    def setUp(self):
+        self.sprites = [
+            arcade.SpriteSolidColor(10, 10, arcade.color.RED) for _ in range(50)
+        ]
+        self.sprite_list = BatchSpriteList(use_spatial_hash=True)
+        self.sprite_list.extend(self.sprites)
+        self.dead = self.sprites[3::4]
+        self.survivors = [sprite for sprite in self.sprites if sprite not in self.dead]
+
+    def assert_draws_survivors(self):
+        sprite_list = self.sprite_list
+        self.assertEqual(list(sprite_list), self.survivors)
+        # Index buffer draws the slots of the survivors in order
+        n = len(self.survivors)
+        self.assertEqual(sprite_list._sprite_index_slots, n)
+        self.assertEqual(
+            sprite_list._sprite_index_data[:n].tolist(),
+            [sprite_list.sprite_slot[sprite] for sprite in self.survivors],
+        )
+        self.assertTrue(sprite_list._sprite_index_changed)
+        for sprite in self.dead:
+            self.assertEqual(sprite.sprite_lists, [])
+            self.assertNotIn(sprite, sprite_list.sprite_slot)
+
+    def test_remove_many(self):
+        self.sprite_list.remove_many(self.dead)
+
+        self.assert_draws_survivors()
+        one_by_one = arcade.SpriteList()
+        one_by_one.extend(self.sprites)
+        for sprite in self.dead:
+            one_by_one.remove(sprite)
+        self.assertEqual(
+            self.sprite_list._sprite_index_data.tolist(),
+            one_by_one._sprite_index_data.tolist(),
+        )
+        self.assertEqual(
+            sorted(self.sprite_list._sprite_buffer_free_slots),
+            sorted(one_by_one._sprite_buffer_free_slots),
+        )
+        # Freed slots are reused
+        self.sprite_list.append(arcade.SpriteSolidColor(10, 10, arcade.color.RED))
+        self.assertEqual(len(self.sprite_list), len(self.survivors) + 1)
+
+    def test_unsupported_arcade_version_removes_one_by_one(self):
+        with patch("omg.structural.sprite_list.BATCH_REMOVAL_SUPPORTED", False):
+            with patch.object(
+                self.sprite_list, "remove", wraps=self.sprite_list.remove
+            ) as remove:
+                self.sprite_list.remove_many(self.dead)
+
+        self.assertEqual(remove.call_count, len(self.dead))
+        self.assert_draws_survivors()
+
+    def test_missing_sprite(self):
+        with self.assertRaises(ValueError):
+            self.sprite_list.remove_many(self.dead + [arcade.Sprite()])
+        self.assertEqual(list(self.sprite_list), self.sprites)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,534 @@
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import timeit
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import arcade
+import numpy as np
+
+from omg.assets.registry import get_asset_registry
+from omg.core.world import ARCHER_PATH, COIN_IMAGE_PATH, OBSTACLE_IMAGE_PATH
+from omg.entities.events import ProjectileShotEvent
+from omg.entities.items import Pickupable
+from omg.entities.obstacle import Obstacle
+from omg.entities.player import Player
+from omg.entities.projectile import get_crafted_skills
+from omg.entities.projectile_pool import ProjectilePool
+from omg.mechanics.animation import get_animation_library
+from omg.mechanics.animations import Animations
+from omg.mechanics.animator import BatchAnimator
+from omg.mechanics.broadphase import UniformGrid
+from omg.mechanics.collision import (
+    handle_projectile_collisions,
+    handle_projectile_system_collisions,
+)
+from omg.mechanics.physics import PhysicsEngineBoundary
+from omg.mechanics.projectile_system import ProjectileSystem
+from omg.mechanics.systems import damage_system, mana_regen_system, movement_system
+from omg.structural.entity_store import EntityStore
+from omg.structural.observer import Event, Observable, Observer
+
+DEFAULT_COUNTS = (10, 100, 1000, 10000)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.1  # Slowdown ratio reported as a regression
+SPACING = 100  # Average distance between the entities in pixels
+SKILL_NAME = "FireFire"
+N_QUERIED_PROJECTILES = 200  # Projectiles looked up in the obstacle grid
+
+
+class _BenchmarkEvent(Event):
+    pass
+
+
+class _OtherEvent(Event):
+    pass
+
+
+# A benchmark sets up `count` entities and returns a single iteration of the code
+Benchmark = Callable[[int], Callable[[], None]]
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Register a benchmark under a name."""
+
+    def register(setup: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _scatter(sprites: Iterable[arcade.Sprite], count: int, seed: int):
+    """Place sprites uniformly at random, their density does not depend on count."""
+    rng = random.Random(seed)
+    side = SPACING * math.sqrt(count)
+    for sprite in sprites:
+        sprite.position = (rng.uniform(0, side), rng.uniform(0, side))
+
+
+def _obstacles(count: int) -> arcade.SpriteList:
+    texture = get_asset_registry().load_texture(OBSTACLE_IMAGE_PATH)
+    # Obstacles are never destroyed, so every iteration does the same work
+    obstacles = [
+        Obstacle(OBSTACLE_IMAGE_PATH, 0.2, health=math.inf, texture=texture)
+        for _ in range(count)
+    ]
+    _scatter(obstacles, count, seed=1)
+    sprite_list = arcade.SpriteList(use_spatial_hash=True)
+    sprite_list.extend(obstacles)
+    return sprite_list
+
+
+def _player() -> Player:
+    player = Player(name="Hero", animation_file=ARCHER_PATH, scale=1.0)
+    player.current_mana = math.inf
+    return player
+
+
+@benchmark("handle_projectile_collisions.legacy")
+def _handle_projectile_collisions(count: int) -> Callable[[], None]:
+    # Legacy baseline, the world checks a ProjectileSystem instead, see
+    # handle_projectile_system_collisions
+    skill = get_crafted_skills()[SKILL_NAME]
+    texture = get_asset_registry().load_texture(skill["image_file"])
+    # Projectiles in a plain list are not removed when they hit
+    projectiles = [
+        arcade.Sprite(scale=skill["scale"], texture=texture) for _ in range(count)
+    ]
+    _scatter(projectiles, count, seed=2)
+    for projectile in projectiles:
+        projectile.damage = skill["damage"]
+    obstacles = _obstacles(count)
+    broadphase = UniformGrid()
+    return lambda: handle_projectile_collisions(projectiles, obstacles, broadphase)
+
+
+class _ProjectileSystemSetup:
+    """Projectile system with `count` projectiles, refilled after removals."""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.pool = ProjectilePool(get_crafted_skills()[SKILL_NAME])
+        self.positions = _positions(count, seed=2).tolist()
+        self.angles = np.random.default_rng(2).uniform(0, 360, count).tolist()
+        self.system = ProjectileSystem()
+        self.refill()
+
+    def refill(self):
+        """Shoot projectiles again until there are `count` of them."""
+        for i in range(len(self.system), self.count):
+            x, y = self.positions[i]
+            self.system.spawn(self.pool.acquire(x, y, self.angles[i]))
+
+
+@benchmark("ProjectileSystem.update")
+def _projectile_system_update(count: int) -> Callable[[], None]:
+    system = _ProjectileSystemSetup(count).system
+    return lambda: system.update(1 / 60)
+
+
+@benchmark("ProjectileSystem.cull")
+def _projectile_system_cull(count: int) -> Callable[[], None]:
+    # Every iteration a tenth of the projectiles expire and are shot again
+    setup = _ProjectileSystemSetup(count)
+    system = setup.system
+
+    def run():
+        n = len(system)
+        system.lifetime[:n:10] = np.inf
+        system.cull(math.inf)
+        setup.refill()
+
+    return run
+
+
+@benchmark("handle_projectile_system_collisions")
+def _handle_projectile_system_collisions(count: int) -> Callable[[], None]:
+    # Same density as the legacy baseline, the projectiles which hit are removed
+    # and shot again in every iteration
+    setup = _ProjectileSystemSetup(count)
+    obstacles = _obstacles(count)
+    broadphase = UniformGrid()
+
+    def run():
+        handle_projectile_system_collisions(setup.system, obstacles, broadphase)
+        setup.refill()
+
+    return run
+
+
+@benchmark("UniformGrid.touches_occupied_cells")
+def _touches_occupied_cells(count: int) -> Callable[[], None]:
+    # Few projectiles among many obstacles, as in the dense scenario
+    broadphase = UniformGrid()
+    broadphase.update(_obstacles(count))
+    x, y = _positions(N_QUERIED_PROJECTILES, seed=2).T * math.sqrt(
+        count / N_QUERIED_PROJECTILES
+    )
+    radius = 10
+    left, bottom, right, top = x - radius, y - radius, x + radius, y + radius
+    return lambda: broadphase.touches_occupied_cells(left, bottom, right, top)
+
+
+@benchmark("PhysicsEngineBoundary.update")
+def _physics_engine_update(count: int) -> Callable[[], None]:
+    player = _player()
+    obstacles = _obstacles(count)
+    physics_engine = PhysicsEngineBoundary(
+        player_sprite=player,
+        walls=obstacles,
+        boundary_left=-math.inf,
+        boundary_right=math.inf,
+        boundary_up=math.inf,
+        boundary_down=-math.inf,
+    )
+
+    def run():
+        # Back and forth, so the player stays among the obstacles
+        player.change_x = -player.change_x or 1
+        physics_engine.update()
+
+    return run
+
+
+@benchmark("pickup_collisions")
+def _pickup_collisions(count: int) -> Callable[[], None]:
+    player = _player()
+    pickupables = arcade.SpriteList(use_spatial_hash=True)
+    pickupables.extend(
+        Pickupable(COIN_IMAGE_PATH, 0.5, None, 0, 0) for _ in range(count)
+    )
+    _scatter(pickupables, count, seed=3)
+    player.position = pickupables[0].position
+    # Same check as in `World.update`
+    return lambda: arcade.check_for_collision_with_list(
+        player.pickup_sprite, pickupables
+    )
+
+
+@benchmark("Animations.update")
+def _animations_update(count: int) -> Callable[[], None]:
+    animations = [
+        Animations(ARCHER_PATH, None, None, None, None) for _ in range(count)
+    ]
+
+    def run():
+        for animation in animations:
+            animation.update(1 / 60, 1, 0, is_moving=True)
+
+    return run
+
+
+@benchmark("BatchAnimator.advance")
+def _batch_animator_advance(count: int) -> Callable[[], None]:
+    animator = BatchAnimator(get_animation_library(ARCHER_PATH), capacity=count)
+    for _ in range(count):
+        animator.add(arcade.Sprite())
+    return lambda: animator.advance(1 / 60)
+
+
+@benchmark("Observer.on_event")
+def _observer_on_event(count: int) -> Callable[[], None]:
+    observer = Observer()
+    observer.register_handler(_BenchmarkEvent, lambda event: None)
+    events = [_BenchmarkEvent() for _ in range(count)]
+
+    def run():
+        for event in events:
+            observer.on_event(event)
+
+    return run
+
+
+@benchmark("Observer.flush")
+def _observer_flush(count: int) -> Callable[[], None]:
+    # Deferred dispatch as in the world, the events are grouped by their type
+    observer = Observer(immediate=False)
+    observer.register_handler(_BenchmarkEvent, lambda event: None)
+    events = [_BenchmarkEvent() for _ in range(count)]
+
+    def run():
+        for event in events:
+            observer.on_event(event)
+        observer.flush()
+
+    return run
+
+
+@benchmark("Observable.notify_observers")
+def _observable_notify_observers(count: int) -> Callable[[], None]:
+    # A single interested observer among observers of another event
+    observable = Observable()
+    observers = [Observer() for _ in range(count)]
+    for observer in observers[1:]:
+        observable.add_observer(observer, [_OtherEvent])
+    observers[0].register_handler(_BenchmarkEvent, lambda event: None)
+    observable.add_observer(observers[0], [_BenchmarkEvent])
+    event = _BenchmarkEvent()
+
+    # Observers are weakly referenced, the benchmark keeps them alive
+    def run(observers=observers):
+        observable.notify_observers(event)
+
+    return run
+
+
+@benchmark("Player.shoot")
+def _player_shoot(count: int) -> Callable[[], None]:
+    player = _player()
+    observer = Observer()
+    # Shot projectiles go back to their pool, so the pool does not grow
+    observer.register_handler(
+        ProjectileShotEvent, lambda event: event.projectile.release()
+    )
+    player.add_observer(observer)
+
+    # Observers are weakly referenced, the benchmark keeps the observer alive
+    def run(observer=observer):
+        for _ in range(count):
+            player.shoot(SKILL_NAME)
+
+    return run
+
+
+def _positions(count: int, seed: int) -> np.ndarray:
+    """Same density as `_scatter`, for the entity store."""
+    side = SPACING * math.sqrt(count)
+    return np.random.default_rng(seed).uniform(0, side, (count, 2))
+
+
+@benchmark("movement_system")
+def _movement_system(count: int) -> Callable[[], None]:
+    store = EntityStore()
+    store.create_many(
+        count, position=_positions(count, seed=4), velocity=(1, 0), radius=5
+    )
+    return lambda: movement_system(store)
+
+
+@benchmark("mana_regen_system")
+def _mana_regen_system(count: int) -> Callable[[], None]:
+    store = EntityStore()
+    store.create_many(
+        count,
+        mana=0,
+        max_mana=100,
+        mana_regen_rate=5,
+        mana_regen_cooldown=np.linspace(0, 1, count, endpoint=False),
+    )
+    return lambda: mana_regen_system(store, 1 / 60)
+
+
+@benchmark("damage_system")
+def _damage_system(count: int) -> Callable[[], None]:
+    # Counterpart of handle_projectile_collisions, the hit projectiles are
+    # destroyed, so every iteration creates them again
+    store = EntityStore()
+    store.create_many(
+        count, position=_positions(count, seed=1), radius=20, health=math.inf
+    )
+    projectile_positions = _positions(count, seed=2)
+    projectiles = store.archetype(["position", "velocity", "radius", "damage", "owner"])
+
+    def run():
+        store.create_many(
+            count,
+            position=projectile_positions,
+            velocity=(0, 0),
+            radius=10,
+            damage=1,
+            owner=-1,
+        )
+        damage_system(store)
+        store.remove(projectiles, np.ones(projectiles.count, dtype=bool))
+
+    return run
+
+
+def run_benchmark(
+    name: str, count: int, repeat: int = DEFAULT_REPEAT
+) -> Dict[str, object]:
+    """Time a benchmark, the best of `repeat` runs of at least 0.2 s each.
+
+    Returns
+    -------
+    Dict[str, object]
+        Result with the time of a single iteration in seconds.
+    """
+    timer = timeit.Timer(BENCHMARKS[name](count))
+    number, _ = timer.autorange()
+    times = [total / number for total in timer.repeat(repeat, number)]
+    return {
+        "benchmark": name,
+        "count": count,
+        "seconds": min(times),
+        "mean_seconds": sum(times) / len(times),
+        "iterations": number,
+        "repeat": repeat,
+    }
+
+
+def run_benchmarks(
+    names: Iterable[str] = None,
+    counts: Iterable[int] = DEFAULT_COUNTS,
+    repeat: int = DEFAULT_REPEAT,
+    report: Callable[[Dict[str, object]], None] = None,
+) -> Dict[str, object]:
+    """Run the benchmarks for every entity count.
+
+    Parameters
+    ----------
+    names : Iterable[str], optional
+        Benchmarks to run, every registered benchmark by default.
+    counts : Iterable[int]
+        Entity counts.
+    repeat : int
+        Number of timed runs per benchmark and count.
+    report : Callable[[Dict[str, object]], None], optional
+        Called with every result as soon as it is measured.
+
+    Returns
+    -------
+    Dict[str, object]
+        Results and a description of the machine, see `save_results`.
+    """
+    results = []
+    for name in BENCHMARKS if names is None else names:
+        for count in counts:
+            result = run_benchmark(name, count, repeat)
+            results.append(result)
+            if report is not None:
+                report(result)
+    return {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+def save_results(results: Dict[str, object], path: str):
+    """Write benchmark results as JSON."""
+    with open(path, "w") as results_file:
+        json.dump(results, results_file, indent=2)
+
+
+def load_results(path: str) -> Dict[str, object]:
+    """Read benchmark results written by `save_results`."""
+    with open(path) as results_file:
+        return json.load(results_file)
+
+
+def compare_results(
+    baseline: Dict[str, object], results: Dict[str, object]
+) -> List[Tuple[str, int, float, float, float]]:
+    """Compare results with a baseline.
+
+    Returns
+    -------
+    List[Tuple[str, int, float, float, float]]
+        Benchmark, count, baseline and current time in seconds and their ratio,
+        for the benchmarks measured in both.
+    """
+    baseline_seconds = {
+        (result["benchmark"], result["count"]): result["seconds"]
+        for result in baseline["results"]
+    }
+    rows = []
+    for result in results["results"]:
+        key = (result["benchmark"], result["count"])
+        if key in baseline_seconds:
+            before = baseline_seconds[key]
+            rows.append((*key, before, result["seconds"], result["seconds"] / before))
+    return rows
+
+
+def _format_time(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{1e3 * seconds:8.3f} ms"
+    return f"{1e6 * seconds:8.3f} us"
+
+
+def _print_result(result: Dict[str, object]):
+    print(
+        f"{result['benchmark']:<40}{result['count']:>7}"
+        f"  {_format_time(result['seconds'])}"
+    )
+
+
+def _print_comparison(
+    rows: List[Tuple[str, int, float, float, float]], threshold: float
+) -> int:
+    """Print a comparison and return the number of regressions."""
+    n_regressions = 0
+    for name, count, before, after, ratio in rows:
+        regression = ratio > 1 + threshold
+        n_regressions += regression
+        print(
+            f"{name:<40}{count:>7}  {_format_time(before)} -> {_format_time(after)}"
+            f"  {ratio:6.2f}x{'  REGRESSION' if regression else ''}"
+        )
+    return n_regressions
+
+
+def main():
+    """Run the benchmarks or compare stored results."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the simulation hot paths without a window."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument(
+        "--benchmark",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="Benchmark to run, every benchmark by default. Can be repeated.",
+    )
+    run_parser.add_argument("--counts", type=int, nargs="+", default=DEFAULT_COUNTS)
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run_parser.add_argument("--output", help="Write the results to a JSON file.")
+    run_parser.add_argument("--baseline", help="Compare with stored results.")
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare stored results with a baseline."
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    for subparser in (run_parser, compare_parser):
+        subparser.add_argument(
+            "--threshold",
+            type=float,
+            default=DEFAULT_THRESHOLD,
+            help="Slowdown reported as a regression, 0.1 is 10%%.",
+        )
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_benchmarks(
+            args.benchmark, args.counts, args.repeat, report=_print_result
+        )
+        if args.output:
+            save_results(results, args.output)
+            print(f"Results written to {args.output}")
+        baseline_path = args.baseline
+    else:
+        results = load_results(args.results)
+        baseline_path = args.baseline
+    if baseline_path is None:
+        return
+    rows = compare_results(load_results(baseline_path), results)
+    print(f"\nCompared with {baseline_path}:")
+    if _print_comparison(rows, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
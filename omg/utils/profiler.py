@@ -0,0 +1,170 @@
+import time
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from omg.utils.tracing import TraceRecorder, get_trace_recorder
+
+DEFAULT_CAPACITY = 600  # Samples kept per phase, i.e. 10 s at 60 FPS
+PERCENTILES = (50, 95, 99)
+
+
+class RingBuffer:
+    """Fixed-size buffer of the latest samples, the oldest one is overwritten.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of samples kept.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._samples = np.zeros(capacity)
+        self._next = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        """Return the number of kept samples."""
+        return self.count
+
+    @property
+    def capacity(self) -> int:
+        """Define self.capacity, the maximum number of kept samples."""
+        return len(self._samples)
+
+    def append(self, sample: float):
+        """Add a sample, overwriting the oldest one if the buffer is full."""
+        self._samples[self._next] = sample
+        self._next = (self._next + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def values(self) -> np.ndarray:
+        """Return the kept samples from the oldest to the latest."""
+        if self.count < self.capacity:
+            return self._samples[: self.count].copy()
+        return np.roll(self._samples, -self._next)
+
+    def percentiles(self, percentiles: Iterable[float] = PERCENTILES) -> np.ndarray:
+        """Return the percentiles of the kept samples, NaN if there are none."""
+        percentiles = list(percentiles)
+        if self.count == 0:
+            return np.full(len(percentiles), np.nan)
+        return np.percentile(self._samples[: self.count], percentiles)
+
+
+class _PhaseTimer:
+    """Context manager which records its duration to a profiler phase."""
+
+    __slots__ = ("_name", "_buffer", "_tracer", "_start")
+
+    def __init__(self, name: str, buffer: RingBuffer, tracer: TraceRecorder):
+        self._name = name
+        self._buffer = buffer
+        self._tracer = tracer
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self._start
+        self._buffer.append(duration)
+        if self._tracer.enabled:
+            self._tracer.add_span(self._name, self._start, duration)
+        return False
+
+
+class _NullTimer:
+    """Context manager of a disabled profiler, it does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class FrameProfiler:
+    """Times the phases of the game loop, e.g. the physics update.
+
+    The durations of every phase are kept in a `RingBuffer`, so the memory is
+    bounded and the statistics always describe the latest frames. Timers are
+    created once per phase and reused, a disabled profiler returns a shared
+    timer which does nothing.
+
+    The phases are also recorded as spans by the trace recorder while it is
+    enabled, see `omg.utils.tracing`.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of samples kept per phase.
+    enabled : bool
+        Whether the phases are timed.
+    tracer : TraceRecorder, optional
+        Recorder of the phase spans, the recorder of the game by default.
+
+    Examples
+    --------
+    >>> profiler = FrameProfiler()
+    >>> with profiler.phase("physics"):
+    ...     pass
+    >>> len(profiler.samples("physics"))
+    1
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        enabled: bool = True,
+        tracer: TraceRecorder = None,
+    ):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.tracer = get_trace_recorder() if tracer is None else tracer
+        self._buffers: Dict[str, RingBuffer] = {}
+        self._timers: Dict[str, _PhaseTimer] = {}
+
+    @property
+    def phases(self) -> Tuple[str, ...]:
+        """Define self.phases, names of the timed phases in order of appearance."""
+        return tuple(self._buffers)
+
+    def phase(self, name: str):
+        """Return a context manager which times a phase."""
+        if not self.enabled:
+            return _NULL_TIMER
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = self._timers[name] = _PhaseTimer(
+                name, self.samples(name), self.tracer
+            )
+        return timer
+
+    def record(self, name: str, duration: float):
+        """Add the duration of a phase in seconds, e.g. if it was timed elsewhere."""
+        if self.enabled:
+            self.samples(name).append(duration)
+
+    def samples(self, name: str) -> RingBuffer:
+        """Return the buffer of the durations of a phase."""
+        buffer = self._buffers.get(name)
+        if buffer is None:
+            buffer = self._buffers[name] = RingBuffer(self.capacity)
+        return buffer
+
+    def percentiles(
+        self, percentiles: Iterable[float] = PERCENTILES
+    ) -> Dict[str, np.ndarray]:
+        """Return the percentiles of the durations of every phase in seconds."""
+        percentiles = list(percentiles)
+        return {
+            name: buffer.percentiles(percentiles)
+            for name, buffer in self._buffers.items()
+        }
@@ -0,0 +1,156 @@
+import argparse
+import json
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+DEFAULT_MODULE = "omg.core.game_window"
+# Line format of `python -X importtime`: self and cumulative time in microseconds
+_IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+class ImportTime(NamedTuple):
+    """Import time of a single module in seconds."""
+
+    module: str
+    self_time: float
+    cumulative_time: float
+    depth: int  # Nesting level, 0 for the modules imported at the top level
+
+
+def parse_import_times(output: str) -> List[ImportTime]:
+    """Parse the report of `python -X importtime`, in import order."""
+    import_times = []
+    for line in output.splitlines():
+        match = _IMPORT_TIME_PATTERN.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        import_times.append(
+            ImportTime(
+                module=module,
+                self_time=int(self_us) / 1e6,
+                cumulative_time=int(cumulative_us) / 1e6,
+                # The report indents every nesting level by two spaces
+                depth=(len(indent) - 1) // 2,
+            )
+        )
+    return import_times
+
+
+def measure_import_times(module: str = DEFAULT_MODULE) -> List[ImportTime]:
+    """Import a module in a fresh interpreter and return the import times.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If the module cannot be imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_times(result.stderr)
+
+
+def measure_first_draw(timeout: float = 60) -> Optional[Dict[str, float]]:
+    """Launch the game and return the time to its first frames in seconds.
+
+    The times are measured from the launch of the interpreter. The game needs a
+    display, None is returned if it cannot open its window.
+    """
+    launch_time = time.time()
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", __name__, "--first-draw-child", str(launch_time)],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    if result.returncode != 0:
+        return None
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def _run_first_draw(launch_time: float):
+    """Run the game until the game view is drawn, print the times as JSON."""
+    import arcade
+
+    from omg.core import views
+    from omg.core.game_window import GameWindow
+
+    times = {"imports": time.time() - launch_time}
+
+    def record_first_draw(view_class, name, exit_after=False):
+        on_draw = view_class.on_draw
+
+        def wrapper(self):
+            on_draw(self)
+            if name not in times:
+                times[name] = time.time() - launch_time
+                if exit_after:
+                    arcade.exit()
+
+        view_class.on_draw = wrapper
+
+    record_first_draw(views.LoadingView, "loading_view")
+    record_first_draw(views.GameView, "game_view", exit_after=True)
+    window = GameWindow(views.SCREEN_WIDTH, views.SCREEN_HEIGHT, views.SCREEN_TITLE)
+    window.setup()
+    arcade.run()
+    print(json.dumps(times))
+
+
+def main():
+    """Report the import times and the time to the first frame of the game."""
+    parser = argparse.ArgumentParser(description="Measure the startup time.")
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument(
+        "--top", type=int, default=20, help="Number of the slowest modules to show."
+    )
+    parser.add_argument(
+        "--no-window", action="store_true", help="Skip launching the game."
+    )
+    parser.add_argument("--first-draw-child", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.first_draw_child is not None:
+        _run_first_draw(args.first_draw_child)
+        return
+
+    import_times = measure_import_times(args.module)
+    total = sum(
+        import_time.cumulative_time
+        for import_time in import_times
+        if import_time.depth == 0
+    )
+    print(f"Importing {args.module} took {1000 * total:.1f} ms")
+    print(f"{'cumulative':>12} {'self':>8}  module")
+    slowest = sorted(import_times, key=lambda import_time: -import_time.cumulative_time)
+    for import_time in slowest[:args.top]:
+        print(
+            f"{1000 * import_time.cumulative_time:9.1f} ms"
+            f" {1000 * import_time.self_time:5.1f} ms"
+            f"  {'  ' * import_time.depth}{import_time.module}"
+        )
+
+    if args.no_window:
+        return
+    times = measure_first_draw()
+    if times is None:
+        print("Time to the first on_draw: the game could not open a window")
+        return
+    print(
+        f"Time to the first on_draw: {times['loading_view']:.3f} s (loading view), "
+        f"{times['game_view']:.3f} s (game view)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+from omg.utils.benchmark import (
+    BENCHMARKS,
+    compare_results,
+    load_results,
+    run_benchmark,
+    save_results,
+)
+
+
+def make_results(seconds):
+    return {
+        "results": [
+            {"benchmark": name, "count": count, "seconds": value}
+            for (name, count), value in seconds.items()
+        ]
+    }
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_benchmarks_run(self):
+        for name, setup in BENCHMARKS.items():
+            with self.subTest(name):
+                run = setup(10)
+                run()
+                run()
+
+    def test_run_benchmark(self):
+        result = run_benchmark("Observer.on_event", 10, repeat=2)
+        self.assertEqual(result["benchmark"], "Observer.on_event")
+        self.assertEqual(result["count"], 10)
+        self.assertGreater(result["seconds"], 0)
+        self.assertLessEqual(result["seconds"], result["mean_seconds"])
+
+    def test_save_and_load_results(self):
+        results = make_results({("Player.shoot", 10): 1e-5})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "results.json")
+            save_results(results, path)
+            self.assertEqual(load_results(path), results)
+
+    def test_compare_results(self):
+        baseline = make_results(
+            {("Player.shoot", 10): 1e-5, ("Player.shoot", 100): 1e-4}
+        )
+        results = make_results(
+            {("Player.shoot", 10): 2e-5, ("Observer.on_event", 10): 1e-6}
+        )
+        # Only the benchmarks measured in both are compared
+        self.assertEqual(
+            compare_results(baseline, results),
+            [("Player.shoot", 10, 1e-5, 2e-5, 2.0)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
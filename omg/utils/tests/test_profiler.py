@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from omg.utils.profiler import FrameProfiler, RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+
+    def test_append(self):
+        buffer = RingBuffer(capacity=4)
+        for sample in range(3):
+            buffer.append(sample)
+        self.assertEqual(len(buffer), 3)
+        np.testing.assert_array_equal(buffer.values(), [0, 1, 2])
+
+    def test_oldest_samples_are_overwritten(self):
+        buffer = RingBuffer(capacity=4)
+        for sample in range(10):
+            buffer.append(sample)
+        self.assertEqual(len(buffer), 4)
+        np.testing.assert_array_equal(buffer.values(), [6, 7, 8, 9])
+
+    def test_percentiles(self):
+        buffer = RingBuffer(capacity=200)
+        for sample in range(101):
+            buffer.append(sample)
+        np.testing.assert_allclose(buffer.percentiles((50, 95, 99)), [50, 95, 99])
+
+    def test_percentiles_without_samples(self):
+        self.assertTrue(np.isnan(RingBuffer().percentiles((50, 99))).all())
+
+
+class TestFrameProfiler(unittest.TestCase):
+
+    @patch("time.perf_counter")
+    def test_phase(self, perf_counter):
+        perf_counter.side_effect = [1.0, 1.5, 2.0, 2.25]
+        profiler = FrameProfiler()
+        for _ in range(2):
+            with profiler.phase("physics"):
+                pass
+
+        self.assertEqual(profiler.phases, ("physics",))
+        np.testing.assert_array_equal(profiler.samples("physics").values(), [0.5, 0.25])
+
+    def test_phase_timer_is_reused(self):
+        profiler = FrameProfiler()
+        self.assertIs(profiler.phase("physics"), profiler.phase("physics"))
+
+    def test_disabled(self):
+        profiler = FrameProfiler(enabled=False)
+        with profiler.phase("physics"):
+            pass
+        profiler.record("draw", 0.01)
+        self.assertEqual(profiler.phases, ())
+
+    def test_percentiles(self):
+        profiler = FrameProfiler(capacity=10)
+        for _ in range(20):
+            profiler.record("draw", 0.01)
+        percentiles = profiler.percentiles((50, 95, 99))
+        np.testing.assert_allclose(percentiles["draw"], [0.01, 0.01, 0.01])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+import unittest
+
+from omg.utils.startup_benchmark import (
+    ImportTime,
+    measure_import_times,
+    parse_import_times,
+)
+
+IMPORT_TIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       150 |        150 |     omg.structural
+import time:       684 |        834 |   omg.structural.observer
+import time:      1131 |       1965 | omg.core.game_window
+"""
+
+
+class TestStartupBenchmark(unittest.TestCase):
+
+    def test_parse_import_times(self):
+        self.assertEqual(
+            parse_import_times(IMPORT_TIME_OUTPUT),
+            [
+                ImportTime("omg.structural", 150e-6, 150e-6, 2),
+                ImportTime("omg.structural.observer", 684e-6, 834e-6, 1),
+                ImportTime("omg.core.game_window", 1131e-6, 1965e-6, 0),
+            ],
+        )
+
+    def test_measure_import_times(self):
+        modules = [import_time.module for import_time in measure_import_times("json")]
+        self.assertIn("json", modules)
+
+    def test_game_data_is_loaded_on_first_use(self):
+        # A fresh interpreter, the data may be loaded by other tests already
+        code = (
+            "import omg.core.game_window\n"
+            "from omg.entities import elements, projectile\n"
+            "assert elements.get_elements.cache_info().currsize == 0\n"
+            "assert projectile.get_crafted_skills.cache_info().currsize == 0\n"
+            "assert elements.ELEMENTS is elements.get_elements()\n"
+            "assert 'FIRE' in elements.ELEMENTS\n"
+            "assert 'FireFire' in projectile.crafted_skill_dictionary\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_debug_overlay_is_imported_on_first_use(self):
+        code = (
+            "import sys\n"
+            "import omg.core.views\n"
+            "assert 'omg.core.debug_overlay' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from omg.utils.profiler import FrameProfiler
+from omg.utils.tracing import TraceRecorder
+
+
+class TestTraceRecorder(unittest.TestCase):
+
+    def test_disabled(self):
+        recorder = TraceRecorder()
+        with recorder.span("update"):
+            pass
+        recorder.add_span("on_draw", 1.0, 0.01)
+        self.assertEqual(len(recorder), 0)
+
+    @patch("time.perf_counter")
+    def test_span(self, perf_counter):
+        perf_counter.side_effect = [1.0, 1.25]
+        recorder = TraceRecorder(enabled=True)
+        with recorder.span("update", "tick"):
+            pass
+
+        (event,) = recorder.trace_events()
+        self.assertEqual(event["name"], "update")
+        self.assertEqual(event["cat"], "tick")
+        self.assertEqual(event["ph"], "X")
+        self.assertEqual(event["ts"], 1e6)
+        self.assertEqual(event["dur"], 0.25e6)
+
+    def test_oldest_spans_are_overwritten(self):
+        recorder = TraceRecorder(capacity=3, enabled=True)
+        for i in range(5):
+            recorder.add_span(f"span_{i}", i, 0.5)
+        names = [event["name"] for event in recorder.trace_events()]
+        self.assertEqual(names, ["span_2", "span_3", "span_4"])
+
+    def test_start_drops_old_spans(self):
+        recorder = TraceRecorder(enabled=True)
+        recorder.add_span("update", 1.0, 0.01)
+        recorder.stop()
+        recorder.start()
+        self.assertTrue(recorder.enabled)
+        self.assertEqual(len(recorder), 0)
+
+    def test_dump(self):
+        recorder = TraceRecorder(enabled=True)
+        recorder.add_span("update", 1.0, 0.01)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = recorder.dump(os.path.join(temp_dir, "trace.json"))
+            with open(path) as trace_file:
+                trace = json.load(trace_file)
+        self.assertEqual(trace["traceEvents"], recorder.trace_events())
+
+    def test_profiler_phases_are_recorded(self):
+        recorder = TraceRecorder(enabled=True)
+        profiler = FrameProfiler(tracer=recorder)
+        with profiler.phase("physics_engine.update"):
+            pass
+        (event,) = recorder.trace_events()
+        self.assertEqual(event["name"], "physics_engine.update")
+
+
+if __name__ == "__main__":
+    unittest.main()
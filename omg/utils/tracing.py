@@ -0,0 +1,180 @@
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, List
+
+DEFAULT_CAPACITY = 200000  # Spans kept, i.e. minutes of play at 60 FPS
+DEFAULT_CATEGORY = "game"
+# Name of the trace files written by the game, formatted by `time.strftime`
+TRACE_FILE_NAME = "trace-%Y%m%d-%H%M%S.json"
+
+
+class _Span:
+    """Context manager which records its duration as a span."""
+
+    __slots__ = ("_recorder", "_name", "_category", "_start")
+
+    def __init__(self, recorder: "TraceRecorder", name: str, category: str):
+        self._recorder = recorder
+        self._name = name
+        self._category = category
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._recorder.add_span(
+            self._name, self._start, time.perf_counter() - self._start, self._category
+        )
+        return False
+
+
+class _NullSpan:
+    """Context manager of a disabled recorder, it does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class TraceRecorder:
+    """In-memory recorder of timed spans which exports Chrome trace events.
+
+    Spans are kept in preallocated ring buffers, so a long play session keeps the
+    latest `capacity` spans in bounded memory. A disabled recorder hands out a
+    shared span which does nothing, so instrumented code costs a method call.
+
+    The export is the JSON trace event format, it is opened by `chrome://tracing`
+    and https://ui.perfetto.dev.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of spans kept.
+    enabled : bool
+        Whether the spans are recorded.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self._names: List[str] = [""] * capacity
+        self._categories: List[str] = [""] * capacity
+        self._starts: List[float] = [0.0] * capacity
+        self._durations: List[float] = [0.0] * capacity
+        self._threads: List[int] = [0] * capacity
+        self._next = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        """Return the number of kept spans."""
+        return self.count
+
+    def start(self):
+        """Drop the recorded spans and start recording."""
+        self.clear()
+        self.enabled = True
+
+    def stop(self):
+        """Stop recording, the recorded spans are kept."""
+        self.enabled = False
+
+    def span(self, name: str, category: str = DEFAULT_CATEGORY):
+        """Return a context manager which records a span."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category)
+
+    def add_span(
+        self, name: str, start: float, duration: float, category: str = DEFAULT_CATEGORY
+    ):
+        """Record a span which was timed elsewhere.
+
+        Parameters
+        ----------
+        name : str
+            Name of the span.
+        start : float
+            Start time from `time.perf_counter` in seconds.
+        duration : float
+            Duration in seconds.
+        category : str
+            Category of the span, e.g. to filter the spans in the trace viewer.
+        """
+        if not self.enabled:
+            return
+        i = self._next
+        self._names[i] = name
+        self._categories[i] = category
+        self._starts[i] = start
+        self._durations[i] = duration
+        self._threads[i] = threading.get_ident()
+        self._next = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def clear(self):
+        """Drop the recorded spans."""
+        self._next = 0
+        self.count = 0
+
+    def trace_events(self) -> List[Dict]:
+        """Return the kept spans as complete trace events, oldest first."""
+        first = (self._next - self.count) % self.capacity
+        pid = os.getpid()
+        events = []
+        for j in range(self.count):
+            i = (first + j) % self.capacity
+            events.append(
+                {
+                    "name": self._names[i],
+                    "cat": self._categories[i],
+                    "ph": "X",
+                    # Trace events are timed in microseconds
+                    "ts": self._starts[i] * 1e6,
+                    "dur": self._durations[i] * 1e6,
+                    "pid": pid,
+                    "tid": self._threads[i],
+                }
+            )
+        return events
+
+    def dump(self, path: str = None) -> str:
+        """Write the kept spans to a trace file.
+
+        Parameters
+        ----------
+        path : str, optional
+            Path of the trace file, a timestamped file in the working directory
+            by default, see `TRACE_FILE_NAME`.
+
+        Returns
+        -------
+        str
+            Path of the trace file.
+        """
+        if path is None:
+            path = time.strftime(TRACE_FILE_NAME)
+        with open(path, "w") as trace_file:
+            json.dump(
+                {"traceEvents": self.trace_events(), "displayTimeUnit": "ms"},
+                trace_file,
+            )
+        return path
+
+
+@lru_cache(maxsize=None)
+def get_trace_recorder() -> TraceRecorder:
+    """Return the trace recorder of the game, it is disabled until enabled."""
+    return TraceRecorder()